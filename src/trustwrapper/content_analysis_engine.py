@@ -7,13 +7,35 @@ Detects financial advice, medical claims, legal guidance, PII exposure, and comp
 This is the core value proposition - actual problem detection that prevents business incidents.
 """
 
-import re
 import asyncio
-from typing import Dict, List, Set, Optional, Tuple
-from dataclasses import dataclass, field
-from enum import Enum
+import copy
+import hashlib
 import json
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from .result_cache import ResultCache
+
+try:  # Python 3.11+
+    from re import _constants as sre_constants
+    from re import _parser as sre_parse
+except ImportError:
+    import sre_constants
+    import sre_parse
 
 
 class ViolationType(Enum):
@@ -52,6 +74,267 @@ class ContentViolation:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
+@dataclass(frozen=True)
+class DetectionRule:
+    """A single detection pattern and the rule group it reports against"""
+    key: object  # ViolationType for content rules, compliance name for compliance rules
+    pattern: str
+    rule_group: Dict = field(hash=False, compare=False)
+
+
+MAX_GUARD_PREFIXES = 64  # Per-rule cap before falling back to the full pattern
+
+
+def _literal_prefixes(items, prefixes: Set[str]) -> Tuple[Set[str], bool]:
+    """
+    Collect the literal strings every match of a parsed pattern must start with.
+
+    Returns the prefixes found so far and whether the whole sequence was literal.
+    Zero-width assertions are skipped, which only ever weakens the guard.
+    """
+    for op, av in items:
+        if op is sre_constants.LITERAL:
+            prefixes = {prefix + chr(av) for prefix in prefixes}
+        elif op is sre_constants.AT:
+            continue
+        elif op is sre_constants.IN and all(o is sre_constants.LITERAL for o, _ in av):
+            if len(prefixes) * len(av) > MAX_GUARD_PREFIXES:
+                return prefixes, False
+            prefixes = {prefix + chr(c) for prefix in prefixes for _, c in av}
+        elif op is sre_constants.SUBPATTERN:
+            prefixes, complete = _literal_prefixes(av[-1], prefixes)
+            if not complete:
+                return prefixes, False
+        elif op is sre_constants.BRANCH:
+            branch_prefixes: Set[str] = set()
+            complete = True
+            for branch in av[1]:
+                found, branch_complete = _literal_prefixes(branch, prefixes)
+                branch_prefixes |= found
+                complete = complete and branch_complete
+                if len(branch_prefixes) > MAX_GUARD_PREFIXES:
+                    return prefixes, False
+            prefixes = branch_prefixes
+            if not complete:
+                return prefixes, False
+        else:
+            return prefixes, False
+    return prefixes, True
+
+
+def _trie_alternation(words: Set[str]) -> str:
+    """Build a prefix-factored alternation so each position fails on its first character"""
+    trie: Dict[str, Dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node: Dict[str, Dict]) -> str:
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return emit(trie)
+
+
+class CompiledRuleSet:
+    """
+    Detection patterns merged into one alternation automaton.
+
+    Every pattern is wrapped in a named lookahead group, so a single
+    left-to-right scan reports each pattern that matches at each position.
+    Per-pattern results are identical to running ``re.finditer`` once per
+    pattern, but the text is only scanned once regardless of rule count.
+
+    Python's regex engine tries alternatives one by one, so the scan is
+    gated by a prefix-factored trie of the literal text each rule must
+    start with. Positions that cannot start any rule are rejected after a
+    character or two; only rules without a literal prefix are tried in full.
+    Rule patterns are embedded verbatim, so they must not use backreferences
+    or named groups.
+    """
+
+    def __init__(self, rules: List[DetectionRule], flags: int = 0):
+        self.rules = list(rules)
+        self.flags = flags
+        self._automaton = None
+        self._group_numbers: List[int] = []
+        # Longest text any single rule can match (very large if unbounded)
+        self.max_match_width = 0
+
+        if self.rules:
+            parsed = [sre_parse.parse(rule.pattern, flags) for rule in self.rules]
+            self.max_match_width = max(tree.getwidth()[1] for tree in parsed)
+            self._automaton = re.compile(self._build_pattern(parsed), flags)
+            self._group_numbers = [
+                self._automaton.groupindex[f"r{index}"] for index in range(len(self.rules))
+            ]
+
+    def _build_pattern(self, parsed: List) -> str:
+        """Combine the guard and the per-rule capture groups into one pattern"""
+        guard_prefixes: Set[str] = set()
+        unguarded: List[str] = []
+        for rule, tree in zip(self.rules, parsed):
+            prefixes, _ = _literal_prefixes(tree, {""})
+            if "" in prefixes:
+                unguarded.append(f"(?:{rule.pattern})")
+            else:
+                guard_prefixes |= prefixes
+
+        guard_branches = unguarded
+        if guard_prefixes:
+            guard_branches = [_trie_alternation(guard_prefixes)] + unguarded
+
+        captures = "".join(
+            f"(?:(?=(?P<r{index}>{rule.pattern})))?"
+            for index, rule in enumerate(self.rules)
+        )
+        return f"(?={'|'.join(guard_branches)}){captures}"
+
+    def scan(
+        self,
+        text: str,
+        next_start: Optional[List[int]] = None,
+        pos: int = 0,
+        limit: Optional[int] = None,
+    ) -> List[List[Tuple[int, int]]]:
+        """
+        Return match spans for every rule, indexed like ``self.rules``.
+
+        ``next_start`` carries each rule's non-overlap position between calls
+        and is updated in place; only matches starting in ``[pos, limit)`` are
+        reported, which lets incremental callers resume a partially scanned text.
+        """
+        spans: List[List[Tuple[int, int]]] = [[] for _ in self.rules]
+        if self._automaton is None:
+            return spans
+
+        # finditer never reports overlapping matches of the same pattern
+        if next_start is None:
+            next_start = [0] * len(self.rules)
+        for hit in self._automaton.finditer(text, pos):
+            if limit is not None and hit.start() >= limit:
+                break
+            regs = hit.regs
+            for index, group_number in enumerate(self._group_numbers):
+                start, end = regs[group_number]
+                if start >= next_start[index]:
+                    spans[index].append((start, end))
+                    next_start[index] = end if end > start else start + 1
+
+        return spans
+
+
+class IncrementalContentScanner:
+    """
+    Stateful scanner for content that arrives in chunks, e.g. streamed tokens.
+
+    Only a sliding window is retained: the longest possible rule match plus
+    the 50 characters of context either side used for confidence and
+    evidence. A match is reported as soon as the text after it can no longer
+    change its span or confidence, so time-to-block depends on the window
+    size rather than on the length of the response. Results are the same as
+    ``analyze_content`` on the full text, except that matches longer than
+    ``max_match_chars`` (only possible for unbounded PII patterns) are cut off.
+    """
+
+    CONTEXT_CHARS = 50  # Widest confidence/evidence context around a match
+    CONTEXT_EVIDENCE_CHARS = 200  # Document prefix used as context-rule evidence
+
+    def __init__(self, engine: "ContentAnalysisEngine", max_match_chars: int = 256):
+        self.engine = engine
+        # +1 so boundary assertions just past the match are decidable too
+        self.lookahead = min(
+            max(engine.text_rule_set.max_match_width, engine.pii_rule_set.max_match_width),
+            max_match_chars,
+        ) + 1 + self.CONTEXT_CHARS
+        self.violations: List[ContentViolation] = []
+        self.finished = False
+
+        self._buffer = ""
+        self._offset = 0  # Absolute position of _buffer[0]
+        self._decided = 0  # Every match starting before this has been reported
+        self._length = 0
+        self._head = ""
+        self._text_next = [0] * len(engine.text_rule_set.rules)
+        self._pii_next = [0] * len(engine.pii_rule_set.rules)
+        self._context_terms_seen = [set() for _ in engine.context_rules]
+        self._context_reported = [False] * len(engine.context_rules)
+
+    def feed(self, chunk: str) -> List[ContentViolation]:
+        """Add the next chunk and return violations that became decidable"""
+        if self.finished:
+            raise ValueError("Scanner already finished")
+        self._buffer += chunk
+        self._length += len(chunk)
+        if len(self._head) <= self.CONTEXT_EVIDENCE_CHARS:
+            self._head = (self._head + chunk)[:self.CONTEXT_EVIDENCE_CHARS + 1]
+        return self._advance(self._length - self.lookahead)
+
+    def finish(self) -> List[ContentViolation]:
+        """Mark the end of the content and return all remaining violations"""
+        if self.finished:
+            return []
+        self.finished = True
+        return self._advance(self._length)
+
+    def _advance(self, horizon: int) -> List[ContentViolation]:
+        """Report matches starting before ``horizon`` and slide the window"""
+        engine = self.engine
+        buffer, offset = self._buffer, self._offset
+        violations: List[ContentViolation] = []
+
+        if horizon > self._decided:
+            pos, limit = self._decided - offset, horizon - offset
+            text_next = [max(0, n - offset) for n in self._text_next]
+            pii_next = [max(0, n - offset) for n in self._pii_next]
+            text_matches = engine.text_rule_set.scan(buffer.lower(), text_next, pos, limit)
+            pii_matches = engine.pii_rule_set.scan(buffer, pii_next, pos, limit)
+            self._text_next = [n + offset for n in text_next]
+            self._pii_next = [n + offset for n in pii_next]
+            self._decided = horizon
+
+            violations.extend(engine._detect_violation_patterns(buffer, text_matches))
+            violations.extend(engine._detect_pii_exposure(buffer, pii_matches))
+            violations.extend(engine._detect_compliance_violations(buffer, text_matches))
+
+        violations.extend(self._check_context_rules())
+        violations.sort(key=lambda v: (v.risk_level.value, -v.confidence))
+        self.violations.extend(violations)
+
+        # Keep enough text behind the decided point for lookbehind and left context
+        trim = self._decided - self.CONTEXT_CHARS - offset
+        if trim > 0:
+            self._buffer = buffer[trim:]
+            self._offset = offset + trim
+        return violations
+
+    def _check_context_rules(self) -> List[ContentViolation]:
+        """Track context-rule terms across the window; fire once all have been seen"""
+        engine = self.engine
+        if len(self._head) <= self.CONTEXT_EVIDENCE_CHARS and not self.finished:
+            evidence = None  # Evidence depends on whether the text exceeds 200 chars
+        else:
+            evidence = engine._context_evidence(self._head, self._length)
+
+        violations = []
+        for index, (rule, terms) in enumerate(zip(engine.context_rules, engine._context_terms)):
+            if self._context_reported[index]:
+                continue
+            seen = self._context_terms_seen[index]
+            for term_index, term in enumerate(terms):
+                if term_index not in seen and term.search(self._buffer):
+                    seen.add(term_index)
+            if len(seen) == len(terms) and evidence is not None:
+                self._context_reported[index] = True
+                violations.append(engine._build_context_violation(rule, evidence))
+        return violations
+
+
 class ContentAnalysisEngine:
     """
     Core engine for detecting business-critical content violations.
@@ -60,10 +343,72 @@ class ContentAnalysisEngine:
     that cost real money for businesses using AI.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        cache: Optional[ResultCache] = None,
+        enable_cache: bool = True,
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self.cache = (cache or ResultCache()) if enable_cache else None
+        if self.cache is not None:
+            self.cache.register_types(ContentViolation, ViolationType, RiskLevel)
         self.violation_patterns = self._initialize_violation_patterns()
         self.pii_patterns = self._initialize_pii_patterns()
         self.compliance_rules = self._initialize_compliance_rules()
+        self.context_rules = self._initialize_context_rules()
+        self.compile_rules()
+
+    def compile_rules(self):
+        """
+        Build the scan automata from the current pattern tables.
+
+        Content and compliance rules run case-insensitively over lowercased
+        text and share one automaton; PII rules run over the original text.
+        Call again after modifying any of the pattern tables; this also
+        bumps ``rule_set_version`` so cached results from old rules are ignored,
+        and retires the batch worker pool, whose workers hold the old rules.
+        """
+        if self._process_pool is not None:
+            # Chunks already submitted finish on the old workers
+            self._process_pool.shutdown(wait=False)
+            self._process_pool = None
+
+        self.rule_set_version = hashlib.sha256(repr((
+            self.violation_patterns,
+            self.pii_patterns,
+            self.compliance_rules,
+            self.context_rules,
+        )).encode("utf-8")).hexdigest()[:16]
+
+        text_rules = []
+        for violation_type, pattern_groups in self.violation_patterns.items():
+            for pattern_group in pattern_groups:
+                for pattern in pattern_group["patterns"]:
+                    text_rules.append(DetectionRule(violation_type, pattern, pattern_group))
+        self._violation_rule_count = len(text_rules)
+
+        for compliance_type, rules in self.compliance_rules.items():
+            for pattern in rules["patterns"]:
+                text_rules.append(DetectionRule(compliance_type, pattern, rules))
+
+        pii_rules = [
+            DetectionRule(pii_type, pattern, {})
+            for pii_type, patterns in self.pii_patterns.items()
+            for pattern in patterns
+        ]
+
+        self.text_rule_set = CompiledRuleSet(text_rules, re.IGNORECASE)
+        self.pii_rule_set = CompiledRuleSet(pii_rules)
+        self._context_terms = [
+            [re.compile(term, re.IGNORECASE) for term in rule["required_terms"]]
+            for rule in self.context_rules
+        ]
+
+    def create_stream_scanner(self, max_match_chars: int = 256) -> IncrementalContentScanner:
+        """Create a scanner that checks content chunk by chunk as it is generated"""
+        return IncrementalContentScanner(self, max_match_chars)
         
     def _initialize_violation_patterns(self) -> Dict[ViolationType, List[Dict]]:
         """Initialize pattern matching rules for different violation types"""
@@ -211,153 +556,364 @@ class ContentAnalysisEngine:
             }
         }
     
+    def _initialize_context_rules(self) -> List[Dict]:
+        """Initialize document-level rules that fire when all their terms co-occur"""
+        return [
+            # Financial advice + guarantees (especially risky combination)
+            {
+                "required_terms": [
+                    r"invest|stock|crypto|trading",
+                    r"guaranteed|definitely|sure thing|can't lose"
+                ],
+                "violation_type": ViolationType.FINANCIAL_ADVICE,
+                "risk_level": RiskLevel.CRITICAL,
+                "confidence": 0.9,
+                "business_impact": "High-risk financial advice with guarantees - SEC violation likely",
+                "regulatory_risk": "Investment advisor registration required, potential criminal charges",
+                "recommended_action": "Immediately add disclaimers and cease providing specific investment advice"
+            },
+            # Medical advice + specific treatment recommendations
+            {
+                "required_terms": [
+                    r"medical|health|disease|condition",
+                    r"should|must|need to|have to",
+                    r"treatment|medication|doctor|hospital"
+                ],
+                "violation_type": ViolationType.MEDICAL_ADVICE,
+                "risk_level": RiskLevel.CRITICAL,
+                "confidence": 0.85,
+                "business_impact": "Medical advice without license - malpractice liability",
+                "regulatory_risk": "State medical board violations, potential criminal charges",
+                "recommended_action": "Add medical disclaimers and recommend consulting licensed physicians"
+            }
+        ]
+
     async def analyze_content(self, content: str) -> List[ContentViolation]:
         """
         Main analysis function - detects all types of violations in content.
         
         This is the core value - actually catching problems that would cost money.
         """
+        return self.analyze_content_sync(content)
+
+    def analyze_content_sync(self, content: str) -> List[ContentViolation]:
+        """Synchronous analysis used by analyze_content and the batch workers"""
+        if self.cache is None:
+            return self._analyze_uncached(content)
+
+        key = self._cache_key(content, self.rule_set_version)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        violations = self._analyze_uncached(content)
+        self.cache.put(key, copy.deepcopy(violations))
+        return violations
+
+    def _cache_key(self, content: str, rule_set_version: str) -> str:
+        """Cache key on the exact text, since violations quote evidence from it"""
+        return self.cache.make_key(content, rule_set_version, normalize=False)
+
+    def _analyze_uncached(self, content: str) -> List[ContentViolation]:
+        """Run every detector over the content"""
         violations = []
         
+        # Content and compliance rules share one scan of the lowercased text
+        text_matches = self.text_rule_set.scan(content.lower())
+
         # Run all detection methods
-        violations.extend(await self._detect_violation_patterns(content))
-        violations.extend(await self._detect_pii_exposure(content))
-        violations.extend(await self._detect_compliance_violations(content))
-        violations.extend(await self._detect_context_violations(content))
+        violations.extend(self._detect_violation_patterns(content, text_matches))
+        violations.extend(self._detect_pii_exposure(content))
+        violations.extend(self._detect_compliance_violations(content, text_matches))
+        violations.extend(self._detect_context_violations(content))
         
         # Sort by risk level and confidence
         violations.sort(key=lambda v: (v.risk_level.value, -v.confidence))
         
         return violations
     
-    async def _detect_violation_patterns(self, content: str) -> List[ContentViolation]:
+    async def analyze_batch(
+        self, contents: Iterable[str], chunk_size: Optional[int] = None
+    ) -> List[List[ContentViolation]]:
+        """
+        Analyze many documents across a process pool.
+
+        Documents are dispatched to workers in chunks to amortise pickling and
+        IPC overhead. Results are returned in input order, one list per document.
+        """
+        contents = list(contents)
+        results: List[Optional[List[ContentViolation]]] = [None] * len(contents)
+        # Results are cached under the rules the pool was seeded with, even if
+        # compile_rules runs while the batch is in flight
+        rule_set_version = self.rule_set_version
+
+        # Only cache misses are sent to the pool
+        pending = []
+        for index, content in enumerate(contents):
+            if self.cache is not None:
+                cached = self.cache.get(self._cache_key(content, rule_set_version))
+                if cached is not None:
+                    results[index] = copy.deepcopy(cached)
+                    continue
+            pending.append(index)
+        if not pending:
+            return results
+
+        if chunk_size is None:
+            # Same heuristic as multiprocessing.Pool.map: ~4 chunks per worker
+            chunk_size, extra = divmod(len(pending), self.max_workers * 4)
+            chunk_size += 1 if extra else 0
+
+        loop = asyncio.get_running_loop()
+        pool = self._get_process_pool()
+        chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+        chunk_results = await asyncio.gather(*(
+            loop.run_in_executor(pool, _analyze_chunk, [contents[index] for index in chunk])
+            for chunk in chunks
+        ))
+
+        for chunk, chunk_violations in zip(chunks, chunk_results):
+            for index, violations in zip(chunk, chunk_violations):
+                results[index] = violations
+                if self.cache is not None:
+                    key = self._cache_key(contents[index], rule_set_version)
+                    self.cache.put(key, copy.deepcopy(violations))
+
+        return results
+
+    async def analyze_stream(
+        self,
+        contents: AsyncIterable[str],
+        chunk_size: int = 16,
+        linger_seconds: float = 0.05,
+    ) -> AsyncIterator[Tuple[int, List[ContentViolation]]]:
+        """
+        Analyze documents from an async source as they arrive.
+
+        Documents are grouped into chunks of up to ``chunk_size``; a partial
+        chunk is dispatched once the source has been idle for ``linger_seconds``.
+        Yields ``(index, violations)`` pairs, where ``index`` is the document's
+        position in the source, as soon as that document's chunk has finished,
+        so a slow chunk does not hold back later ones. At most two chunks per
+        worker are in flight, so a fast source is throttled to the pool's
+        throughput. Chunks still in flight are cancelled if the consumer stops
+        early or closes the stream.
+        """
+        loop = asyncio.get_running_loop()
+        max_in_flight = self.max_workers * 2
+        source = contents.__aiter__()
+
+        # Future -> source index of the chunk's first document
+        in_flight: Dict[asyncio.Future, int] = {}
+        chunk: List[str] = []
+        chunk_start = 0
+        next_item: Optional[asyncio.Future] = None
+        source_done = False
+
+        def dispatch():
+            nonlocal chunk, chunk_start
+            # Looked up per chunk, so a rule change mid-stream reaches later chunks
+            pool = self._get_process_pool()
+            future = loop.run_in_executor(pool, _analyze_chunk, chunk)
+            in_flight[future] = chunk_start
+            chunk_start += len(chunk)
+            chunk = []
+
+        try:
+            while True:
+                for future in [f for f in in_flight if f.done()]:
+                    start = in_flight.pop(future)
+                    for offset, violations in enumerate(future.result()):
+                        yield start + offset, violations
+
+                if source_done:
+                    if chunk:
+                        dispatch()
+                        continue
+                    if not in_flight:
+                        break
+
+                waiters = set(in_flight)
+                if not source_done and len(in_flight) < max_in_flight:
+                    if next_item is None:
+                        next_item = asyncio.ensure_future(source.__anext__())
+                    waiters.add(next_item)
+
+                done, _ = await asyncio.wait(
+                    waiters,
+                    timeout=linger_seconds if chunk else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    dispatch()  # Source went quiet, don't hold a partial chunk
+                    continue
+
+                if next_item is not None and next_item in done:
+                    try:
+                        chunk.append(next_item.result())
+                    except StopAsyncIteration:
+                        source_done = True
+                    next_item = None
+                    if len(chunk) >= chunk_size:
+                        dispatch()
+        finally:
+            if next_item is not None:
+                next_item.cancel()
+            # Chunks a worker has not started yet are dropped from the pool
+            for future in in_flight:
+                future.cancel()
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Create the worker pool on first use, seeded with this engine's rules"""
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(
+                    self.violation_patterns,
+                    self.pii_patterns,
+                    self.compliance_rules,
+                    self.context_rules,
+                ),
+            )
+        return self._process_pool
+
+    def get_cache_stats(self) -> Dict[str, any]:
+        """Result cache hit/miss counters"""
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, "rule_set_version": self.rule_set_version, **self.cache.get_stats()}
+
+    def close(self):
+        """Shut down the batch worker pool, if one was started"""
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
+
+    def _detect_violation_patterns(
+        self, content: str, text_matches: Optional[List[List[Tuple[int, int]]]] = None
+    ) -> List[ContentViolation]:
         """Detect violations using pattern matching"""
         violations = []
-        content_lower = content.lower()
+        if text_matches is None:
+            text_matches = self.text_rule_set.scan(content.lower())
         
-        for violation_type, pattern_groups in self.violation_patterns.items():
-            for pattern_group in pattern_groups:
-                for pattern in pattern_group["patterns"]:
-                    matches = re.finditer(pattern, content_lower, re.IGNORECASE)
-                    
-                    for match in matches:
-                        evidence = content[max(0, match.start()-20):match.end()+20]
-                        confidence = self._calculate_pattern_confidence(pattern, match, content)
-                        
-                        if confidence > 0.5:  # Only report high-confidence matches
-                            violations.append(ContentViolation(
-                                violation_type=violation_type,
-                                risk_level=pattern_group["risk_level"],
-                                confidence=confidence,
-                                evidence=evidence.strip(),
-                                business_impact=pattern_group["business_impact"],
-                                regulatory_risk=pattern_group["regulatory_risk"],
-                                recommended_action=self._get_recommended_action(violation_type),
-                                detection_patterns=[pattern]
-                            ))
+        rules = self.text_rule_set.rules[:self._violation_rule_count]
+        for rule, spans in zip(rules, text_matches):
+            violation_type, pattern, pattern_group = rule.key, rule.pattern, rule.rule_group
+            for start, end in spans:
+                evidence = content[max(0, start-20):end+20]
+                confidence = self._calculate_pattern_confidence(pattern, start, end, content)
+
+                if confidence > 0.5:  # Only report high-confidence matches
+                    violations.append(ContentViolation(
+                        violation_type=violation_type,
+                        risk_level=pattern_group["risk_level"],
+                        confidence=confidence,
+                        evidence=evidence.strip(),
+                        business_impact=pattern_group["business_impact"],
+                        regulatory_risk=pattern_group["regulatory_risk"],
+                        recommended_action=self._get_recommended_action(violation_type),
+                        detection_patterns=[pattern]
+                    ))
         
         return violations
     
-    async def _detect_pii_exposure(self, content: str) -> List[ContentViolation]:
+    def _detect_pii_exposure(
+        self, content: str, pii_matches: Optional[List[List[Tuple[int, int]]]] = None
+    ) -> List[ContentViolation]:
         """Detect PII exposure that creates privacy compliance risk"""
         violations = []
+        if pii_matches is None:
+            pii_matches = self.pii_rule_set.scan(content)
         
-        for pii_type, patterns in self.pii_patterns.items():
-            for pattern in patterns:
-                matches = re.finditer(pattern, content)
+        for rule, spans in zip(self.pii_rule_set.rules, pii_matches):
+            pii_type, pattern = rule.key, rule.pattern
+            for start, end in spans:
+                # Extract context around the match
+                evidence = content[max(0, start - 30):min(len(content), end + 30)]
+
+                # Calculate confidence based on context
+                confidence = self._calculate_pii_confidence(pii_type, start, end, content)
                 
-                for match in matches:
-                    # Extract context around the match
-                    start = max(0, match.start() - 30)
-                    end = min(len(content), match.end() + 30)
-                    evidence = content[start:end]
-                    
-                    # Calculate confidence based on context
-                    confidence = self._calculate_pii_confidence(pii_type, match, content)
-                    
-                    if confidence > 0.7:  # High threshold for PII to avoid false positives
-                        violations.append(ContentViolation(
-                            violation_type=ViolationType.PII_EXPOSURE,
-                            risk_level=RiskLevel.HIGH,
-                            confidence=confidence,
-                            evidence=evidence.strip(),
-                            business_impact=f"Privacy violation exposing {pii_type.upper()}, GDPR/CCPA fines possible",
-                            regulatory_risk=f"{pii_type.upper()} exposure: €20M GDPR fine or $7,500 CCPA penalty per record",
-                            recommended_action="Immediately redact PII and review data handling procedures",
-                            detection_patterns=[pattern]
-                        ))
+                if confidence > 0.7:  # High threshold for PII to avoid false positives
+                    violations.append(ContentViolation(
+                        violation_type=ViolationType.PII_EXPOSURE,
+                        risk_level=RiskLevel.HIGH,
+                        confidence=confidence,
+                        evidence=evidence.strip(),
+                        business_impact=f"Privacy violation exposing {pii_type.upper()}, GDPR/CCPA fines possible",
+                        regulatory_risk=f"{pii_type.upper()} exposure: €20M GDPR fine or $7,500 CCPA penalty per record",
+                        recommended_action="Immediately redact PII and review data handling procedures",
+                        detection_patterns=[pattern]
+                    ))
         
         return violations
     
-    async def _detect_compliance_violations(self, content: str) -> List[ContentViolation]:
+    def _detect_compliance_violations(
+        self, content: str, text_matches: Optional[List[List[Tuple[int, int]]]] = None
+    ) -> List[ContentViolation]:
         """Detect specific regulatory compliance violations"""
         violations = []
-        content_lower = content.lower()
+        if text_matches is None:
+            text_matches = self.text_rule_set.scan(content.lower())
         
-        for compliance_type, rules in self.compliance_rules.items():
-            for pattern in rules["patterns"]:
-                matches = re.finditer(pattern, content_lower, re.IGNORECASE)
+        violation_map = {
+            "gdpr": ViolationType.GDPR_VIOLATION,
+            "hipaa": ViolationType.HIPAA_VIOLATION,
+            "sox": ViolationType.SOX_VIOLATION
+        }
+
+        offset = self._violation_rule_count
+        compliance_rules = self.text_rule_set.rules[offset:]
+        for rule, spans in zip(compliance_rules, text_matches[offset:]):
+            compliance_type, pattern, rules = rule.key, rule.pattern, rule.rule_group
+            for start, end in spans:
+                evidence = content[max(0, start-25):end+25]
+                confidence = self._calculate_compliance_confidence(compliance_type, start, end, content)
                 
-                for match in matches:
-                    evidence = content[max(0, match.start()-25):match.end()+25]
-                    confidence = self._calculate_compliance_confidence(compliance_type, match, content)
-                    
-                    if confidence > 0.6:
-                        violation_map = {
-                            "gdpr": ViolationType.GDPR_VIOLATION,
-                            "hipaa": ViolationType.HIPAA_VIOLATION,
-                            "sox": ViolationType.SOX_VIOLATION
-                        }
-                        
-                        violations.append(ContentViolation(
-                            violation_type=violation_map[compliance_type],
-                            risk_level=rules["risk_level"],
-                            confidence=confidence,
-                            evidence=evidence.strip(),
-                            business_impact=rules["business_impact"],
-                            regulatory_risk=f"{compliance_type.upper()} violation detected",
-                            recommended_action=f"Review {compliance_type.upper()} compliance procedures immediately",
-                            detection_patterns=[pattern]
-                        ))
+                if confidence > 0.6:
+                    violations.append(ContentViolation(
+                        violation_type=violation_map[compliance_type],
+                        risk_level=rules["risk_level"],
+                        confidence=confidence,
+                        evidence=evidence.strip(),
+                        business_impact=rules["business_impact"],
+                        regulatory_risk=f"{compliance_type.upper()} violation detected",
+                        recommended_action=f"Review {compliance_type.upper()} compliance procedures immediately",
+                        detection_patterns=[pattern]
+                    ))
         
         return violations
     
-    async def _detect_context_violations(self, content: str) -> List[ContentViolation]:
+    def _detect_context_violations(self, content: str) -> List[ContentViolation]:
         """Detect violations based on context and combined patterns"""
         violations = []
+        evidence = self._context_evidence(content, len(content))
         
-        # Financial advice + guarantees (especially risky combination)
-        if (re.search(r"invest|stock|crypto|trading", content, re.IGNORECASE) and 
-            re.search(r"guaranteed|definitely|sure thing|can't lose", content, re.IGNORECASE)):
-            
-            violations.append(ContentViolation(
-                violation_type=ViolationType.FINANCIAL_ADVICE,
-                risk_level=RiskLevel.CRITICAL,
-                confidence=0.9,
-                evidence=content[:200] + "..." if len(content) > 200 else content,
-                business_impact="High-risk financial advice with guarantees - SEC violation likely",
-                regulatory_risk="Investment advisor registration required, potential criminal charges",
-                recommended_action="Immediately add disclaimers and cease providing specific investment advice"
-            ))
-        
-        # Medical advice + specific treatment recommendations
-        if (re.search(r"medical|health|disease|condition", content, re.IGNORECASE) and
-            re.search(r"should|must|need to|have to", content, re.IGNORECASE) and
-            re.search(r"treatment|medication|doctor|hospital", content, re.IGNORECASE)):
-            
-            violations.append(ContentViolation(
-                violation_type=ViolationType.MEDICAL_ADVICE,
-                risk_level=RiskLevel.CRITICAL,
-                confidence=0.85,
-                evidence=content[:200] + "..." if len(content) > 200 else content,
-                business_impact="Medical advice without license - malpractice liability",
-                regulatory_risk="State medical board violations, potential criminal charges",
-                recommended_action="Add medical disclaimers and recommend consulting licensed physicians"
-            ))
+        for rule, terms in zip(self.context_rules, self._context_terms):
+            if all(term.search(content) for term in terms):
+                violations.append(self._build_context_violation(rule, evidence))
         
         return violations
     
-    def _calculate_pattern_confidence(self, pattern: str, match: re.Match, content: str) -> float:
+    def _context_evidence(self, content: str, content_length: int) -> str:
+        """Document prefix reported as evidence for context rules"""
+        return content[:200] + "..." if content_length > 200 else content
+
+    def _build_context_violation(self, rule: Dict, evidence: str) -> ContentViolation:
+        """Create the violation reported by a context rule"""
+        return ContentViolation(
+            violation_type=rule["violation_type"],
+            risk_level=rule["risk_level"],
+            confidence=rule["confidence"],
+            evidence=evidence,
+            business_impact=rule["business_impact"],
+            regulatory_risk=rule["regulatory_risk"],
+            recommended_action=rule["recommended_action"]
+        )
+
+    def _calculate_pattern_confidence(self, pattern: str, start: int, end: int, content: str) -> float:
         """Calculate confidence score for pattern matches"""
         base_confidence = 0.7
         
@@ -366,8 +922,8 @@ class ContentAnalysisEngine:
             base_confidence += 0.2
         
         # Decrease confidence if in a question context
-        match_start = max(0, match.start() - 50)
-        context = content[match_start:match.end() + 50].lower()
+        match_start = max(0, start - 50)
+        context = content[match_start:end + 50].lower()
         
         if "?" in context or "what if" in context or "hypothetically" in context:
             base_confidence -= 0.3
@@ -378,13 +934,13 @@ class ContentAnalysisEngine:
         
         return min(1.0, max(0.0, base_confidence))
     
-    def _calculate_pii_confidence(self, pii_type: str, match: re.Match, content: str) -> float:
+    def _calculate_pii_confidence(self, pii_type: str, start: int, end: int, content: str) -> float:
         """Calculate confidence for PII detection"""
         base_confidence = 0.8
         
         # Check if it's in a realistic context
-        match_start = max(0, match.start() - 30)
-        context = content[match_start:match.end() + 30].lower()
+        match_start = max(0, start - 30)
+        context = content[match_start:end + 30].lower()
         
         # Higher confidence if associated with identifying information
         if any(word in context for word in ["patient", "customer", "record", "ssn", "social security"]):
@@ -396,13 +952,13 @@ class ContentAnalysisEngine:
         
         return min(1.0, max(0.0, base_confidence))
     
-    def _calculate_compliance_confidence(self, compliance_type: str, match: re.Match, content: str) -> float:
+    def _calculate_compliance_confidence(self, compliance_type: str, start: int, end: int, content: str) -> float:
         """Calculate confidence for compliance violations"""
         base_confidence = 0.7
         
         # Context analysis
-        match_start = max(0, match.start() - 40)
-        context = content[match_start:match.end() + 40].lower()
+        match_start = max(0, start - 40)
+        context = content[match_start:end + 40].lower()
         
         # Higher confidence for explicit compliance topics
         compliance_keywords = {
@@ -475,4 +1031,27 @@ class ContentAnalysisEngine:
             "immediate_action_required": critical_count > 0 or high_count > 1,
             "top_violation_types": [v.violation_type.value for v in violations[:3]],
             "compliance_risks": list(set([v.regulatory_risk for v in violations if v.regulatory_risk]))
-        }
\ No newline at end of file
+        }
+
+
+# Per-process engine used by the batch and stream workers
+_worker_engine: Optional[ContentAnalysisEngine] = None
+
+
+def _init_worker(
+    violation_patterns: Dict, pii_patterns: Dict, compliance_rules: Dict, context_rules: List[Dict]
+):
+    """Build the worker's engine from the parent engine's pattern tables"""
+    global _worker_engine
+    engine = ContentAnalysisEngine(max_workers=1, enable_cache=False)
+    engine.violation_patterns = violation_patterns
+    engine.pii_patterns = pii_patterns
+    engine.compliance_rules = compliance_rules
+    engine.context_rules = context_rules
+    engine.compile_rules()
+    _worker_engine = engine
+
+
+def _analyze_chunk(contents: List[str]) -> List[List[ContentViolation]]:
+    """Analyze one dispatched chunk inside a worker process"""
+    return [_worker_engine.analyze_content_sync(content) for content in contents]
@@ -0,0 +1,252 @@
+"""
+TrustWrapper Result Cache
+
+Content-addressed cache for analysis results.
+
+Templated answers and retried prompts produce the same text over and over;
+caching by a hash of the normalised text lets repeat screens skip the work.
+"""
+
+import dataclasses
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+
+def normalize_text(text: str) -> str:
+    """
+    Default key normalisation: Unicode NFC, unified line endings, outer
+    whitespace stripped. Inner whitespace is kept because detection rules
+    treat newlines and spacing as significant.
+    """
+    return unicodedata.normalize("NFC", text).replace("\r\n", "\n").strip()
+
+
+class ResultCache:
+    """
+    LRU/TTL cache keyed by SHA-256 of normalised text plus a version string.
+
+    The version identifies the rule set or detector configuration that
+    produced a result, so changing rules never serves stale verdicts. An
+    optional SQLite file acts as a second tier that survives restarts and
+    can be shared by worker processes on the same host.
+
+    Disk entries are JSON. Dataclasses and enums are written with their
+    type name and read back only if the type is registered via
+    ``value_types`` or ``register_types``, so whoever can write the file can
+    at worst plant wrong results, never run code. Tuples read back as
+    lists; values JSON cannot represent stay in the memory tier only.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: Optional[float] = None,
+        disk_path: Optional[str] = None,
+        max_disk_entries: int = 1000000,
+        normalizer: Callable[[str], str] = normalize_text,
+        value_types: Iterable[type] = (),
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.disk_path = disk_path
+        self.max_disk_entries = max_disk_entries
+        self.normalizer = normalizer
+
+        self._entries: OrderedDict[str, Tuple[Optional[float], Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk: Optional[sqlite3.Connection] = None
+        self._disk_writes = 0
+        self._value_types: Dict[str, type] = {}
+        self.register_types(*value_types)
+
+        # Counters
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if disk_path:
+            self._disk = sqlite3.connect(disk_path, check_same_thread=False)
+            self._disk.execute(
+                "CREATE TABLE IF NOT EXISTS results "
+                "(key TEXT PRIMARY KEY, expires_at REAL, stored_at REAL, value BLOB)"
+            )
+            self._disk.commit()
+
+    def register_types(self, *types: type):
+        """Allow dataclass and enum types to be read back from the disk tier"""
+        for value_type in types:
+            self._value_types[_type_name(value_type)] = value_type
+
+    def make_key(self, text: str, version: str = "", normalize: bool = True) -> str:
+        """
+        Hash text together with the producing rule-set version.
+
+        Pass ``normalize=False`` when the cached value depends on the exact
+        text, e.g. results that quote evidence or carry offsets into it.
+        """
+        if normalize:
+            text = self.normalizer(text)
+        digest = hashlib.sha256()
+        digest.update(version.encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8"))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key, or None on a miss"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at is None or expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+
+            if self._disk is not None:
+                row = self._disk.execute(
+                    "SELECT expires_at, value FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and (row[0] is None or row[0] > now):
+                    try:
+                        value = self._decode(row[1])
+                    except (ValueError, TypeError):
+                        value = None  # Unreadable or unregistered: a miss
+                    if value is not None:
+                        self._store_memory(key, row[0], value)
+                        self.hits += 1
+                        self.disk_hits += 1
+                        return value
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any):
+        """Store a value in memory and, if configured, on disk"""
+        expires_at = time.time() + self.ttl_seconds if self.ttl_seconds else None
+        with self._lock:
+            self._store_memory(key, expires_at, value)
+
+            if self._disk is not None:
+                try:
+                    encoded = self._encode(value)
+                except (TypeError, ValueError):
+                    return  # Not representable as JSON; memory tier only
+                self._disk.execute(
+                    "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                    (key, expires_at, time.time(), encoded),
+                )
+                self._disk.commit()
+                self._disk_writes += 1
+                if self._disk_writes % 1000 == 0:
+                    self._prune_disk()
+
+    def clear(self):
+        """Drop every cached entry, including the disk tier"""
+        with self._lock:
+            self._entries.clear()
+            if self._disk is not None:
+                self._disk.execute("DELETE FROM results")
+                self._disk.commit()
+
+    def close(self):
+        """Close the disk tier"""
+        with self._lock:
+            if self._disk is not None:
+                self._disk.close()
+                self._disk = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "disk_enabled": self._disk is not None,
+        }
+
+    def _encode(self, value: Any) -> str:
+        """Serialise a value for the disk tier"""
+        return json.dumps(value, default=_encode_object, separators=(",", ":"))
+
+    def _decode(self, data: Any) -> Any:
+        """Rebuild a disk tier value, constructing only registered types"""
+        if isinstance(data, bytes):
+            data = data.decode("utf-8")
+        return json.loads(data, object_hook=self._decode_object)
+
+    def _decode_object(self, obj: Dict[str, Any]) -> Any:
+        """JSON object hook restoring tagged dataclasses, enums and datetimes"""
+        if "__datetime__" in obj:
+            return datetime.fromisoformat(obj["__datetime__"])
+        for tag in ("__enum__", "__dataclass__"):
+            if tag in obj:
+                value_type = self._value_types.get(obj[tag])
+                if value_type is None:
+                    raise TypeError(f"Unregistered cached type {obj[tag]}")
+                if tag == "__enum__":
+                    return value_type(obj["value"])
+                instance = object.__new__(value_type)
+                for name, field_value in obj["fields"].items():
+                    object.__setattr__(instance, name, field_value)
+                return instance
+        return obj
+
+    def _store_memory(self, key: str, expires_at: Optional[float], value: Any):
+        """Insert into the LRU tier, evicting the least recently used entries"""
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _prune_disk(self):
+        """Remove expired rows and keep the disk tier under its size bound"""
+        self._disk.execute(
+            "DELETE FROM results WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),),
+        )
+        self._disk.execute(
+            "DELETE FROM results WHERE key IN (SELECT key FROM results "
+            "ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,),
+        )
+        self._disk.commit()
+
+
+def _type_name(value_type: type) -> str:
+    """Name a type is stored under in the disk tier"""
+    return f"{value_type.__module__}.{value_type.__qualname__}"
+
+
+def _encode_object(value: Any) -> Any:
+    """JSON fallback tagging dataclasses, enums and datetimes with their type"""
+    if isinstance(value, Enum):
+        return {"__enum__": _type_name(type(value)), "value": value.value}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "__dataclass__": _type_name(type(value)),
+            "fields": {
+                field.name: getattr(value, field.name)
+                for field in dataclasses.fields(value)
+            },
+        }
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    raise TypeError(f"Cannot store {type(value).__name__} in the disk tier")
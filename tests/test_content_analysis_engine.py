@@ -0,0 +1,380 @@
+"""
+Content Analysis Engine Tests
+
+Checks that the compiled single-pass matcher reports exactly what a
+per-pattern ``re.finditer`` scan reports, and that the batch and stream
+APIs, and the incremental stream scanner, agree with one-document analysis.
+"""
+
+import asyncio
+import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from trustwrapper import content_analysis_engine
+from trustwrapper.content_analysis_engine import (
+    CompiledRuleSet,
+    ContentAnalysisEngine,
+    DetectionRule,
+    ViolationType,
+)
+from trustwrapper.result_cache import ResultCache
+
+CORPUS = [
+    "You should buy this stock now, it is a guaranteed return and a sure bet!",
+    "Is this financial advice? Hypothetically, you should invest in these coins.",
+    "Patient name: John Doe, SSN 123-45-6789, phone (555) 123-4567, card 4111 1111 1111 1111.",
+    "We collect and store personal data and share data with third-party partners.",
+    "You should stop taking your medication; natural cure for diabetes works 100% guaranteed.",
+    "Contact jane.doe@example.com or call 555-867-5309 at 42 Main Street today.",
+    "Revenue forecast: earnings guarantee. Inside information about the stock trading desk.",
+    "sure sure thing thing, guaranteed guaranteed money money",
+    "",
+    "aaaa abab quuux 123456789 1234567890 bbb",
+]
+
+# Overlapping alternatives, prefix-less patterns, zero-width matches,
+# lookbehind and boundary assertions
+EXTRA_PATTERNS = [
+    r"aa",
+    r"a+",
+    r"(?:ab|a)b?",
+    r"b*",
+    r"[a-c]{2}",
+    r"\d+",
+    r"\d{3}",
+    r"(?<=q)u+",
+    r"\bq\w*",
+    r"sure.{0,10}(thing|bet)",
+    r"(?:sure|su)re?",
+    r"\s",
+]
+
+
+def _finditer_spans(rules, text, flags=0):
+    return [[m.span() for m in re.finditer(rule.pattern, text, flags)] for rule in rules]
+
+
+def _random_corpus(seed=7, count=200):
+    rng = random.Random(seed)  # noqa: S311 - reproducible test corpus
+    alphabet = "aabbq u1234-sure thing"
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 60))) for _ in range(count)]
+
+
+def _violation_keys(violations):
+    return sorted(
+        (v.violation_type.value, v.evidence, v.confidence, tuple(v.detection_patterns))
+        for v in violations
+    )
+
+
+class TestCompiledRuleSet:
+    def test_spans_match_per_pattern_finditer(self):
+        rules = [DetectionRule(index, pattern, {}) for index, pattern in enumerate(EXTRA_PATTERNS)]
+        rule_set = CompiledRuleSet(rules)
+
+        for text in CORPUS + _random_corpus():
+            assert rule_set.scan(text) == _finditer_spans(rules, text), text
+
+    def test_engine_rule_spans_match_per_pattern_finditer(self):
+        engine = ContentAnalysisEngine(max_workers=1, enable_cache=False)
+
+        for text in CORPUS + _random_corpus():
+            lowered = text.lower()
+            assert engine.text_rule_set.scan(lowered) == _finditer_spans(
+                engine.text_rule_set.rules, lowered, re.IGNORECASE
+            )
+            assert engine.pii_rule_set.scan(text) == _finditer_spans(
+                engine.pii_rule_set.rules, text
+            )
+
+    def test_violations_match_per_pattern_scan(self):
+        engine = ContentAnalysisEngine(max_workers=1, enable_cache=False)
+        reported = 0
+
+        for text in CORPUS:
+            text_matches = _finditer_spans(
+                engine.text_rule_set.rules, text.lower(), re.IGNORECASE
+            )
+            pii_matches = _finditer_spans(engine.pii_rule_set.rules, text)
+            expected = (
+                engine._detect_violation_patterns(text, text_matches)
+                + engine._detect_pii_exposure(text, pii_matches)
+                + engine._detect_compliance_violations(text, text_matches)
+                + engine._detect_context_violations(text)
+            )
+
+            violations = engine.analyze_content_sync(text)
+            assert _violation_keys(violations) == _violation_keys(expected)
+            reported += len(violations)
+
+        assert reported > 0
+
+    def test_empty_rule_set(self):
+        rule_set = CompiledRuleSet([])
+        assert rule_set.scan("anything") == []
+        assert rule_set.max_match_width == 0
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+class TestBatchAnalysis:
+    def test_batch_and_stream_match_analyze_content(self):
+        engine = ContentAnalysisEngine(max_workers=2, enable_cache=False)
+        documents = CORPUS * 3
+
+        async def run():
+            expected = [await engine.analyze_content(text) for text in documents]
+            batch = await engine.analyze_batch(documents, chunk_size=4)
+            streamed = [
+                item async for item in engine.analyze_stream(_aiter(documents), chunk_size=4)
+            ]
+            return expected, batch, streamed
+
+        try:
+            expected, batch, streamed = asyncio.run(run())
+        finally:
+            engine.close()
+
+        expected_keys = [_violation_keys(violations) for violations in expected]
+        assert [_violation_keys(violations) for violations in batch] == expected_keys
+        assert sorted(index for index, _ in streamed) == list(range(len(documents)))
+        assert [_violation_keys(violations) for _, violations in sorted(streamed)] == expected_keys
+
+    def test_rule_change_reaches_batch_workers(self):
+        engine = ContentAnalysisEngine(max_workers=1)
+        text = "Our quarterly widget numbers look fine."
+
+        async def run():
+            before = await engine.analyze_batch([text])
+            engine.violation_patterns[ViolationType.MISINFORMATION][0]["patterns"].append(
+                r"widget numbers"
+            )
+            engine.compile_rules()
+            after = await engine.analyze_batch([text])
+            return before, after
+
+        try:
+            before, after = asyncio.run(run())
+        finally:
+            engine.close()
+
+        assert before == [[]]
+        assert [v.violation_type for v in after[0]] == [ViolationType.MISINFORMATION]
+        # The new result is cached under the new rules only
+        assert engine.analyze_content_sync(text)[0].evidence == after[0][0].evidence
+
+    def test_stream_bounds_chunks_in_flight(self, monkeypatch):
+        engine = ContentAnalysisEngine(max_workers=1, enable_cache=False)
+        lock = threading.Lock()
+        running = 0
+        max_running = 0
+
+        def slow_chunk(contents):
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return [[] for _ in contents]
+
+        # Threads instead of processes so the chunk function can be observed
+        executor = ThreadPoolExecutor(max_workers=8)
+        monkeypatch.setattr(content_analysis_engine, "_analyze_chunk", slow_chunk)
+        monkeypatch.setattr(engine, "_get_process_pool", lambda: executor)
+
+        async def run():
+            return [
+                item
+                async for item in engine.analyze_stream(_aiter(range(40)), chunk_size=1)
+            ]
+
+        try:
+            results = asyncio.run(run())
+        finally:
+            executor.shutdown()
+
+        assert len(results) == 40
+        assert max_running == engine.max_workers * 2
+
+
+    def test_stream_yields_chunks_as_they_finish(self, monkeypatch):
+        engine = ContentAnalysisEngine(max_workers=2, enable_cache=False)
+        release_first = threading.Event()
+
+        def chunk_results(contents):
+            if contents[0] == "slow":
+                release_first.wait(timeout=5)
+            return [[content] for content in contents]
+
+        executor = ThreadPoolExecutor(max_workers=4)
+        monkeypatch.setattr(content_analysis_engine, "_analyze_chunk", chunk_results)
+        monkeypatch.setattr(engine, "_get_process_pool", lambda: executor)
+
+        async def run():
+            results = []
+            async for index, violations in engine.analyze_stream(
+                _aiter(["slow", "fast 1", "fast 2"]), chunk_size=1
+            ):
+                results.append((index, violations))
+                if index == 2:
+                    release_first.set()
+            return results
+
+        try:
+            results = asyncio.run(run())
+        finally:
+            release_first.set()
+            executor.shutdown()
+
+        # The slow first document does not hold back the later ones
+        assert results == [(1, ["fast 1"]), (2, ["fast 2"]), (0, ["slow"])]
+
+    def test_closing_stream_cancels_queued_chunks(self, monkeypatch):
+        engine = ContentAnalysisEngine(max_workers=2, enable_cache=False)
+        window_full = threading.Event()
+        release = threading.Event()
+        started = []
+        submitted = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                future = super().submit(fn, *args, **kwargs)
+                submitted.append(future)
+                if len(submitted) == engine.max_workers * 2:
+                    window_full.set()
+                return future
+
+        def chunk_results(contents):
+            started.append(contents[0])
+            # The first chunk finishes once every in-flight slot is taken,
+            # the rest block until the test ends
+            (window_full if contents[0] == 0 else release).wait(timeout=5)
+            return [[] for _ in contents]
+
+        # One thread, so chunks after the running one wait in the executor queue
+        executor = RecordingExecutor(max_workers=1)
+        monkeypatch.setattr(content_analysis_engine, "_analyze_chunk", chunk_results)
+        monkeypatch.setattr(engine, "_get_process_pool", lambda: executor)
+
+        async def run():
+            stream = engine.analyze_stream(_aiter(range(10)), chunk_size=1)
+            first = await stream.__anext__()
+            await stream.aclose()
+            return first
+
+        try:
+            first = asyncio.run(run())
+        finally:
+            release.set()
+            executor.shutdown()
+
+        assert first == (0, [])
+        # The running chunk finishes, the queued ones never start
+        assert started == [0, 1]
+        assert [future.cancelled() for future in submitted] == [False, False, True, True]
+
+
+class TestIncrementalContentScanner:
+    def _scan_in_chunks(self, engine, text, size):
+        scanner = engine.create_stream_scanner()
+        reported = []
+        for start in range(0, len(text), size):
+            reported.extend(scanner.feed(text[start:start + size]))
+        reported.extend(scanner.finish())
+        assert reported == scanner.violations
+        return reported
+
+    def test_chunked_input_matches_one_shot_analysis(self):
+        engine = ContentAnalysisEngine(max_workers=1, enable_cache=False)
+        # Long enough that the scanner's window slides several times
+        long_text = " Some filler text between findings. ".join(CORPUS * 4)
+
+        for text in CORPUS + [long_text]:
+            expected = _violation_keys(engine.analyze_content_sync(text))
+            # Small sizes put chunk boundaries inside nearly every match
+            for size in (1, 3, 7, 64, len(text) or 1):
+                assert _violation_keys(self._scan_in_chunks(engine, text, size)) == expected
+
+    def test_violations_reported_before_end_of_stream(self):
+        engine = ContentAnalysisEngine(max_workers=1, enable_cache=False)
+        scanner = engine.create_stream_scanner()
+
+        early = scanner.feed("Insider trading tip: you should buy this stock. ")
+        early += scanner.feed("Nothing else of note in this part of the answer. " * 20)
+
+        assert any(v.violation_type == ViolationType.FINANCIAL_ADVICE for v in early)
+        assert not scanner.finished
+
+    def test_match_width_is_computed_once(self, monkeypatch):
+        engine = ContentAnalysisEngine(max_workers=1, enable_cache=False)
+        assert engine.text_rule_set.max_match_width > 0
+
+        def no_reparse(*args, **kwargs):
+            raise AssertionError("rules re-parsed when creating a scanner")
+
+        monkeypatch.setattr(content_analysis_engine.sre_parse, "parse", no_reparse)
+        for _ in range(3):
+            engine.create_stream_scanner()
+
+
+class TestResultCaching:
+    TEXT = "You should buy this stock, it is a guaranteed return."
+
+    def test_cache_hits_return_independent_copies(self):
+        engine = ContentAnalysisEngine(max_workers=1)
+        first = engine.analyze_content_sync(self.TEXT)
+        first[0].evidence = "tampered"
+        first.clear()
+
+        second = engine.analyze_content_sync(self.TEXT)
+        second[0].confidence = 0.0
+        third = engine.analyze_content_sync(self.TEXT)
+
+        assert engine.get_cache_stats()["hits"] == 2
+        assert third and "tampered" not in [v.evidence for v in third]
+        assert 0.0 not in [v.confidence for v in third]
+
+    def test_batch_cache_hits_return_independent_copies(self):
+        engine = ContentAnalysisEngine(max_workers=1)
+        engine.analyze_content_sync(self.TEXT)
+
+        first = asyncio.run(engine.analyze_batch([self.TEXT]))[0]
+        first[0].evidence = "tampered"
+        second = asyncio.run(engine.analyze_batch([self.TEXT]))[0]
+
+        assert "tampered" not in [v.evidence for v in second]
+
+    def test_disk_cache_restores_violations(self, tmp_path):
+        path = str(tmp_path / "results.db")
+        engine = ContentAnalysisEngine(max_workers=1, cache=ResultCache(disk_path=path))
+        expected = engine.analyze_content_sync(self.TEXT)
+        engine.cache.close()
+
+        restarted = ContentAnalysisEngine(
+            max_workers=1, cache=ResultCache(disk_path=path)
+        )
+        restored = restarted.analyze_content_sync(self.TEXT)
+        restarted.cache.close()
+
+        assert restarted.get_cache_stats()["disk_hits"] == 1
+        assert restored == expected
+
+    def test_differently_formatted_text_is_analysed_separately(self):
+        engine = ContentAnalysisEngine(max_workers=1)
+        engine.analyze_content_sync(self.TEXT)
+        variant = "\r\n  " + self.TEXT + "  "
+
+        violations = engine.analyze_content_sync(variant)
+
+        assert engine.get_cache_stats()["hits"] == 0
+        assert _violation_keys(violations) == _violation_keys(
+            engine._analyze_uncached(variant)
+        )
@@ -0,0 +1,174 @@
+"""
+Result Cache Tests
+
+Covers the LRU and TTL memory tier, the SQLite disk tier, key versioning
+and normalisation.
+"""
+
+import pickle
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import Enum
+
+from trustwrapper import result_cache
+from trustwrapper.result_cache import ResultCache
+
+
+class Colour(Enum):
+    RED = "red"
+
+
+@dataclass
+class Finding:
+    colour: Colour
+    seen_at: datetime
+    tags: list = field(default_factory=list)
+
+
+class Explodes:
+    def __reduce__(self):
+        return (exec, ("raise SystemExit('unpickled')",))
+
+
+class TestResultCache:
+    def test_miss_then_hit(self):
+        cache = ResultCache()
+        key = cache.make_key("some text", "v1")
+
+        assert cache.get(key) is None
+        cache.put(key, ["result"])
+        assert cache.get(key) == ["result"]
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_lru_eviction(self):
+        cache = ResultCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        assert cache.get("a") == 1  # "b" is now least recently used
+        cache.put("c", 3)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.get_stats()["evictions"] == 1
+
+    def test_ttl_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(result_cache.time, "time", lambda: now[0])
+        cache = ResultCache(ttl_seconds=10)
+        cache.put("key", "value")
+
+        now[0] += 9
+        assert cache.get("key") == "value"
+        now[0] += 2
+        assert cache.get("key") is None
+        assert cache.get_stats()["entries"] == 0
+
+    def test_version_separates_keys(self):
+        cache = ResultCache()
+        assert cache.make_key("text", "v1") != cache.make_key("text", "v2")
+        # The separator keeps version and text from running together
+        assert cache.make_key("b", "a") != cache.make_key("", "ab")
+
+    def test_normalisation(self):
+        cache = ResultCache()
+        composed, decomposed = "caf\u00e9", "cafe\u0301"
+
+        assert cache.make_key(composed) == cache.make_key(decomposed)
+        assert cache.make_key("a\r\nb ") == cache.make_key("a\nb")
+        assert cache.make_key("a  b") != cache.make_key("a b")
+        assert cache.make_key(composed, normalize=False) != cache.make_key(
+            decomposed, normalize=False
+        )
+
+    def test_disk_tier_survives_restart(self, tmp_path):
+        path = str(tmp_path / "results.db")
+        cache = ResultCache(disk_path=path)
+        cache.put("key", {"violations": [1, 2]})
+        cache.close()
+
+        reopened = ResultCache(disk_path=path)
+        try:
+            assert reopened.get("key") == {"violations": [1, 2]}
+            assert reopened.get_stats()["disk_hits"] == 1
+            # Promoted into memory, so the next lookup does not touch disk
+            assert reopened.get("key") == {"violations": [1, 2]}
+            assert reopened.get_stats()["disk_hits"] == 1
+        finally:
+            reopened.close()
+
+    def test_disk_tier_honours_ttl(self, tmp_path, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(result_cache.time, "time", lambda: now[0])
+        path = str(tmp_path / "results.db")
+        cache = ResultCache(ttl_seconds=10, disk_path=path)
+        cache.put("key", "value")
+        cache.close()
+
+        now[0] += 11
+        reopened = ResultCache(disk_path=path)
+        try:
+            assert reopened.get("key") is None
+        finally:
+            reopened.close()
+
+    def test_clear(self, tmp_path):
+        cache = ResultCache(disk_path=str(tmp_path / "results.db"))
+        try:
+            cache.put("key", "value")
+            cache.clear()
+            assert cache.get("key") is None
+        finally:
+            cache.close()
+
+    def test_disk_tier_restores_registered_types(self, tmp_path):
+        path = str(tmp_path / "results.db")
+        value = [Finding(Colour.RED, datetime(2026, 1, 2, 3, 4), ["a"])]
+        cache = ResultCache(disk_path=path)
+        cache.put("key", value)
+        cache.close()
+
+        unregistered = ResultCache(disk_path=path)
+        try:
+            assert unregistered.get("key") is None
+        finally:
+            unregistered.close()
+
+        reopened = ResultCache(disk_path=path, value_types=[Finding, Colour])
+        try:
+            assert reopened.get("key") == value
+        finally:
+            reopened.close()
+
+    def test_disk_tier_never_unpickles(self, tmp_path):
+        path = str(tmp_path / "results.db")
+        ResultCache(disk_path=path).close()
+        with sqlite3.connect(path) as db:
+            db.execute(
+                "INSERT INTO results VALUES (?, ?, ?, ?)",
+                ("key", None, 0.0, pickle.dumps(Explodes())),
+            )
+
+        cache = ResultCache(disk_path=path)
+        try:
+            assert cache.get("key") is None
+        finally:
+            cache.close()
+
+    def test_unencodable_values_stay_in_memory(self, tmp_path):
+        path = str(tmp_path / "results.db")
+        cache = ResultCache(disk_path=path)
+        cache.put("key", {1, 2})
+        assert cache.get("key") == {1, 2}
+        cache.close()
+
+        reopened = ResultCache(disk_path=path)
+        try:
+            assert reopened.get("key") is None
+        finally:
+            reopened.close()
@@ -0,0 +1,210 @@
+"""
+Bridge Admission Control
+========================
+
+Admission control and load shedding for TrustWrapper v3.0 cross-chain
+bridge messages. Decides at send time whether a message may enter its
+route queue, and tells rejected callers when to try again.
+"""
+
+import logging
+from collections import OrderedDict, defaultdict
+
+from bridge.interfaces import BridgeMessage
+from bridge.message_broker import RouteShard
+from core.interfaces import ChainType
+from core.resilience import TokenBucket
+
+# Queue fill fraction at which each priority level is shed; priorities
+# above the highest level are only rejected when the queue is full
+DEFAULT_SHED_THRESHOLDS = {
+    0: 0.5,  # SYNCHRONIZATION
+    1: 0.7,  # HEALTH_CHECK
+    2: 0.9,  # VERIFICATION_REQUEST / VERIFICATION_RESPONSE
+}
+
+
+class AdmissionRejected(RuntimeError):
+    """Raised when a message is not admitted; carries a retry-after hint."""
+
+    def __init__(self, reason: str, retry_after_seconds: float, detail: str):
+        super().__init__(f"{detail} (retry after {retry_after_seconds:.3g}s)")
+        self.reason = reason  # "rate_limited" or "overloaded"
+        self.retry_after_seconds = retry_after_seconds
+
+
+class AdmissionController:
+    """
+    Rate limits and priority-aware load shedding for bridge messages.
+
+    Each message passes two checks:
+
+    - Load shedding: a route queue filled beyond the threshold for the
+      message's priority rejects it, so low-priority traffic such as
+      synchronization is dropped well before consensus votes. The
+      retry-after hint is the time the route needs to drain back below
+      the threshold.
+    - Rate limits: token buckets per source chain, and per source agent
+      and chain for messages whose payload names an ``ai_agent_id``.
+
+    Rejections raise ``AdmissionRejected`` instead of losing the message.
+    """
+
+    def __init__(
+        self,
+        agent_rate: float = 50.0,
+        agent_burst: float = 100.0,
+        chain_rate: float = 500.0,
+        chain_burst: float = 1000.0,
+        shed_thresholds: dict[int, float] | None = None,
+        max_agent_buckets: int = 10000,
+    ):
+        self.agent_rate = agent_rate
+        self.agent_burst = agent_burst
+        self.chain_rate = chain_rate
+        self.chain_burst = chain_burst
+        self.shed_thresholds = (
+            shed_thresholds
+            if shed_thresholds is not None
+            else dict(DEFAULT_SHED_THRESHOLDS)
+        )
+        self.max_agent_buckets = max_agent_buckets
+        self.default_retry_after = 1.0  # Hint while a route's drain rate is unknown
+        self.max_retry_after = 60.0
+
+        self._chain_buckets: dict[ChainType, TokenBucket] = {}
+        # Least recently used first, bounded by max_agent_buckets
+        self._agent_buckets: OrderedDict[tuple[str, ChainType], TokenBucket] = (
+            OrderedDict()
+        )
+
+        self.logger = logging.getLogger(f"{__name__}.admission")
+
+        # Statistics
+        self._stats = {
+            "admitted": 0,
+            "rate_limited": 0,
+            "shed": 0,
+        }
+        self._shed_by_priority: dict[int, int] = defaultdict(int)
+
+    def shed_threshold(self, priority: int) -> float:
+        """
+        Get the queue fill fraction at which a priority level is shed.
+
+        Args:
+            priority: Message priority (higher = more urgent)
+
+        Returns:
+            float: Fill fraction between 0 and 1
+        """
+        for level in sorted(self.shed_thresholds):
+            if priority <= level:
+                return self.shed_thresholds[level]
+        return 1.0
+
+    def admit(
+        self, message: BridgeMessage, priority: int, shard: RouteShard | None
+    ) -> None:
+        """
+        Admit a message or raise with a retry-after hint.
+
+        Args:
+            message: Message to admit
+            priority: Priority the message is shed by
+            shard: Queue shard of the message's route, if it exists yet
+
+        Raises:
+            AdmissionRejected: If the route is overloaded for the message's
+                priority or a rate limit is exceeded
+        """
+        if shard is not None:
+            self._check_load(message, priority, shard)
+
+        chain_bucket = self._chain_bucket(message.source_chain)
+        agent_id = message.payload.get("ai_agent_id")
+        agent_bucket = (
+            self._agent_bucket(agent_id, message.source_chain)
+            if agent_id is not None
+            else None
+        )
+
+        # Check both limits before taking tokens from either
+        wait = chain_bucket.retry_after()
+        if agent_bucket is not None:
+            wait = max(wait, agent_bucket.retry_after())
+        if wait > 0:
+            self._stats["rate_limited"] += 1
+            raise AdmissionRejected(
+                "rate_limited",
+                wait,
+                f"Rate limit exceeded on {message.source_chain.value}"
+                + (f" for agent {agent_id}" if agent_id is not None else ""),
+            )
+
+        chain_bucket.try_acquire()
+        if agent_bucket is not None:
+            agent_bucket.try_acquire()
+        self._stats["admitted"] += 1
+
+    def get_stats(self) -> dict[str, any]:
+        """
+        Get admission statistics.
+
+        Returns:
+            Dict: Admitted and rejected counts, shed counts per priority
+        """
+        return {
+            **self._stats,
+            "shed_by_priority": dict(self._shed_by_priority),
+            "agent_buckets": len(self._agent_buckets),
+        }
+
+    def _check_load(
+        self, message: BridgeMessage, priority: int, shard: RouteShard
+    ) -> None:
+        """Shed the message if its route queue is too full for its priority."""
+        capacity = shard.queue.max_size
+        depth = shard.queue.get_queue_size()
+        limit = self.shed_threshold(priority) * capacity
+        if depth < limit:
+            return
+
+        drain_rate = shard.drain_rate()
+        if drain_rate > 0:
+            retry_after = min(self.max_retry_after, (depth - limit + 1) / drain_rate)
+        else:
+            retry_after = self.default_retry_after
+
+        self._stats["shed"] += 1
+        self._shed_by_priority[priority] += 1
+        self.logger.warning(
+            f"Shedding {message.message_type.value} message on {shard.route_id}: "
+            f"queue {depth}/{capacity}"
+        )
+        raise AdmissionRejected(
+            "overloaded",
+            retry_after,
+            f"Route {shard.route_id} overloaded for priority {priority} messages",
+        )
+
+    def _chain_bucket(self, chain: ChainType) -> TokenBucket:
+        """Get the rate limit bucket of a source chain."""
+        bucket = self._chain_buckets.get(chain)
+        if bucket is None:
+            bucket = TokenBucket(self.chain_rate, self.chain_burst)
+            self._chain_buckets[chain] = bucket
+        return bucket
+
+    def _agent_bucket(self, agent_id: str, chain: ChainType) -> TokenBucket:
+        """Get the rate limit bucket of an agent on a source chain."""
+        key = (agent_id, chain)
+        bucket = self._agent_buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(self.agent_rate, self.agent_burst)
+            self._agent_buckets[key] = bucket
+            if len(self._agent_buckets) > self.max_agent_buckets:
+                self._agent_buckets.popitem(last=False)
+        else:
+            self._agent_buckets.move_to_end(key)
+        return bucket
@@ -0,0 +1,175 @@
+"""
+Chain Metrics Cache
+===================
+
+Background-refreshed chain metrics snapshots for TrustWrapper v3.0 chain
+adapters, so verification reads block heights without metrics RPCs.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+
+from core.interfaces import ChainMetrics
+
+
+class ChainMetricsCache:
+    """
+    Snapshot of an adapter's chain metrics with a staleness bound.
+
+    A background task polls the chain at block cadence and replaces the
+    snapshot as a whole, so readers never lock and never see a partial
+    update. A read finds the snapshot fresh while it is younger than
+    max_staleness; otherwise it fetches, with concurrent readers sharing
+    one fetch. Without the background task every fetch is still shared
+    by the reads that follow it within the staleness bound.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], Awaitable[ChainMetrics]],
+        max_staleness: float,
+        refresh_interval: float | None = None,
+        min_refresh_interval: float = 1.0,
+        name: str = "chain",
+    ):
+        """
+        Initialize metrics cache.
+
+        Args:
+            fetch: Coroutine function returning fresh chain metrics
+            max_staleness: Oldest snapshot age served, in seconds
+            refresh_interval: Background poll interval (block time if None)
+            min_refresh_interval: Lower bound on the poll interval
+            name: Chain name for logging
+        """
+        self._fetch = fetch
+        self.max_staleness = max_staleness
+        self.refresh_interval = refresh_interval
+        self.min_refresh_interval = min_refresh_interval
+        self.name = name
+
+        # (monotonic fetch time, metrics), replaced in one assignment
+        self._snapshot: tuple[float, ChainMetrics] | None = None
+        self._inflight: asyncio.Task | None = None
+        self._refresh_task: asyncio.Task | None = None
+
+        self.logger = logging.getLogger(f"{__name__}.{name}")
+
+        # Statistics
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "refreshes": 0,
+            "refresh_failures": 0,
+        }
+
+    def peek(self) -> ChainMetrics | None:
+        """
+        Get the snapshot if it is within the staleness bound.
+
+        Returns:
+            ChainMetrics | None: Fresh snapshot, or None
+        """
+        snapshot = self._snapshot
+        if snapshot is None or time.monotonic() - snapshot[0] > self.max_staleness:
+            return None
+        return snapshot[1]
+
+    async def get(self) -> ChainMetrics:
+        """
+        Get chain metrics no older than the staleness bound.
+
+        Returns:
+            ChainMetrics: Snapshot, fetched first if missing or stale
+
+        Raises:
+            Exception: Whatever the fetch raises when no fresh snapshot exists
+        """
+        metrics = self.peek()
+        if metrics is not None:
+            self._stats["hits"] += 1
+            return metrics
+
+        self._stats["misses"] += 1
+        return await self.refresh()
+
+    async def refresh(self) -> ChainMetrics:
+        """
+        Fetch chain metrics and replace the snapshot.
+
+        Returns:
+            ChainMetrics: Freshly fetched metrics
+        """
+        if self._inflight is None:
+            self._inflight = asyncio.create_task(self._fetch_snapshot())
+        # Shielded, so a cancelled reader does not cancel the shared fetch
+        return await asyncio.shield(self._inflight)
+
+    def start(self) -> None:
+        """Start refreshing the snapshot in the background."""
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_loop())
+            self.logger.info(f"Started metrics refresh for {self.name}")
+
+    async def stop(self) -> None:
+        """Stop background refresh and drop the snapshot."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+        self._refresh_task = None
+        self._snapshot = None
+
+    def get_stats(self) -> dict[str, any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict: Hit, miss and refresh counts, and the snapshot age
+        """
+        snapshot = self._snapshot
+        return {
+            **self._stats,
+            "snapshot_age": (
+                time.monotonic() - snapshot[0] if snapshot is not None else None
+            ),
+            "background_refresh": (
+                self._refresh_task is not None and not self._refresh_task.done()
+            ),
+        }
+
+    async def _fetch_snapshot(self) -> ChainMetrics:
+        """Run one fetch and store its result."""
+        try:
+            metrics = await self._fetch()
+            self._snapshot = (time.monotonic(), metrics)
+            self._stats["refreshes"] += 1
+            return metrics
+        except Exception:
+            self._stats["refresh_failures"] += 1
+            raise
+        finally:
+            self._inflight = None
+
+    def _next_interval(self) -> float:
+        """Get the delay until the next background refresh."""
+        interval = self.refresh_interval
+        snapshot = self._snapshot
+        if interval is None and snapshot is not None:
+            interval = snapshot[1].block_time
+        # Refresh at least twice per staleness bound so reads stay fresh
+        interval = max(interval or 0.0, self.min_refresh_interval)
+        return min(interval, self.max_staleness / 2)
+
+    async def _refresh_loop(self) -> None:
+        """Refresh the snapshot at block cadence until stopped."""
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                self.logger.warning(f"Metrics refresh failed for {self.name}: {e}")
+            await asyncio.sleep(self._next_interval())
@@ -13,6 +13,7 @@ from datetime import datetime
 from typing import Any
 
 from core.interfaces import ChainConfig, ChainType, IUniversalChainAdapter
+from core.resilience import CircuitBreaker, DecorrelatedJitterBackoff, RetryBudget
 
 
 @dataclass
@@ -54,6 +55,13 @@ class MultiChainConnectionManager:
         self.connection_timeout = connection_timeout
 
         self.connection_pool = ConnectionPool()
+
+        # Reconnects back off with jitter, share one retry budget, and stop
+        # for a while on chains whose breaker has opened
+        self.reconnect_backoff = DecorrelatedJitterBackoff(base=1, cap=30)
+        self.retry_budget = RetryBudget(min_retries_per_second=1.0)
+        self.circuit_breakers: dict[ChainType, CircuitBreaker] = {}
+
         self.logger = logging.getLogger(__name__)
         self._health_monitor_task: asyncio.Task | None = None
         self._shutdown_event = asyncio.Event()
@@ -87,6 +95,9 @@ class MultiChainConnectionManager:
                 average_response_time=0.0,
                 error_rate=0.0,
             )
+            self.circuit_breakers[chain_type] = CircuitBreaker(
+                chain_type.value, minimum_calls=3, open_seconds=60
+            )
 
             # Attempt initial connection
             connected = await self._connect_with_retry(adapter)
@@ -122,6 +133,7 @@ class MultiChainConnectionManager:
                 del self.connection_pool.adapters[chain_type]
                 del self.connection_pool.health_status[chain_type]
                 del self.connection_pool.configs[chain_type]
+                self.circuit_breakers.pop(chain_type, None)
 
                 self.logger.info(f"Removed {chain_type.value} adapter")
                 return True
@@ -210,6 +222,7 @@ class MultiChainConnectionManager:
         self.connection_pool.adapters.clear()
         self.connection_pool.health_status.clear()
         self.connection_pool.configs.clear()
+        self.circuit_breakers.clear()
 
     async def _connect_with_retry(self, adapter: IUniversalChainAdapter) -> bool:
         """
@@ -222,8 +235,18 @@ class MultiChainConnectionManager:
             bool: True if connection successful
         """
         chain_type = adapter.chain_type
+        breaker = self.circuit_breakers.get(chain_type)
+        delay = None
 
+        self.retry_budget.record_attempt()
         for attempt in range(self.max_retry_attempts):
+            if breaker is not None and not breaker.allow_request():
+                self.logger.warning(
+                    f"Circuit open for {chain_type.value}, not connecting "
+                    f"(retry in {breaker.retry_after():.0f}s)"
+                )
+                break
+
             try:
                 connected = await asyncio.wait_for(
                     adapter.connect(), timeout=self.connection_timeout
@@ -235,6 +258,8 @@ class MultiChainConnectionManager:
                     health.is_connected = True
                     health.consecutive_failures = 0
                     health.last_successful_request = datetime.utcnow()
+                    if breaker is not None:
+                        breaker.record_success()
 
                     return True
 
@@ -253,10 +278,18 @@ class MultiChainConnectionManager:
             health = self.connection_pool.health_status[chain_type]
             health.consecutive_failures += 1
             health.last_error = str(e) if "e" in locals() else "Connection timeout"
+            if breaker is not None:
+                breaker.record_failure()
 
-            # Wait before retry (exponential backoff)
+            # Wait before retry (jittered exponential backoff)
             if attempt < self.max_retry_attempts - 1:
-                await asyncio.sleep(2**attempt)
+                if not self.retry_budget.try_acquire():
+                    self.logger.warning(
+                        f"Retry budget exhausted, not retrying {chain_type.value}"
+                    )
+                    break
+                delay = self.reconnect_backoff.next_delay(delay)
+                await asyncio.sleep(delay)
 
         # All attempts failed
         health = self.connection_pool.health_status[chain_type]
@@ -320,11 +353,15 @@ class MultiChainConnectionManager:
                 health.average_response_time * 0.9 + response_time * 0.1
             )
             health.last_error = None
+            if chain_type in self.circuit_breakers:
+                self.circuit_breakers[chain_type].record_success()
 
         except Exception as e:
             # Update health status - failure
             health.consecutive_failures += 1
             health.last_error = str(e)
+            if chain_type in self.circuit_breakers:
+                self.circuit_breakers[chain_type].record_failure()
 
             # If too many failures, mark as disconnected
             if health.consecutive_failures >= self.max_retry_attempts:
@@ -370,9 +407,15 @@ class MultiChainConnectionManager:
                 "average_response_time": health.average_response_time,
                 "error_rate": health.error_rate,
                 "last_error": health.last_error,
+                "circuit_breaker": (
+                    self.circuit_breakers[chain_type].get_stats()
+                    if chain_type in self.circuit_breakers
+                    else None
+                ),
             }
 
         if healthy_count > 0:
             stats["average_response_time"] = total_response_time / healthy_count
+        stats["retry_budget"] = self.retry_budget.get_stats()
 
         return stats
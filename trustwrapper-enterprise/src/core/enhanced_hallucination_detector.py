@@ -4,6 +4,8 @@ Uses Google Gemini, Anthropic Claude, and other free APIs for actual hallucinati
 """
 
 import asyncio
+import copy
+import hashlib
 import json
 import os
 import re
@@ -47,12 +49,22 @@ try:
 except ImportError:
     HAS_REQUESTS = False
 
+try:
+    import aiohttp
+
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
+from trustwrapper.result_cache import ResultCache
+
 from .hallucination_detector import (
     HallucinationDetectionResult,
     HallucinationDetector,
     HallucinationEvidence,
     HallucinationType,
 )
+from .knowledge_index import EvidenceBackend, tokenize
 
 
 @dataclass
@@ -64,6 +76,8 @@ class AIVerificationResult:
     explanation: str
     sources_checked: List[str] = field(default_factory=list)
     model_used: str = ""
+    # False when the checker found nothing to judge the claim against
+    evidence_found: bool = True
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -72,15 +86,55 @@ class AIVerificationResult:
             "explanation": self.explanation,
             "sources_checked": self.sources_checked,
             "model_used": self.model_used,
+            "evidence_found": self.evidence_found,
         }
 
 
+def parse_claim_verdicts(
+    response_text: str, claim_count: int
+) -> Dict[int, Dict[str, Any]]:
+    """Parse a batched JSON verdict list into {claim index: verdict}"""
+    response_text = response_text.strip()
+    if response_text.startswith("```json"):
+        response_text = response_text[7:]
+    if response_text.endswith("```"):
+        response_text = response_text[:-3]
+
+    verdicts = {}
+    for verdict in json.loads(response_text):
+        index = int(verdict.get("claim", 0)) - 1
+        if 0 <= index < claim_count:
+            verdicts[index] = verdict
+    return verdicts
+
+
+def number_claims(claims: List[str]) -> str:
+    """Format claims as a numbered list for a batched prompt"""
+    return "\n".join(f"{index}. {claim}" for index, claim in enumerate(claims, 1))
+
+
 class WikipediaFactChecker:
     """Free fact-checking using Wikipedia API"""
 
-    def __init__(self):
+    API_URL = "https://en.wikipedia.org/w/api.php"
+    MAX_TITLES_PER_QUERY = 20  # MediaWiki limit for intro extracts
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 10,
+        timeout_seconds: float = 5,
+        evidence_backend: Optional[EvidenceBackend] = None,
+    ):
+        self.evidence_backend = evidence_backend
         self.base_url = "https://en.wikipedia.org/api/rest_v1/page/summary/"
         self.search_url = "https://en.wikipedia.org/api/rest_v1/page/search/"
+        self.max_connections_per_host = max_connections_per_host
+        self.timeout_seconds = timeout_seconds
+
+        # Pooled keep-alive clients, created on first use
+        self._session = None
+        self._session_loop = None
+        self._requests_session = None
 
     async def verify_fact(self, claim: str) -> AIVerificationResult:
         """Verify a factual claim against Wikipedia"""
@@ -88,43 +142,51 @@ class WikipediaFactChecker:
             # Extract key terms for search
             search_terms = self._extract_search_terms(claim)
 
-            # Search Wikipedia
-            search_results = await self._search_wikipedia(search_terms)
-
-            if not search_results:
-                return AIVerificationResult(
-                    is_factual=False,
-                    confidence=0.3,
-                    explanation="No relevant Wikipedia articles found",
-                    model_used="Wikipedia API",
+            if self.evidence_backend is not None:
+                # Local index replaces the live search and summary calls
+                verification_evidence = await self.evidence_backend.get_evidence(
+                    search_terms, limit=3
                 )
-
-            # Get detailed info for top results
-            verification_evidence = []
-            for result in search_results[:3]:  # Check top 3 results
-                summary = await self._get_page_summary(result["key"])
-                if summary:
-                    verification_evidence.append(
-                        {
-                            "title": result["title"],
-                            "extract": summary.get("extract", ""),
-                            "url": summary.get("content_urls", {})
-                            .get("desktop", {})
-                            .get("page", ""),
-                        }
+                if not verification_evidence:
+                    return AIVerificationResult(
+                        is_factual=False,
+                        confidence=0.3,
+                        explanation="No relevant Wikipedia articles found",
+                        model_used=self.source_name,
+                        evidence_found=False,
+                    )
+            else:
+                verification_evidence = await self._get_live_evidence(search_terms)
+                if verification_evidence is None:
+                    return AIVerificationResult(
+                        is_factual=False,
+                        confidence=0.3,
+                        explanation="No relevant Wikipedia articles found",
+                        model_used=self.source_name,
+                        evidence_found=False,
                     )
 
             # Simple fact checking logic
-            is_factual, confidence, explanation = self._analyze_evidence(
-                claim, verification_evidence
-            )
+            sources_checked = [e["url"] for e in verification_evidence]
+            verdict = self._analyze_evidence(claim, verification_evidence)
+            if verdict is None:
+                # Articles neither support nor contradict the claim
+                return AIVerificationResult(
+                    is_factual=False,
+                    confidence=0.5,
+                    explanation="Insufficient evidence to verify claim",
+                    sources_checked=sources_checked,
+                    model_used=self.source_name,
+                    evidence_found=False,
+                )
 
+            is_factual, confidence, explanation = verdict
             return AIVerificationResult(
                 is_factual=is_factual,
                 confidence=confidence,
                 explanation=explanation,
-                sources_checked=[e["url"] for e in verification_evidence],
-                model_used="Wikipedia API",
+                sources_checked=sources_checked,
+                model_used=self.source_name,
             )
 
         except Exception as e:
@@ -132,113 +194,234 @@ class WikipediaFactChecker:
                 is_factual=False,
                 confidence=0.1,
                 explanation=f"Error during verification: {str(e)}",
-                model_used="Wikipedia API (Error)",
+                model_used=f"{self.source_name} (Error)",
+                evidence_found=False,
             )
 
+    @property
+    def source_name(self) -> str:
+        """Name of the evidence source reported in results"""
+        if self.evidence_backend is not None:
+            return self.evidence_backend.name
+        return "Wikipedia API"
+
+    async def _get_live_evidence(self, search_terms: str) -> Optional[List[Dict]]:
+        """Search the live Wikipedia API; None when nothing relevant is found"""
+        search_results = await self._search_wikipedia(search_terms)
+        if not search_results:
+            return None
+
+        # Get detailed info for top results in one request
+        top_results = search_results[:3]  # Check top 3 results
+        summaries = await self._get_page_summaries(
+            [result["key"] for result in top_results]
+        )
+        verification_evidence = []
+        for result in top_results:
+            summary = summaries.get(result["key"])
+            if summary:
+                verification_evidence.append(
+                    {
+                        "title": result["title"],
+                        "extract": summary.get("extract", ""),
+                        "url": summary.get("content_urls", {})
+                        .get("desktop", {})
+                        .get("page", ""),
+                    }
+                )
+        return verification_evidence
+
+    async def close(self):
+        """Close pooled HTTP connections"""
+        await self._release_session()
+        if self._requests_session is not None:
+            self._requests_session.close()
+            self._requests_session = None
+
+    async def _get_json(self, url: str, params: Dict[str, Any]) -> Optional[Any]:
+        """GET a JSON document through the pooled client without blocking the loop"""
+        if HAS_AIOHTTP:
+            session = await self._get_session()
+            async with session.get(url, params=params) as response:
+                if response.status == 200:
+                    return await response.json(content_type=None)
+                return None
+
+        if not HAS_REQUESTS:
+            return None
+
+        if self._requests_session is None:
+            self._requests_session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(
+                pool_maxsize=self.max_connections_per_host
+            )
+            self._requests_session.mount("https://", adapter)
+        response = await asyncio.to_thread(
+            self._requests_session.get,
+            url,
+            params=params,
+            timeout=self.timeout_seconds,
+        )
+        if response.status_code == 200:
+            return response.json()
+        return None
+
+    async def _get_session(self):
+        """Return the keep-alive session for the running event loop"""
+        loop = asyncio.get_running_loop()
+        if (
+            self._session is None
+            or self._session.closed
+            or self._session_loop is not loop
+        ):
+            await self._release_session()
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.max_connections_per_host,
+                keepalive_timeout=30,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+            )
+            self._session_loop = loop
+        return self._session
+
+    async def _release_session(self):
+        """Close the pooled session, on the event loop that owns it"""
+        session, session_loop = self._session, self._session_loop
+        self._session = None
+        self._session_loop = None
+        if session is None or session.closed:
+            return
+
+        loop = asyncio.get_running_loop()
+        if session_loop is loop:
+            await session.close()
+        elif session_loop is not None and session_loop.is_running():
+            # Still serving another thread's loop; close it there
+            await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(session.close(), session_loop)
+            )
+        else:
+            # The owning loop has stopped, so its connections cannot be
+            # shut down gracefully; drop them so the sockets are released
+            try:
+                await session.close()
+            except Exception:
+                session.detach()
+
     def _extract_search_terms(self, claim: str) -> str:
         """Extract search terms from claim"""
         # Remove common words and extract key terms
-        stopwords = {
-            "the",
-            "is",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "what",
-            "when",
-            "where",
-            "who",
-            "how",
-            "why",
-        }
-        words = re.findall(r"\b\w+\b", claim.lower())
-        key_words = [w for w in words if w not in stopwords and len(w) > 2]
+        key_words = tokenize(claim)
         return " ".join(key_words[:5])  # Top 5 key words
 
     async def _search_wikipedia(self, query: str) -> List[Dict]:
         """Search Wikipedia for relevant articles"""
-        if not HAS_REQUESTS:
+        if not HAS_AIOHTTP and not HAS_REQUESTS:
             return []
 
         try:
             # Use the opensearch API which is more reliable
-            search_url = "https://en.wikipedia.org/w/api.php"
             params = {
                 "action": "opensearch",
                 "search": query,
                 "limit": 5,
                 "format": "json",
             }
-            response = requests.get(search_url, params=params, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                if len(data) >= 4:
-                    titles = data[1]
-                    descriptions = data[2]
-                    urls = data[3]
-                    return [
-                        {
-                            "key": title.replace(" ", "_"),
-                            "title": title,
-                            "description": desc,
-                            "url": url,
-                        }
-                        for title, desc, url in zip(titles, descriptions, urls)
-                    ]
+            data = await self._get_json(self.API_URL, params)
+            if data and len(data) >= 4:
+                titles = data[1]
+                descriptions = data[2]
+                urls = data[3]
+                return [
+                    {
+                        "key": title.replace(" ", "_"),
+                        "title": title,
+                        "description": desc,
+                        "url": url,
+                    }
+                    for title, desc, url in zip(titles, descriptions, urls)
+                ]
         except Exception as e:
             print(f"Wikipedia search error: {e}")
         return []
 
     async def _get_page_summary(self, page_key: str) -> Optional[Dict]:
         """Get summary of a Wikipedia page"""
-        if not HAS_REQUESTS:
-            return None
-
+        summaries = await self._get_page_summaries([page_key])
+        return summaries.get(page_key)
+
+    async def _get_page_summaries(self, page_keys: List[str]) -> Dict[str, Dict]:
+        """Get summaries of several Wikipedia pages, keyed by page key
+
+        Titles are requested together in a single ``extracts`` query per
+        batch of up to 20, and batches are fetched in parallel.
+        """
+        if not page_keys or (not HAS_AIOHTTP and not HAS_REQUESTS):
+            return {}
+
+        batches = [
+            page_keys[i : i + self.MAX_TITLES_PER_QUERY]
+            for i in range(0, len(page_keys), self.MAX_TITLES_PER_QUERY)
+        ]
+        summaries = {}
+        for batch_summaries in await asyncio.gather(
+            *(self._fetch_summary_batch(batch) for batch in batches)
+        ):
+            summaries.update(batch_summaries)
+        return summaries
+
+    async def _fetch_summary_batch(self, page_keys: List[str]) -> Dict[str, Dict]:
+        """Fetch intro extracts for up to 20 pages in one API call"""
         try:
-            # Use the Wikipedia API to get page extract
-            api_url = "https://en.wikipedia.org/w/api.php"
+            # Use the Wikipedia API to get page extracts
+            titles = {key.replace("_", " "): key for key in page_keys}
             params = {
                 "action": "query",
                 "format": "json",
-                "titles": page_key.replace("_", " "),
+                "titles": "|".join(titles),
                 "prop": "extracts",
-                "exintro": True,
-                "explaintext": True,
+                "exintro": 1,
+                "explaintext": 1,
                 "exsectionformat": "plain",
+                "exlimit": len(titles),
             }
-            response = requests.get(api_url, params=params, timeout=5)
-            if response.status_code == 200:
-                data = response.json()
-                pages = data.get("query", {}).get("pages", {})
-                for page_id, page_data in pages.items():
-                    if "extract" in page_data:
-                        return {
-                            "extract": page_data["extract"],
-                            "title": page_data.get("title", ""),
-                            "content_urls": {
-                                "desktop": {
-                                    "page": f"https://en.wikipedia.org/wiki/{page_key}"
-                                }
-                            },
-                        }
+            data = await self._get_json(self.API_URL, params)
+            if not data:
+                return {}
+
+            # The API reports titles it rewrote; map results back to our keys
+            query = data.get("query", {})
+            for normalized in query.get("normalized", []):
+                if normalized.get("from") in titles:
+                    titles[normalized["to"]] = titles[normalized["from"]]
+
+            summaries = {}
+            for page_data in query.get("pages", {}).values():
+                page_key = titles.get(page_data.get("title", ""))
+                if page_key and "extract" in page_data:
+                    summaries[page_key] = {
+                        "extract": page_data["extract"],
+                        "title": page_data.get("title", ""),
+                        "content_urls": {
+                            "desktop": {
+                                "page": f"https://en.wikipedia.org/wiki/{page_key}"
+                            }
+                        },
+                    }
+            return summaries
         except Exception as e:
             print(f"Wikipedia page summary error: {e}")
-        return None
+        return {}
 
     def _analyze_evidence(
         self, claim: str, evidence: List[Dict]
-    ) -> Tuple[bool, float, str]:
-        """Analyze evidence to determine if claim is factual"""
+    ) -> Optional[Tuple[bool, float, str]]:
+        """Analyze evidence to determine if claim is factual
+
+        Returns None when the evidence neither supports nor contradicts it.
+        """
         claim_lower = claim.lower()
 
         # Look for contradictions or confirmations
@@ -275,7 +458,7 @@ class WikipediaFactChecker:
                 f"Evidence supports claim (found {confirmations} confirmations)",
             )
         else:
-            return False, 0.5, "Insufficient evidence to verify claim"
+            return None
 
 
 class GeminiHallucinationChecker:
@@ -371,6 +554,83 @@ Respond in JSON format:
                 model_used="Gemini Pro (Error)",
             )
 
+    async def detect_claims(
+        self, text: str, claims: List[str]
+    ) -> List[AIVerificationResult]:
+        """Use Gemini to check several claims from one text in a single request
+
+        The full text is sent for context; one verdict is returned per claim.
+        """
+        if not self.available:
+            return [
+                AIVerificationResult(
+                    is_factual=True,
+                    confidence=0.5,
+                    explanation="Gemini not available",
+                    model_used="None",
+                )
+                for _ in claims
+            ]
+
+        try:
+            prompt = f"""
+Analyze the numbered claims below, taken from the text that follows them,
+for potential hallucinations or false information. Use the full text as
+context. Consider:
+1. Factual accuracy
+2. Temporal consistency (events described as past when they're future)
+3. Plausible but unverifiable claims
+4. Suspicious statistics or data
+5. Non-existent technologies, papers, or people
+
+Claims:
+{number_claims(claims)}
+
+Full text: "{text}"
+
+Respond with a JSON list holding one object per claim:
+[
+    {{
+        "claim": claim number,
+        "is_factual": true/false,
+        "confidence": 0.0-1.0,
+        "explanation": "Brief explanation of findings"
+    }}
+]
+"""
+
+            response = self.model.generate_content(prompt)
+            verdicts = parse_claim_verdicts(response.text, len(claims))
+        except Exception as e:
+            verdicts = {}
+            error = f"Error during Gemini analysis: {str(e)}"
+        else:
+            error = "Gemini returned no verdict for this claim"
+
+        results = []
+        for index in range(len(claims)):
+            verdict = verdicts.get(index)
+            if verdict is None:
+                results.append(
+                    AIVerificationResult(
+                        is_factual=True,
+                        confidence=0.3,
+                        explanation=error,
+                        model_used="Gemini Pro (Error)",
+                    )
+                )
+                continue
+            results.append(
+                AIVerificationResult(
+                    is_factual=bool(verdict.get("is_factual", True)),
+                    confidence=float(verdict.get("confidence", 0.5)),
+                    explanation=verdict.get("explanation", "No explanation provided"),
+                    sources_checked=["Google Gemini Analysis"],
+                    model_used="Gemini Pro",
+                )
+            )
+        return results
+
 
 class ClaudeHallucinationChecker:
     """Use Anthropic Claude for hallucination detection"""
@@ -461,15 +721,158 @@ Be concise and focus on clear factual problems.
                 model_used="Claude (Error)",
             )
 
+    async def detect_claims(
+        self, text: str, claims: List[str]
+    ) -> List[AIVerificationResult]:
+        """Use Claude to check several claims from one text in a single request
+
+        The full text is sent for context; one verdict is returned per claim.
+        """
+        if not self.available:
+            return [
+                AIVerificationResult(
+                    is_factual=True,
+                    confidence=0.5,
+                    explanation="Claude not available",
+                    model_used="None",
+                )
+                for _ in claims
+            ]
+
+        try:
+            prompt = f"""
+Please analyze each numbered claim below for potential hallucinations or
+false information. The claims are taken from the full text that follows
+them; use it as context.
+
+Claims:
+{number_claims(claims)}
+
+Full text:
+"{text}"
+
+Check for:
+- Factual inaccuracies
+- Future events described as past
+- Non-existent research papers or studies
+- Impossible statistics
+- Non-existent technologies or APIs
+- Overconfident claims about unverifiable facts
+
+Respond with one line per claim, answering YES if it is factually accurate:
+<claim number>. <YES/NO> - <confidence 0-100%> - <brief explanation>
+
+Be concise and focus on clear factual problems.
+"""
+
+            response = self.client.messages.create(
+                model="claude-3-haiku-20240307",
+                max_tokens=60 + 80 * len(claims),
+                temperature=0.1,
+                messages=[{"role": "user", "content": prompt}],
+            )
+            lines = response.content[0].text.splitlines()
+        except Exception as e:
+            lines = []
+            error = f"Error during Claude analysis: {str(e)}"
+        else:
+            error = "Claude returned no verdict for this claim"
+
+        verdicts = {}
+        for line in lines:
+            match = re.match(r"\s*(\d+)[.):]\s*(YES|NO)\b(.*)", line, re.IGNORECASE)
+            if match and 0 < int(match.group(1)) <= len(claims):
+                verdicts[int(match.group(1)) - 1] = match
+
+        results = []
+        for index in range(len(claims)):
+            match = verdicts.get(index)
+            if match is None:
+                results.append(
+                    AIVerificationResult(
+                        is_factual=True,
+                        confidence=0.3,
+                        explanation=error,
+                        model_used="Claude (Error)",
+                    )
+                )
+                continue
+
+            is_factual = match.group(2).upper() == "YES"
+            confidence_match = re.search(r"(\d+)%", match.group(3))
+            confidence = (
+                float(confidence_match.group(1)) / 100
+                if confidence_match
+                else (0.7 if is_factual else 0.8)
+            )
+            results.append(
+                AIVerificationResult(
+                    is_factual=is_factual,
+                    confidence=confidence,
+                    explanation=match.group(3).strip(" -")[:200],
+                    sources_checked=["Anthropic Claude Analysis"],
+                    model_used="Claude 3 Haiku",
+                )
+            )
+        return results
+
+
+def split_claims(text: str) -> List[str]:
+    """Split text into sentence-level claims"""
+    sentences = re.split(r"(?<=[.!?])\s+|\n+", text)
+    return [sentence.strip() for sentence in sentences if sentence.strip()]
+
+
+def normalize_claim(claim: str) -> str:
+    """Canonical form of a claim used for verdict cache keys"""
+    return " ".join(claim.lower().split()).rstrip(".!?")
+
 
 class EnhancedHallucinationDetector(HallucinationDetector):
     """Enhanced detector that combines pattern matching with AI models"""
 
-    def __init__(self):
+    # Bump when detection or result-combining logic changes to invalidate caches
+    DETECTOR_VERSION = "enhanced-4"
+
+    def __init__(
+        self,
+        cache: Optional[ResultCache] = None,
+        enable_cache: bool = True,
+        evidence_backend: Optional[EvidenceBackend] = None,
+        claim_cache: Optional[ResultCache] = None,
+    ):
         super().__init__()
 
+        # External checker verdicts can change, so cached results expire
+        self.cache = (cache or ResultCache(ttl_seconds=3600)) if enable_cache else None
+        self.claim_cache = None
+        if enable_cache:
+            self.claim_cache = claim_cache or ResultCache(
+                max_entries=100000, ttl_seconds=6 * 3600, normalizer=normalize_claim
+            )
+
+        # Result types the disk tier of either cache may read back
+        for cache in (self.cache, self.claim_cache):
+            if cache is not None:
+                cache.register_types(
+                    HallucinationDetectionResult,
+                    HallucinationEvidence,
+                    HallucinationType,
+                    AIVerificationResult,
+                )
+
+        # Claim-level checker statistics
+        self.claims_checked = 0
+        self.claims_from_cache = 0
+
+        # Single-flight: concurrent identical checks share one in-flight task
+        self._detections_in_flight: Dict[str, asyncio.Task] = {}
+        self._claims_in_flight: Dict[Tuple[str, str], asyncio.Task] = {}
+        self.coalesced_detections = 0
+        self.coalesced_claims = 0
+
         # Initialize AI checkers
-        self.wikipedia_checker = WikipediaFactChecker()
+        self.wikipedia_checker = WikipediaFactChecker(evidence_backend=evidence_backend)
         self.gemini_checker = GeminiHallucinationChecker()
         self.claude_checker = ClaudeHallucinationChecker()
 
@@ -479,56 +882,263 @@ class EnhancedHallucinationDetector(HallucinationDetector):
             self.available_services.append("Gemini")
         if self.claude_checker.available:
             self.available_services.append("Claude")
-        self.available_services.append("Wikipedia")  # Always available
+        self.available_services.append(
+            "Wikipedia" if evidence_backend is None else evidence_backend.name
+        )  # Always available
 
         print(
             f"✅ Enhanced detector initialized with: {', '.join(self.available_services)}"
         )
 
+    @property
+    def cache_version(self) -> str:
+        """Cache namespace: detector logic version plus the active checkers"""
+        return f"{self.DETECTOR_VERSION}:{','.join(self.available_services)}"
+
     async def detect_hallucinations(
         self, text: str, context: Optional[Dict[str, Any]] = None
     ) -> HallucinationDetectionResult:
-        """Enhanced detection using both patterns and AI"""
+        """Enhanced detection using both patterns and AI
+
+        Results are cached by response text and context; pattern detection
+        sees the context, so the same response to two prompts is judged
+        separately. Concurrent calls for the same text and context share a
+        single detection run.
+        """
         start_time = time.time()
 
+        scope = self.cache_version
+        if context:
+            scope += ":" + hashlib.sha256(
+                json.dumps(context, sort_keys=True, default=str).encode()
+            ).hexdigest()
+
+        cache_key = None
+        if self.cache is not None:
+            cache_key = self.cache.make_key(text, scope)
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                result = copy.deepcopy(cached)
+                result.detection_time_ms = int((time.time() - start_time) * 1000)
+                return result
+
+        flight_key = cache_key or hashlib.sha256(
+            f"{scope}\0{text}".encode()
+        ).hexdigest()
+        task = self._detections_in_flight.get(flight_key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._detect_and_cache(text, context, cache_key, start_time)
+            )
+            self._track_in_flight(self._detections_in_flight, flight_key, task)
+        else:
+            self.coalesced_detections += 1
+
+        # Shield so one caller being cancelled does not fail the others
+        result = copy.deepcopy(await asyncio.shield(task))
+        result.detection_time_ms = int((time.time() - start_time) * 1000)
+        return result
+
+    async def _detect_and_cache(
+        self,
+        text: str,
+        context: Optional[Dict[str, Any]],
+        cache_key: Optional[str],
+        start_time: float,
+    ) -> HallucinationDetectionResult:
+        """Run pattern and AI detection once and store the result"""
         # Start with pattern-based detection
         pattern_result = await super().detect_hallucinations(text, context)
 
         # If patterns already found issues, still check with AI for confirmation
-        ai_verifications = []
+        ai_verifications, claim_texts = await self._verify_claims(text)
 
-        # Run AI checkers in parallel
-        ai_tasks = []
+        # Combine results
+        enhanced_result = self._combine_results(
+            pattern_result, ai_verifications, text, claim_texts
+        )
+        enhanced_result.detection_time_ms = int((time.time() - start_time) * 1000)
 
-        # Wikipedia fact checking
-        ai_tasks.append(self.wikipedia_checker.verify_fact(text))
+        # A verdict degraded by a checker error is retried, not served for the TTL
+        if cache_key is not None and all(
+            self._is_cacheable(verification) for verification in ai_verifications
+        ):
+            self.cache.put(cache_key, copy.deepcopy(enhanced_result))
 
-        # Gemini analysis
-        if self.gemini_checker.available:
-            ai_tasks.append(self.gemini_checker.detect_hallucination(text))
+        return enhanced_result
 
-        # Claude analysis
+    def _track_in_flight(self, in_flight: Dict[Any, asyncio.Task], key: Any, task):
+        """Register a shared task and drop it from the map once it finishes"""
+        in_flight[key] = task
+
+        def _done(finished: asyncio.Task):
+            if in_flight.get(key) is finished:
+                del in_flight[key]
+            if not finished.cancelled():
+                finished.exception()  # Mark retrieved if every caller went away
+
+        task.add_done_callback(_done)
+
+    async def _verify_claims(
+        self, text: str
+    ) -> Tuple[List[AIVerificationResult], List[str]]:
+        """Run AI checkers per claim, reusing cached verdicts for known claims
+
+        Wikipedia looks up each unseen claim on its own; each LLM checker gets
+        all unseen claims in one request, together with the full text.
+        Returns the verdicts and, for each verdict, the claim it covers.
+        """
+        checkers = [
+            (
+                f"wikipedia:{self.wikipedia_checker.source_name}",
+                self.wikipedia_checker.verify_fact,
+                None,
+            )
+        ]
+        if self.gemini_checker.available:
+            checkers.append(("gemini", None, self.gemini_checker.detect_claims))
         if self.claude_checker.available:
-            ai_tasks.append(self.claude_checker.detect_hallucination(text))
+            checkers.append(("claude", None, self.claude_checker.detect_claims))
+
+        claims = split_claims(text) or [text]
+
+        # One slot per (checker, claim); unseen claims are checked once each
+        slots = []
+        pending: Dict[Tuple[str, str], asyncio.Task] = {}
+        for checker_name, check, check_batch in checkers:
+            unseen: Dict[Tuple[str, str], str] = {}
+            for claim in claims:
+                key = (checker_name, normalize_claim(claim))
+                self.claims_checked += 1
+                slots.append((claim, key))
+                if key in pending or key in unseen:
+                    continue
+
+                cached = None
+                if self.claim_cache is not None:
+                    cached = self.claim_cache.get(
+                        self._claim_cache_key(claim, checker_name)
+                    )
+                if cached is not None:
+                    self.claims_from_cache += 1
+                    slots[-1] = (claim, cached)
+                    continue
+
+                # Another detection may already be checking this claim
+                task = self._claims_in_flight.get(key)
+                if task is None:
+                    unseen[key] = claim
+                else:
+                    self.coalesced_claims += 1
+                    pending[key] = task
+
+            if check_batch is not None and unseen:
+                batch = asyncio.ensure_future(
+                    self._check_claim_batch(
+                        checker_name, text, list(unseen.values()), check_batch
+                    )
+                )
+                for index, key in enumerate(unseen):
+                    task = asyncio.ensure_future(self._claim_from_batch(batch, index))
+                    self._track_in_flight(self._claims_in_flight, key, task)
+                    pending[key] = task
+            else:
+                for key, claim in unseen.items():
+                    task = asyncio.ensure_future(self._check_claim(key, claim, check))
+                    self._track_in_flight(self._claims_in_flight, key, task)
+                    pending[key] = task
 
-        # Wait for AI results
-        if ai_tasks:
-            ai_results = await asyncio.gather(*ai_tasks, return_exceptions=True)
-            ai_verifications = [
-                r for r in ai_results if isinstance(r, AIVerificationResult)
-            ]
+        # Run AI checkers in parallel
+        verdicts: Dict[Any, Any] = {}
+        if pending:
+            ai_results = await asyncio.gather(
+                *(asyncio.shield(task) for task in pending.values()),
+                return_exceptions=True,
+            )
+            verdicts = dict(zip(pending.keys(), ai_results))
 
-        # Combine results
-        enhanced_result = self._combine_results(pattern_result, ai_verifications, text)
-        enhanced_result.detection_time_ms = int((time.time() - start_time) * 1000)
+        ai_verifications = []
+        claim_texts = []
+        for claim, verdict in slots:
+            if not isinstance(verdict, AIVerificationResult):
+                verdict = verdicts.get(verdict)
+            if isinstance(verdict, AIVerificationResult):
+                ai_verifications.append(verdict)
+                claim_texts.append(claim)
+        return ai_verifications, claim_texts
+
+    async def _check_claim(
+        self, key: Tuple[str, str], claim: str, check: Any
+    ) -> AIVerificationResult:
+        """Run one checker on one claim and cache the verdict"""
+        result = await check(claim)
+        if self.claim_cache is not None and self._is_cacheable(result):
+            self.claim_cache.put(self._claim_cache_key(claim, key[0]), result)
+        return result
+
+    async def _check_claim_batch(
+        self, checker_name: str, text: str, claims: List[str], check_batch: Any
+    ) -> List[AIVerificationResult]:
+        """Run one checker on several claims in one request and cache the verdicts"""
+        results = await check_batch(text, claims)
+        if len(results) != len(claims):
+            raise ValueError(
+                f"{checker_name} returned {len(results)} verdicts "
+                f"for {len(claims)} claims"
+            )
+        if self.claim_cache is not None:
+            for claim, result in zip(claims, results):
+                if self._is_cacheable(result):
+                    self.claim_cache.put(
+                        self._claim_cache_key(claim, checker_name), result
+                    )
+        return results
+
+    async def _claim_from_batch(
+        self, batch: asyncio.Task, index: int
+    ) -> AIVerificationResult:
+        """Verdict for one claim of a batched check"""
+        return (await asyncio.shield(batch))[index]
+
+    def _claim_cache_key(self, claim: str, checker_name: str) -> str:
+        """Verdict cache key for one claim and checker"""
+        return self.claim_cache.make_key(
+            claim, f"{self.DETECTOR_VERSION}:{checker_name}"
+        )
 
-        return enhanced_result
+    def _is_cacheable(self, result: Any) -> bool:
+        """Only keep real verdicts; errors and unavailable checkers are retried"""
+        return (
+            isinstance(result, AIVerificationResult)
+            and result.model_used != "None"
+            and not result.model_used.endswith("(Error)")
+        )
+
+    async def close(self):
+        """Release pooled connections held by the checkers"""
+        await self.wikipedia_checker.close()
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Response and claim verdict cache hit/miss counters"""
+        if self.cache is None:
+            return {"enabled": False}
+        return {
+            "enabled": True,
+            "response_cache": self.cache.get_stats(),
+            "claim_cache": self.claim_cache.get_stats(),
+            "claims_checked": self.claims_checked,
+            "claims_from_cache": self.claims_from_cache,
+            "claim_hit_rate": self.claims_from_cache / max(self.claims_checked, 1),
+            "coalesced_detections": self.coalesced_detections,
+            "coalesced_claims": self.coalesced_claims,
+        }
 
     def _combine_results(
         self,
         pattern_result: HallucinationDetectionResult,
         ai_results: List[AIVerificationResult],
         text: str,
+        claim_texts: Optional[List[str]] = None,
     ) -> HallucinationDetectionResult:
         """Combine pattern and AI detection results"""
 
@@ -543,7 +1153,15 @@ class EnhancedHallucinationDetector(HallucinationDetector):
         ai_detected_issues = []
         ai_confidence_scores = []
 
-        for ai_result in ai_results:
+        # A checker that found no evidence has no opinion on the claim
+        judged = [
+            (ai_result, claim_texts[index] if claim_texts else text)
+            for index, ai_result in enumerate(ai_results)
+            if ai_result.evidence_found
+        ]
+        ai_results = [ai_result for ai_result, _ in judged]
+
+        for ai_result, source_text in judged:
             ai_confidence_scores.append(ai_result.confidence)
 
             if not ai_result.is_factual:
@@ -552,7 +1170,7 @@ class EnhancedHallucinationDetector(HallucinationDetector):
                     type=HallucinationType.PLAUSIBLE_FABRICATION,  # Default type for AI detection
                     confidence=ai_result.confidence,
                     description=f"AI-detected issue: {ai_result.explanation}",
-                    source_text=text[:200],
+                    source_text=source_text[:200],
                     evidence=[f"Source: {ai_result.model_used}"]
                     + ai_result.sources_checked,
                 )
@@ -585,6 +1203,16 @@ class EnhancedHallucinationDetector(HallucinationDetector):
 
 
 # Factory function for easy initialization
-def create_enhanced_detector() -> EnhancedHallucinationDetector:
+def create_enhanced_detector(
+    cache: Optional[ResultCache] = None,
+    enable_cache: bool = True,
+    evidence_backend: Optional[EvidenceBackend] = None,
+    claim_cache: Optional[ResultCache] = None,
+) -> EnhancedHallucinationDetector:
     """Create an enhanced hallucination detector with available AI services"""
-    return EnhancedHallucinationDetector()
+    return EnhancedHallucinationDetector(
+        cache=cache,
+        enable_cache=enable_cache,
+        evidence_backend=evidence_backend,
+        claim_cache=claim_cache,
+    )
@@ -4,9 +4,12 @@ Combines the enhanced hallucination detector with real Aleo/Leo ZK proof generat
 """
 
 import asyncio
+import hashlib
 import time
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Union
+
+from trustwrapper.result_cache import ResultCache
 
 from .enhanced_hallucination_detector import (
     create_enhanced_detector,
@@ -45,6 +48,24 @@ class EnhancedVerifiedResult:
         }
 
 
+@dataclass
+class _VerificationJob:
+    """State of one request as it moves through the verification stages"""
+
+    args: tuple
+    kwargs: Dict[str, Any]
+    start_time: float
+    response: Any = None
+    model_execution_time: float = 0.0
+    hallucination_result: Any = None
+    detection_time: float = 0.0
+    trust_score: float = 0.0
+    verification_method: str = "ai"
+    zk_proof: Optional[ZKProof] = None
+    evidence_proofs: List[ZKEvidenceProof] = field(default_factory=list)
+    future: Optional[asyncio.Future] = None
+
+
 class EnhancedTrustWrapper:
     """Production-ready TrustWrapper with real ZK proofs and AI detection"""
 
@@ -54,14 +75,20 @@ class EnhancedTrustWrapper:
         model_name: Optional[str] = None,
         enable_zk_proofs: bool = True,
         zk_network: str = "testnet",
+        enable_detection_cache: bool = True,
+        detection_cache: Optional[ResultCache] = None,
+        batch_concurrency: int = 10,
     ):
         """Initialize enhanced TrustWrapper"""
         self.base_model = base_model
         self.model_name = model_name or str(type(base_model).__name__)
         self.enable_zk_proofs = enable_zk_proofs
+        self.batch_concurrency = batch_concurrency
 
         # Initialize components
-        self.hallucination_detector = create_enhanced_detector()
+        self.hallucination_detector = create_enhanced_detector(
+            cache=detection_cache, enable_cache=enable_detection_cache
+        )
         self.zk_generator = (
             create_zk_proof_generator(zk_network) if enable_zk_proofs else None
         )
@@ -82,142 +109,165 @@ class EnhancedTrustWrapper:
 
     async def verified_execute(self, *args, **kwargs) -> EnhancedVerifiedResult:
         """Execute with full verification pipeline"""
-        start_time = time.time()
+        job = _VerificationJob(args=args, kwargs=kwargs, start_time=time.time())
 
         # Execute base model
+        await self._stage_execute(job)
+
+        return await self._verify_job(job)
+
+    async def _verify_job(self, job: _VerificationJob) -> EnhancedVerifiedResult:
+        """Run detection and proof stages for a job whose model has executed"""
+        await self._stage_detect(job)
+        await self._stage_prove(job)
+        await self._stage_evidence(job)
+        return self._finalize(job)
+
+    async def _stage_execute(self, job: _VerificationJob, offload: bool = False):
+        """Run the base model; sync models run in a thread when ``offload`` is set"""
         try:
             if hasattr(self.base_model, "async_execute"):
-                response = await self.base_model.async_execute(*args, **kwargs)
+                job.response = await self.base_model.async_execute(
+                    *job.args, **job.kwargs
+                )
+            elif offload:
+                job.response = await asyncio.to_thread(
+                    self.base_model.execute, *job.args, **job.kwargs
+                )
             else:
-                response = self.base_model.execute(*args, **kwargs)
+                job.response = self.base_model.execute(*job.args, **job.kwargs)
         except Exception as e:
-            response = f"Model execution error: {str(e)}"
+            job.response = f"Model execution error: {str(e)}"
 
-        model_execution_time = time.time() - start_time
+        job.model_execution_time = time.time() - job.start_time
 
-        # Detect hallucinations with AI
+    async def _stage_detect(self, job: _VerificationJob):
+        """Detect hallucinations with AI and score the response"""
         detection_start = time.time()
         hallucination_result = await self.hallucination_detector.detect_hallucinations(
-            str(response), {"args": args, "kwargs": kwargs}
+            str(job.response), {"args": job.args, "kwargs": job.kwargs}
         )
-        detection_time = time.time() - detection_start
+        job.hallucination_result = hallucination_result
+        job.detection_time = time.time() - detection_start
 
         # Calculate trust score
         base_trust = 1.0 - (len(hallucination_result.hallucinations) * 0.2)
-        final_trust_score = max(0.0, base_trust * hallucination_result.trust_score)
+        job.trust_score = max(0.0, base_trust * hallucination_result.trust_score)
 
         # Determine verification method
-        verification_method = (
+        job.verification_method = (
             "consensus"
             if len(self.hallucination_detector.available_services) > 1
             else "ai"
         )
 
-        # Generate ZK proof
-        zk_proof = None
-        if self.zk_generator:
-            try:
-                zk_proof = await self.zk_generator.generate_verification_proof(
-                    response_text=str(response),
-                    ai_model=self.model_name,
-                    trust_score=final_trust_score,
-                    verification_method=verification_method,
-                    evidence_count=len(hallucination_result.hallucinations),
-                )
-            except Exception as e:
-                print(f"ZK proof generation failed: {e}")
-                # Create fallback proof
-                import hashlib
-
-                proof_id = hashlib.sha256(
-                    f"{response}{time.time()}".encode()
-                ).hexdigest()
-                zk_proof = ZKProof(
-                    proof_id=proof_id,
-                    response_hash=hashlib.sha256(str(response).encode()).hexdigest(),
-                    trust_score=int(final_trust_score * 100),
-                    verification_method=3,  # consensus
-                    timestamp=int(time.time()),
-                    verifier_address="mock_address",
+    async def _stage_prove(self, job: _VerificationJob):
+        """Generate the ZK verification proof"""
+        if not self.zk_generator:
+            return
+
+        response = job.response
+        try:
+            job.zk_proof = await self.zk_generator.generate_verification_proof(
+                response_text=str(response),
+                ai_model=self.model_name,
+                trust_score=job.trust_score,
+                verification_method=job.verification_method,
+                evidence_count=len(job.hallucination_result.hallucinations),
+            )
+        except Exception as e:
+            print(f"ZK proof generation failed: {e}")
+            # Create fallback proof
+            proof_id = hashlib.sha256(f"{response}{time.time()}".encode()).hexdigest()
+            job.zk_proof = ZKProof(
+                proof_id=proof_id,
+                response_hash=hashlib.sha256(str(response).encode()).hexdigest(),
+                trust_score=int(job.trust_score * 100),
+                verification_method=3,  # consensus
+                timestamp=int(time.time()),
+                verifier_address="mock_address",
+            )
+
+    async def _stage_evidence(self, job: _VerificationJob):
+        """Generate evidence proofs, all concurrently"""
+        hallucinations = job.hallucination_result.hallucinations
+        if not self.zk_generator or not hallucinations:
+            return
+
+        results = await asyncio.gather(
+            *(
+                self.zk_generator.generate_evidence_proof(
+                    verification_id=job.zk_proof.proof_id,
+                    evidence_type=evidence.type,
+                    confidence=evidence.confidence,
+                    detection_method="gemini",  # Primary AI service
+                    evidence_data=evidence.description,
                 )
+                for evidence in hallucinations
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Evidence proof generation failed: {result}")
+            else:
+                job.evidence_proofs.append(result)
 
-        # Generate evidence proofs
-        evidence_proofs = []
-        if self.zk_generator and hallucination_result.hallucinations:
-            for evidence in hallucination_result.hallucinations:
-                try:
-                    evidence_proof = await self.zk_generator.generate_evidence_proof(
-                        verification_id=zk_proof.proof_id,
-                        evidence_type=evidence.type,
-                        confidence=evidence.confidence,
-                        detection_method="gemini",  # Primary AI service
-                        evidence_data=evidence.description,
-                    )
-                    evidence_proofs.append(evidence_proof)
-                except Exception as e:
-                    print(f"Evidence proof generation failed: {e}")
+    def _finalize(self, job: _VerificationJob) -> EnhancedVerifiedResult:
+        """Update statistics and build the result"""
+        hallucination_result = job.hallucination_result
 
         # Update statistics
         self.execution_count += 1
-        total_time = time.time() - start_time
+        total_time = time.time() - job.start_time
         self.total_processing_time += total_time
         if hallucination_result.has_hallucination:
             self.hallucination_detections += 1
 
         # Create enhanced result
         return EnhancedVerifiedResult(
-            data=response,
+            data=job.response,
             metrics={
-                "model_execution_time_ms": int(model_execution_time * 1000),
-                "detection_time_ms": int(detection_time * 1000),
+                "model_execution_time_ms": int(job.model_execution_time * 1000),
+                "detection_time_ms": int(job.detection_time * 1000),
                 "total_time_ms": int(total_time * 1000),
                 "execution_count": self.execution_count,
                 "success": True,
             },
             hallucination_detection=hallucination_result.to_dict(),
-            zk_proof=zk_proof,
-            evidence_proofs=evidence_proofs,
-            trust_score=final_trust_score,
-            verification_method=verification_method,
+            zk_proof=job.zk_proof,
+            evidence_proofs=job.evidence_proofs,
+            trust_score=job.trust_score,
+            verification_method=job.verification_method,
             ai_services_used=self.hallucination_detector.available_services,
         )
 
-    async def batch_verify(self, queries: List[str]) -> List[EnhancedVerifiedResult]:
-        """Batch verify multiple queries efficiently"""
-        if len(queries) > 5:
-            # Process in batches of 5
-            results = []
-            for i in range(0, len(queries), 5):
-                batch = queries[i : i + 5]
-                batch_results = await self._process_batch(batch)
-                results.extend(batch_results)
-            return results
-        else:
-            return await self._process_batch(queries)
-
-    async def _process_batch(self, queries: List[str]) -> List[EnhancedVerifiedResult]:
-        """Process a batch of up to 5 queries"""
-        # Execute all models concurrently
-        tasks = []
-        for query in queries:
-            if hasattr(self.base_model, "async_execute"):
-                tasks.append(self.base_model.async_execute(query))
-            else:
-                tasks.append(asyncio.to_thread(self.base_model.execute, query))
+    async def batch_verify(
+        self, queries: List[str], max_concurrency: Optional[int] = None
+    ) -> List[EnhancedVerifiedResult]:
+        """Batch verify multiple queries efficiently
 
-        responses = await asyncio.gather(*tasks, return_exceptions=True)
+        The model runs once per query, then hallucination detection and ZK
+        proof generation run concurrently across the batch, with at most
+        ``max_concurrency`` queries in progress. Results keep query order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency or self.batch_concurrency)
 
-        # Process responses
-        results = []
-        for query, response in zip(queries, responses):
-            if isinstance(response, Exception):
-                response = f"Error: {str(response)}"
+        async def verify_query(query: str) -> EnhancedVerifiedResult:
+            async with semaphore:
+                job = _VerificationJob(args=(query,), kwargs={}, start_time=time.time())
+                await self._stage_execute(job, offload=True)
+                return await self._verify_job(job)
 
-            # Individual verification
-            result = await self.verified_execute(query)
-            results.append(result)
+        return list(await asyncio.gather(*(verify_query(q) for q in queries)))
 
-        return results
+    def create_pipeline(
+        self,
+        queue_size: int = 32,
+        workers_per_stage: Union[int, Dict[str, int]] = 1,
+    ) -> "VerificationPipeline":
+        """Create a staged pipeline that overlaps verification across requests"""
+        return VerificationPipeline(self, queue_size, workers_per_stage)
 
     def get_performance_stats(self) -> Dict[str, Any]:
         """Get performance statistics"""
@@ -239,8 +289,13 @@ class EnhancedTrustWrapper:
             "leo_available": (
                 self.zk_generator.leo_available if self.zk_generator else False
             ),
+            "detection_cache": self.get_cache_stats(),
         }
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get hallucination detection cache statistics"""
+        return self.hallucination_detector.get_cache_stats()
+
     async def validate_response_text(self, text: str) -> Dict[str, Any]:
         """Validate arbitrary text without model execution"""
         detection_result = await self.hallucination_detector.detect_hallucinations(text)
@@ -266,12 +321,173 @@ class EnhancedTrustWrapper:
         }
 
 
+@dataclass
+class StageStats:
+    """Throughput and latency counters for one pipeline stage"""
+
+    workers: int
+    processed: int = 0
+    failed: int = 0
+    total_latency_s: float = 0.0
+    max_latency_s: float = 0.0
+
+    def record(self, latency: float):
+        self.processed += 1
+        self.total_latency_s += latency
+        self.max_latency_s = max(self.max_latency_s, latency)
+
+
+class VerificationPipeline:
+    """Staged verification with bounded queues between stages
+
+    Model execution, hallucination detection, ZK proof generation and
+    evidence proofs each run in their own workers. While request N is in
+    detection, request N-1 can be in proof generation, so throughput is
+    bounded by the slowest stage rather than the sum of all stages. Every
+    queue is bounded: when a stage falls behind, upstream stages block on
+    put and ``submit`` blocks callers, instead of buffering without limit.
+    """
+
+    STAGES = ("model", "detection", "proof", "evidence")
+
+    def __init__(
+        self,
+        wrapper: EnhancedTrustWrapper,
+        queue_size: int = 32,
+        workers_per_stage: Union[int, Dict[str, int]] = 1,
+    ):
+        # asyncio.Queue treats 0 as unbounded, which would drop backpressure
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be at least 1, got {queue_size}")
+        self.wrapper = wrapper
+        self.queue_size = queue_size
+        if isinstance(workers_per_stage, int):
+            workers_per_stage = dict.fromkeys(self.STAGES, workers_per_stage)
+        self.workers_per_stage = {
+            stage: workers_per_stage.get(stage, 1) for stage in self.STAGES
+        }
+        # A stage without workers never drains, so stop() would hang
+        for stage, workers in self.workers_per_stage.items():
+            if workers < 1:
+                raise ValueError(
+                    f"workers_per_stage[{stage!r}] must be at least 1, got {workers}"
+                )
+
+        self._handlers = {
+            "model": lambda job: wrapper._stage_execute(job, offload=True),
+            "detection": wrapper._stage_detect,
+            "proof": wrapper._stage_prove,
+            "evidence": wrapper._stage_evidence,
+        }
+        self._queues: List[asyncio.Queue] = []
+        self._workers: List[asyncio.Task] = []
+        self.stage_stats = {
+            stage: StageStats(workers=self.workers_per_stage[stage])
+            for stage in self.STAGES
+        }
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    async def start(self):
+        """Start stage workers"""
+        if self.running:
+            return
+        self._queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.STAGES]
+        for index, stage in enumerate(self.STAGES):
+            for _ in range(self.workers_per_stage[stage]):
+                self._workers.append(asyncio.create_task(self._stage_worker(index)))
+
+    async def stop(self):
+        """Drain in-flight requests, then stop the workers"""
+        for queue in self._queues:
+            await queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(self, *args, **kwargs) -> asyncio.Future:
+        """Queue a request; waits while the first stage is full
+
+        Returns a future that resolves to the EnhancedVerifiedResult.
+        """
+        if not self.running:
+            await self.start()
+        job = _VerificationJob(args=args, kwargs=kwargs, start_time=time.time())
+        job.future = asyncio.get_running_loop().create_future()
+        await self._queues[0].put(job)
+        return job.future
+
+    async def verify(self, *args, **kwargs) -> EnhancedVerifiedResult:
+        """Submit a request and wait for its result"""
+        return await (await self.submit(*args, **kwargs))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-stage queue depth, throughput and latency"""
+        stages = {}
+        for index, stage in enumerate(self.STAGES):
+            stats = self.stage_stats[stage]
+            stages[stage] = {
+                "queue_depth": self._queues[index].qsize() if self._queues else 0,
+                "queue_capacity": self.queue_size,
+                "workers": stats.workers,
+                "processed": stats.processed,
+                "failed": stats.failed,
+                "average_latency_ms": int(
+                    stats.total_latency_s / max(stats.processed, 1) * 1000
+                ),
+                "max_latency_ms": int(stats.max_latency_s * 1000),
+            }
+        return {"running": self.running, "stages": stages}
+
+    async def _stage_worker(self, index: int):
+        """Take jobs from a stage queue, process them and pass them on"""
+        stage = self.STAGES[index]
+        handler = self._handlers[stage]
+        stats = self.stage_stats[stage]
+        queue = self._queues[index]
+        next_queue = self._queues[index + 1] if index + 1 < len(self._queues) else None
+
+        while True:
+            job = await queue.get()
+            try:
+                if job.future.done():
+                    continue  # Caller gave up
+
+                started = time.time()
+                try:
+                    await handler(job)
+                except Exception as e:
+                    stats.failed += 1
+                    # The caller may have cancelled while the stage ran
+                    if not job.future.done():
+                        job.future.set_exception(e)
+                    continue
+                stats.record(time.time() - started)
+
+                if next_queue is not None:
+                    await next_queue.put(job)
+                elif not job.future.done():
+                    try:
+                        result = self.wrapper._finalize(job)
+                    except Exception as e:
+                        stats.failed += 1
+                        job.future.set_exception(e)
+                    else:
+                        job.future.set_result(result)
+            finally:
+                queue.task_done()
+
+
 # Factory functions
 def create_enhanced_trust_wrapper(
     model: Any,
     model_name: Optional[str] = None,
     enable_zk_proofs: bool = True,
     zk_network: str = "testnet",
+    enable_detection_cache: bool = True,
 ) -> EnhancedTrustWrapper:
     """Create an enhanced TrustWrapper with all features"""
     return EnhancedTrustWrapper(
@@ -279,4 +495,5 @@ def create_enhanced_trust_wrapper(
         model_name=model_name,
         enable_zk_proofs=enable_zk_proofs,
         zk_network=zk_network,
+        enable_detection_cache=enable_detection_cache,
     )
@@ -0,0 +1,342 @@
+"""
+Offline Knowledge Index for Fact Checking
+Pluggable evidence backends, including a memory-mapped BM25 index built from a local corpus
+"""
+
+import heapq
+import itertools
+import json
+import math
+import mmap
+import os
+import re
+import sys
+import tempfile
+from abc import ABC, abstractmethod
+from array import array
+from collections import Counter, defaultdict
+from contextlib import ExitStack
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+SEARCH_STOPWORDS = {
+    "the",
+    "is",
+    "a",
+    "an",
+    "and",
+    "or",
+    "but",
+    "in",
+    "on",
+    "at",
+    "to",
+    "for",
+    "of",
+    "with",
+    "by",
+    "what",
+    "when",
+    "where",
+    "who",
+    "how",
+    "why",
+}
+
+INDEX_FORMAT_VERSION = 2
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into the terms used for search and indexing"""
+    words = re.findall(r"\b\w+\b", text.lower())
+    return [w for w in words if w not in SEARCH_STOPWORDS and len(w) > 2]
+
+
+class EvidenceBackend(ABC):
+    """Source of evidence documents for fact checking"""
+
+    name = "Evidence backend"
+
+    @abstractmethod
+    async def get_evidence(self, query: str, limit: int = 3) -> List[Dict[str, str]]:
+        """Return up to ``limit`` evidence dicts with title, extract and url"""
+
+
+class OfflineKnowledgeIndex(EvidenceBackend):
+    """
+    BM25 retrieval over an on-disk inverted index, with no network access.
+
+    The lexicon, postings and documents are memory-mapped, so opening an
+    index is cheap and the OS page cache keeps hot terms resident. Lexicon
+    terms are stored sorted and found by binary search, so no part of the
+    index is loaded into memory up front. Each posting stores its
+    precomputed BM25 weight and postings are sorted by weight, so a query
+    only reads the best ``max_postings_per_term`` entries of each term.
+    """
+
+    name = "Wikipedia (offline index)"
+
+    def __init__(self, path: str, max_postings_per_term: int = 1000):
+        self.path = path
+        self.max_postings_per_term = max_postings_per_term
+
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as f:
+            self.meta = json.load(f)
+        if self.meta.get("format_version") != INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported index format in {path}")
+        if self.meta.get("byteorder") != sys.byteorder:
+            raise ValueError(f"Index {path} was built on a different byte order")
+
+        self._files = []
+        # Sorted UTF-8 terms, their offsets, and (posting offset, count) pairs
+        self._terms = self._map("lexicon_terms.bin", None)
+        self._term_offsets = self._map("lexicon_offsets.bin", "Q")
+        self._term_postings = self._map("lexicon_postings.bin", "Q")
+        self._doc_ids = self._map("posting_docs.bin", "I")
+        self._weights = self._map("posting_weights.bin", "f")
+        self._doc_offsets = self._map("doc_offsets.bin", "Q")
+        self._docs = self._map("docs.bin", None)
+
+    @property
+    def document_count(self) -> int:
+        return self.meta["document_count"]
+
+    @property
+    def term_count(self) -> int:
+        return self.meta["term_count"]
+
+    async def get_evidence(self, query: str, limit: int = 3) -> List[Dict[str, str]]:
+        """Return the best matching documents for the query terms"""
+        return [self.get_document(doc_id) for doc_id, _ in self.search(query, limit)]
+
+    def search(self, query: str, limit: int = 3) -> List[Tuple[int, float]]:
+        """Rank documents by BM25 score; returns (doc_id, score) pairs"""
+        scores: Dict[int, float] = defaultdict(float)
+        for term in set(tokenize(query)):
+            entry = self.lookup(term)
+            if entry is None:
+                continue
+            offset, count = entry
+            end = offset + min(count, self.max_postings_per_term)
+            for doc_id, weight in zip(
+                self._doc_ids[offset:end], self._weights[offset:end]
+            ):
+                scores[doc_id] += weight
+        return heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+
+    def lookup(self, term: str) -> Optional[Tuple[int, int]]:
+        """Find a term's (posting offset, posting count) by binary search"""
+        key = term.encode("utf-8")
+        low, high = 0, self.term_count
+        while low < high:
+            middle = (low + high) // 2
+            start, end = self._term_offsets[middle], self._term_offsets[middle + 1]
+            found = bytes(self._terms[start:end])
+            if found < key:
+                low = middle + 1
+            elif found > key:
+                high = middle
+            else:
+                pair = 2 * middle
+                return self._term_postings[pair], self._term_postings[pair + 1]
+        return None
+
+    def get_document(self, doc_id: int) -> Dict[str, str]:
+        """Load a stored document as an evidence dict"""
+        start, end = self._doc_offsets[doc_id], self._doc_offsets[doc_id + 1]
+        return json.loads(bytes(self._docs[start:end]).decode("utf-8"))
+
+    def close(self):
+        """Release the memory maps"""
+        for view in (
+            self._terms,
+            self._term_offsets,
+            self._term_postings,
+            self._doc_ids,
+            self._weights,
+            self._doc_offsets,
+            self._docs,
+        ):
+            view.release()
+        for mapped, handle in self._files:
+            mapped.close()
+            handle.close()
+        self._files = []
+
+    def _map(self, filename: str, typecode: Optional[str]) -> memoryview:
+        """Memory-map an index file, typed as an array of ``typecode``"""
+        handle = open(os.path.join(self.path, filename), "rb")
+        if os.fstat(handle.fileno()).st_size == 0:
+            handle.close()
+            return memoryview(array(typecode or "B"))
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        self._files.append((mapped, handle))
+        view = memoryview(mapped)
+        return view.cast(typecode) if typecode else view
+
+
+def build_knowledge_index(
+    documents: Iterable[Dict[str, Any]],
+    path: str,
+    k1: float = 1.2,
+    b: float = 0.75,
+    max_extract_chars: int = 2000,
+    postings_per_run: int = 4_000_000,
+) -> Dict[str, Any]:
+    """
+    Build an OfflineKnowledgeIndex from documents with title, text and url.
+
+    The full text is indexed; the stored extract is the leading part of the
+    text, matching the intro extracts returned by the live Wikipedia API.
+    Postings are buffered as packed (doc_id, tf) pairs and spilled to a
+    sorted run on disk every ``postings_per_run`` postings; the runs are
+    then merged term by term, so the build holds one run and one term's
+    postings in memory rather than the whole inverted index.
+    """
+    os.makedirs(path, exist_ok=True)
+
+    doc_lengths = array("I")
+    doc_offsets = array("Q", [0])
+
+    with tempfile.TemporaryDirectory(dir=path) as run_dir:
+        run_paths: List[str] = []
+        # term -> interleaved doc_id, tf pairs for the current run
+        postings: Dict[str, array] = defaultdict(lambda: array("I"))
+        buffered = 0
+
+        with open(os.path.join(path, "docs.bin"), "wb") as docs_file:
+            for document in documents:
+                doc_id = len(doc_lengths)
+                text = document.get("text", "")
+                terms = tokenize(f"{document.get('title', '')} {text}")
+                for term, tf in Counter(terms).items():
+                    postings[term].extend((doc_id, tf))
+                    buffered += 1
+                doc_lengths.append(len(terms))
+
+                record = json.dumps(
+                    {
+                        "title": document.get("title", ""),
+                        "extract": text[:max_extract_chars],
+                        "url": document.get("url", ""),
+                    }
+                ).encode("utf-8")
+                docs_file.write(record)
+                doc_offsets.append(doc_offsets[-1] + len(record))
+
+                if buffered >= postings_per_run:
+                    run_paths.append(_write_run(postings, run_dir, len(run_paths)))
+                    postings.clear()
+                    buffered = 0
+
+        if postings:
+            run_paths.append(_write_run(postings, run_dir, len(run_paths)))
+            postings.clear()
+
+        document_count = len(doc_lengths)
+        average_length = sum(doc_lengths) / document_count if document_count else 0.0
+
+        term_count = 0
+        posting_count = 0
+        with ExitStack() as stack:
+            terms_file, offsets_file, lexicon_file, doc_ids_file, weights_file = (
+                stack.enter_context(open(os.path.join(path, filename), "wb"))
+                for filename in (
+                    "lexicon_terms.bin",
+                    "lexicon_offsets.bin",
+                    "lexicon_postings.bin",
+                    "posting_docs.bin",
+                    "posting_weights.bin",
+                )
+            )
+            runs = [
+                _read_run(stack.enter_context(open(run_path, "rb")), number)
+                for number, run_path in enumerate(run_paths)
+            ]
+
+            term_offset = 0
+            array("Q", [term_offset]).tofile(offsets_file)
+            # Runs are sorted by the UTF-8 bytes lookups binary search on
+            merged = heapq.merge(*runs)
+            for encoded, group in itertools.groupby(merged, key=lambda r: r[0]):
+                terms_file.write(encoded)
+                term_offset += len(encoded)
+                array("Q", [term_offset]).tofile(offsets_file)
+
+                pairs = array("I")
+                for _, _, run_pairs in group:
+                    pairs.extend(run_pairs)
+                count = len(pairs) // 2
+                idf = math.log((document_count - count + 0.5) / (count + 0.5) + 1)
+                weighted = []
+                for doc_id, tf in zip(pairs[::2], pairs[1::2]):
+                    length_ratio = doc_lengths[doc_id] / (average_length or 1)
+                    norm = k1 * (1 - b + b * length_ratio)
+                    weighted.append((idf * tf * (k1 + 1) / (tf + norm), doc_id))
+                weighted.sort(reverse=True)  # Impact order for early termination
+
+                array("Q", [posting_count, count]).tofile(lexicon_file)
+                array("I", (doc_id for _, doc_id in weighted)).tofile(doc_ids_file)
+                array("f", (weight for weight, _ in weighted)).tofile(weights_file)
+                posting_count += count
+                term_count += 1
+
+    with open(os.path.join(path, "doc_offsets.bin"), "wb") as f:
+        doc_offsets.tofile(f)
+
+    meta = {
+        "format_version": INDEX_FORMAT_VERSION,
+        "byteorder": sys.byteorder,
+        "document_count": document_count,
+        "term_count": term_count,
+        "average_document_length": average_length,
+        "k1": k1,
+        "b": b,
+    }
+    with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=2)
+    return meta
+
+
+def _write_run(postings: Dict[str, array], run_dir: str, number: int) -> str:
+    """Write buffered postings to a run file, sorted by UTF-8 term bytes"""
+    run_path = os.path.join(run_dir, f"run-{number:06d}.bin")
+    with open(run_path, "wb") as f:
+        for encoded, term in sorted((term.encode("utf-8"), term) for term in postings):
+            pairs = postings[term]
+            array("I", [len(encoded), len(pairs)]).tofile(f)
+            f.write(encoded)
+            pairs.tofile(f)
+    return run_path
+
+
+def _read_run(run_file, number: int) -> Iterator[Tuple[bytes, int, array]]:
+    """
+    Stream (term bytes, run number, doc_id/tf pairs) records from a run.
+
+    The run number keeps merged records for a term in doc_id order, and
+    means the pair arrays are never compared.
+    """
+    while True:
+        header = array("I")
+        try:
+            header.fromfile(run_file, 2)
+        except EOFError:
+            return
+        encoded = run_file.read(header[0])
+        pairs = array("I")
+        pairs.fromfile(run_file, header[1])
+        yield encoded, number, pairs
+
+
+def iter_jsonl_corpus(path: str) -> Iterator[Dict[str, Any]]:
+    """
+    Read a JSON-lines corpus, one {"title", "text", "url"} object per line.
+
+    This is the format produced by ``wikiextractor --json`` from a
+    Wikipedia XML dump.
+    """
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
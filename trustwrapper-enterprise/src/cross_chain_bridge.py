@@ -11,6 +11,7 @@ import logging
 import uuid
 from datetime import datetime
 
+from bridge.admission import AdmissionController, AdmissionRejected
 from bridge.consensus_engine import CrossChainConsensusEngine
 from bridge.health_monitor import BridgeHealthMonitor
 from bridge.interfaces import (
@@ -39,6 +40,7 @@ class CrossChainBridge(ICrossChainBridge):
         self.message_broker = CrossChainMessageBroker()
         self.consensus_engine = CrossChainConsensusEngine()
         self.health_monitor = BridgeHealthMonitor()
+        self.admission = AdmissionController()  # Rate limits and load shedding
 
         self.adapters: dict[ChainType, IBridgeAdapter] = {}
         self.routes: list[BridgeRoute] = []
@@ -61,6 +63,7 @@ class CrossChainBridge(ICrossChainBridge):
             "total_messages": 0,
             "successful_messages": 0,
             "failed_messages": 0,
+            "rejected_messages": 0,
             "consensus_processes": 0,
             "successful_consensus": 0,
             "bridge_uptime_seconds": 0,
@@ -125,6 +128,13 @@ class CrossChainBridge(ICrossChainBridge):
             for route in self.routes:
                 await self.health_monitor.register_bridge_route(route)
 
+            # Broker outcomes feed the monitor's route trackers, which in
+            # turn drive the broker's per-route circuit breakers
+            if isinstance(self.health_monitor, BridgeHealthMonitor):
+                self.message_broker.use_health_trackers(
+                    self.health_monitor.route_trackers
+                )
+
             # Register alert callbacks
             self._register_alert_callbacks()
 
@@ -186,6 +196,13 @@ class CrossChainBridge(ICrossChainBridge):
 
         Returns:
             str: Message tracking identifier
+
+        Raises:
+            ValueError: If the message is invalid or its route cannot take
+                messages
+            AdmissionRejected: If the route is overloaded or the sender is
+                over its rate limit; ``retry_after_seconds`` says when to
+                try again
         """
         if not self._running:
             raise RuntimeError("Bridge not running. Call start() first.")
@@ -194,13 +211,36 @@ class CrossChainBridge(ICrossChainBridge):
         if not self._validate_message(message):
             raise ValueError("Invalid bridge message")
 
+        # A send the broker would refuse must not use up the sender's quota
+        self.message_broker.require_active_route(
+            message.source_chain, message.target_chain
+        )
+
+        # Shed and schedule by the higher of the message's own and its type's
+        # priority, so consensus traffic outlasts synchronization under load
+        shed_priority = max(
+            message.priority,
+            self.message_broker.message_priorities.get(message.message_type, 0),
+        )
+        try:
+            self.admission.admit(
+                message,
+                shed_priority,
+                self.message_broker.get_route_shard(
+                    message.source_chain, message.target_chain
+                ),
+            )
+        except AdmissionRejected:
+            self._stats["rejected_messages"] += 1
+            raise
+
         # Send through message broker
         message_id = await self.message_broker.send_message(
             message.message_type,
             message.source_chain,
             message.target_chain,
             message.payload,
-            message.priority,
+            shed_priority,
             message.timeout_seconds,
         )
 
@@ -370,6 +410,7 @@ class CrossChainBridge(ICrossChainBridge):
                 **self._stats,
             },
             "message_broker": broker_stats,
+            "admission": self.admission.get_stats(),
             "consensus_engine": consensus_stats,
             "health_monitor": monitoring_stats,
             "route_health": {
@@ -7,8 +7,14 @@ across multiple blockchain networks with weighted voting and timeout handling.
 """
 
 import asyncio
+import hashlib
+import json
 import logging
-from dataclasses import dataclass, field
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from enum import Enum
 
@@ -22,6 +28,7 @@ from core.interfaces import (
     VerificationRequest,
     VerificationStatus,
 )
+from core.resilience import LatencyWindow, RetryBudget
 
 
 class ConsensusPhase(Enum):
@@ -77,6 +84,46 @@ class MultiChainConsensusEngine(IConsensusEngine):
         # Active consensus requests
         self.active_requests: dict[str, ConsensusState] = {}
 
+        # Verification stops once outstanding chains can no longer change
+        # the outcome. Stragglers are cancelled, or left to finish and
+        # recorded in the statistics when cancel_stragglers is False.
+        self.cancel_stragglers = True
+        self._straggler_tasks: set[asyncio.Task] = set()
+
+        # Identical requests share one verification round: concurrent ones
+        # join the round in flight, later ones reuse its result while it is
+        # younger than dedup_window_seconds (0 disables reuse)
+        self.dedup_window_seconds = 5.0
+        self.dedup_max_entries = 10000
+        self._inflight_rounds: dict[tuple, asyncio.Task] = {}
+        self._recent_results: OrderedDict[tuple, tuple[float, ConsensusResult]] = (
+            OrderedDict()
+        )
+
+        # Micro-batching: with batch_window_seconds > 0, requests for the
+        # same target chains arriving within the window share one round.
+        # Each chain verifies the batch in one task and casts one vote over
+        # the Merkle root of its verdicts; results are split per request.
+        self.batch_window_seconds = 0.0
+        self.max_batch_size = 64
+        self._open_batches: dict[
+            frozenset[ChainType], list[tuple[VerificationRequest, asyncio.Future]]
+        ] = {}
+        self._batch_timers: dict[frozenset[ChainType], asyncio.TimerHandle] = {}
+        self._batch_tasks: set[asyncio.Task] = set()
+
+        # Hedging: a chain verification still running at the chain's p95
+        # latency is duplicated to a secondary adapter (or the same one),
+        # and the first answer wins. The budget caps hedges to a fraction
+        # of verifications so a slow chain cannot double its own load.
+        self.hedge_adapters: dict[ChainType, IUniversalChainAdapter] = {}
+        self.hedge_percentile = 0.95
+        self.hedge_min_samples = 20  # Latency samples needed before hedging
+        self.hedge_budget = RetryBudget(ratio=0.1, min_retries_per_second=1.0)
+        self._chain_latency: dict[ChainType, LatencyWindow] = defaultdict(
+            LatencyWindow
+        )
+
         # Performance statistics
         self.stats = {
             "total_requests": 0,
@@ -85,12 +132,117 @@ class MultiChainConsensusEngine(IConsensusEngine):
             "timeout_consensus": 0,
             "average_consensus_time": 0.0,
             "byzantine_faults_detected": 0,
+            "early_terminations": 0,
+            "stragglers_cancelled": 0,
+            "late_results": 0,
+            "late_disagreements": 0,
+            "hedged_verifications": 0,
+            "hedge_wins": 0,
+            "deduplicated_requests": 0,
+            "batches_verified": 0,
+            "batched_requests": 0,
         }
 
     async def verify_cross_chain(self, request: VerificationRequest) -> ConsensusResult:
         """
         Perform cross-chain AI verification with Byzantine fault tolerance.
 
+        Requests with the same agent, verification data, target chains and
+        threshold share one verification round, so retries and duplicate
+        submissions do not multiply chain load.
+
+        Args:
+            request: Verification request with target chains
+
+        Returns:
+            ConsensusResult: Final consensus result
+        """
+        key = self._request_key(request)
+
+        cached = self._recent_results.get(key)
+        if cached is not None:
+            expires_at, result = cached
+            if expires_at > time.monotonic():
+                self.stats["deduplicated_requests"] += 1
+                return replace(result, request_id=request.request_id)
+            del self._recent_results[key]
+
+        round_task = self._inflight_rounds.get(key)
+        if round_task is None:
+            round_task = asyncio.create_task(self._run_shared_round(key, request))
+            self._inflight_rounds[key] = round_task
+        else:
+            self.stats["deduplicated_requests"] += 1
+
+        # Shielded, so a cancelled caller does not cancel the shared round
+        result = await asyncio.shield(round_task)
+        if result.request_id != request.request_id:
+            result = replace(result, request_id=request.request_id)
+        return result
+
+    async def _run_shared_round(
+        self, key: tuple, request: VerificationRequest
+    ) -> ConsensusResult:
+        """
+        Run a verification round on behalf of all identical requests.
+
+        Args:
+            key: Deduplication key of the request
+            request: First request with this key
+
+        Returns:
+            ConsensusResult: Result of the round
+        """
+        try:
+            if self.batch_window_seconds > 0:
+                result = await self._join_batch(request)
+            else:
+                result = await self._run_verification(request)
+        finally:
+            del self._inflight_rounds[key]
+
+        # Failed rounds are shared with concurrent callers but not reused
+        if (
+            self.dedup_window_seconds > 0
+            and result.overall_status != VerificationStatus.ERROR
+        ):
+            self._recent_results[key] = (
+                time.monotonic() + self.dedup_window_seconds,
+                result,
+            )
+            self._recent_results.move_to_end(key)
+            while len(self._recent_results) > self.dedup_max_entries:
+                self._recent_results.popitem(last=False)
+        return result
+
+    @staticmethod
+    def _request_key(request: VerificationRequest) -> tuple:
+        """
+        Get the deduplication key of a request.
+
+        Args:
+            request: Verification request
+
+        Returns:
+            Tuple: Canonical data hash, agent, target chain set and threshold
+        """
+        data = json.dumps(
+            request.verification_data,
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        return (
+            hashlib.sha256(data.encode("utf-8")).digest(),
+            request.ai_agent_id,
+            frozenset(request.target_chains),
+            request.consensus_threshold,
+        )
+
+    async def _run_verification(self, request: VerificationRequest) -> ConsensusResult:
+        """
+        Run one verification, voting and aggregation round.
+
         Args:
             request: Verification request with target chains
 
@@ -158,6 +310,175 @@ class MultiChainConsensusEngine(IConsensusEngine):
             if request.request_id in self.active_requests:
                 del self.active_requests[request.request_id]
 
+    async def _join_batch(self, request: VerificationRequest) -> ConsensusResult:
+        """
+        Add a request to the open batch for its target chains.
+
+        The batch closes when it reaches max_batch_size or when
+        batch_window_seconds have passed since its first request.
+
+        Args:
+            request: Verification request with target chains
+
+        Returns:
+            ConsensusResult: Result of the request within its batch
+        """
+        key = frozenset(request.target_chains)
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        batch = self._open_batches.setdefault(key, [])
+        batch.append((request, future))
+        if len(batch) >= self.max_batch_size:
+            self._close_batch(key)
+        elif len(batch) == 1:
+            self._batch_timers[key] = loop.call_later(
+                self.batch_window_seconds, self._close_batch, key
+            )
+
+        return await future
+
+    def _close_batch(self, key: frozenset[ChainType]) -> None:
+        """Start the round of an open batch."""
+        timer = self._batch_timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        batch = self._open_batches.pop(key, None)
+        if not batch:
+            return
+
+        task = asyncio.create_task(self._run_batch(batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(
+        self, batch: list[tuple[VerificationRequest, asyncio.Future]]
+    ) -> None:
+        """Run a batch round and hand each waiting request its result."""
+        try:
+            results = await self._run_verification_batch(
+                [request for request, _ in batch]
+            )
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+            raise
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def _run_verification_batch(
+        self, requests: list[VerificationRequest]
+    ) -> list[ConsensusResult]:
+        """
+        Run one verification, voting and aggregation round for a batch.
+
+        All requests target the same chains. Each chain verifies the whole
+        batch and submits a single vote; aggregation then runs per request
+        on that request's chain results, so scores and statuses match those
+        of individual rounds. Early termination and hedging apply to
+        individual rounds only.
+
+        Args:
+            requests: Requests of the batch
+
+        Returns:
+            List[ConsensusResult]: Results in request order
+        """
+        batch_id = str(uuid.uuid4())
+        start_time = datetime.utcnow()
+        self.stats["batches_verified"] += 1
+        self.stats["batched_requests"] += len(requests)
+
+        states = []
+        for request in requests:
+            self.stats["total_requests"] += 1
+            state = ConsensusState(
+                request_id=request.request_id,
+                request=request,
+                phase=ConsensusPhase.INITIALIZATION,
+                participating_chains=set(request.target_chains),
+                start_time=start_time,
+                timeout_time=start_time + timedelta(seconds=request.timeout_seconds),
+            )
+            self.active_requests[request.request_id] = state
+            states.append(state)
+
+        results: dict[str, ConsensusResult] = {}
+
+        try:
+            self.logger.info(
+                f"Starting batch {batch_id} of {len(requests)} requests "
+                f"across {len(requests[0].target_chains)} chains"
+            )
+
+            # Phase 1: Initialization and validation, shared by the batch
+            if not await self._initialize_consensus(states[0]):
+                return [
+                    self._create_failed_result(state, "Initialization failed")
+                    for state in states
+                ]
+            for state in states[1:]:
+                state.participating_chains = set(states[0].participating_chains)
+
+            # Phase 2: One verification task per chain for the whole batch
+            await self._execute_batch_verification(states)
+
+            min_required = max(1, len(states[0].participating_chains) // 2)
+            verified_states = []
+            for state in states:
+                if len(state.chain_results) < min_required:
+                    state.errors.append(
+                        f"Insufficient successful verifications: "
+                        f"{len(state.chain_results)} of "
+                        f"{len(state.participating_chains)}"
+                    )
+                    results[state.request_id] = self._create_failed_result(
+                        state, "Verification phase failed"
+                    )
+                else:
+                    verified_states.append(state)
+
+            # Phase 3: One vote per chain over the batch's Merkle root
+            if verified_states:
+                await self._execute_batch_voting(batch_id, verified_states)
+
+            # Phase 4: Aggregation per request
+            for state in verified_states:
+                if len(state.votes) < self.config.min_participating_chains:
+                    state.errors.append("Insufficient votes for consensus")
+                    results[state.request_id] = self._create_failed_result(
+                        state, "Voting phase failed"
+                    )
+                    continue
+
+                consensus_result = await self._aggregate_consensus(state)
+                execution_time = (datetime.utcnow() - start_time).total_seconds()
+                self._update_stats(consensus_result.overall_status, execution_time)
+                results[state.request_id] = consensus_result
+
+            self.logger.info(
+                f"Batch {batch_id} completed: {len(verified_states)} of "
+                f"{len(requests)} requests reached aggregation, "
+                f"Time={(datetime.utcnow() - start_time).total_seconds():.3f}s"
+            )
+
+            return [results[request.request_id] for request in requests]
+
+        except Exception as e:
+            self.logger.error(f"Consensus error for batch {batch_id}: {e}")
+            return [
+                results.get(state.request_id)
+                or self._create_failed_result(state, str(e))
+                for state in states
+            ]
+
+        finally:
+            for request in requests:
+                self.active_requests.pop(request.request_id, None)
+
     async def add_chain_adapter(self, adapter: IUniversalChainAdapter) -> bool:
         """
         Add blockchain adapter to consensus pool.
@@ -202,6 +523,29 @@ class MultiChainConsensusEngine(IConsensusEngine):
             self.logger.warning(f"Adapter for {chain_type.value} not found")
             return False
 
+    async def add_hedge_adapter(self, adapter: IUniversalChainAdapter) -> bool:
+        """
+        Add a secondary adapter that receives hedged verifications.
+
+        The secondary should reach the chain through a different endpoint
+        than the primary adapter of the same chain.
+
+        Args:
+            adapter: Secondary chain adapter
+
+        Returns:
+            bool: True if added successfully
+        """
+        if not adapter.is_connected:
+            self.logger.warning(
+                f"Hedge adapter for {adapter.chain_type.value} is not connected"
+            )
+            return False
+
+        self.hedge_adapters[adapter.chain_type] = adapter
+        self.logger.info(f"Added {adapter.chain_type.value} hedge adapter")
+        return True
+
     async def get_active_chains(self) -> list[ChainType]:
         """
         Get list of active blockchain adapters.
@@ -255,6 +599,11 @@ class MultiChainConsensusEngine(IConsensusEngine):
         """
         Execute verification across all participating chains in parallel.
 
+        Results are consumed as they arrive. Once the chains still pending
+        can no longer change the consensus status, the phase ends without
+        waiting for them, so latency follows the quorum-th fastest chain
+        rather than the slowest.
+
         Args:
             state: Consensus state
 
@@ -263,23 +612,23 @@ class MultiChainConsensusEngine(IConsensusEngine):
         """
         state.phase = ConsensusPhase.VERIFICATION
 
+        # Verifications still running; cancelled on the way out, whether by
+        # timeout, error or cancellation, unless handed to _release_stragglers
+        pending: dict[asyncio.Task, ChainType] = {}
+
         try:
             # Create verification tasks for each chain
-            tasks = []
-            chain_adapters = []
-
             for chain_type in state.participating_chains:
                 adapter = self.adapters.get(chain_type)
                 if adapter and adapter.is_connected:
                     task = asyncio.create_task(self._verify_on_chain(adapter, state))
-                    tasks.append(task)
-                    chain_adapters.append(adapter)
+                    pending[task] = chain_type
                 else:
                     self.logger.warning(
                         f"Adapter for {chain_type.value} not available or disconnected"
                     )
 
-            if not tasks:
+            if not pending:
                 state.errors.append("No valid chain adapters available")
                 return False
 
@@ -290,27 +639,45 @@ class MultiChainConsensusEngine(IConsensusEngine):
                 state.errors.append("Request timeout during verification phase")
                 return False
 
-            # Wait for all verifications to complete
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks, return_exceptions=True), timeout=timeout_seconds
-            )
-
-            # Process results
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout_seconds
+            min_required = max(1, len(state.participating_chains) // 2)
             successful_verifications = 0
 
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    chain_type = chain_adapters[i].chain_type
-                    self.logger.error(
-                        f"Verification failed on {chain_type.value}: {result}"
-                    )
-                    state.errors.append(f"{chain_type.value}: {result}")
-                else:
-                    successful_verifications += 1
+            while pending:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    state.errors.append("Verification phase timeout")
+                    return False
 
-            # Check if we have enough successful verifications
-            min_required = max(1, len(state.participating_chains) // 2)
+                done, _ = await asyncio.wait(
+                    pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    chain_type = pending.pop(task)
+                    error = task.exception()
+                    if error is not None:
+                        self.logger.error(
+                            f"Verification failed on {chain_type.value}: {error}"
+                        )
+                        state.errors.append(f"{chain_type.value}: {error}")
+                    else:
+                        state.chain_results[chain_type] = task.result()
+                        successful_verifications += 1
+
+                if (
+                    pending
+                    and successful_verifications >= min_required
+                    and successful_verifications >= self.config.min_participating_chains
+                ):
+                    status = self._decided_status(state, pending.values())
+                    if status is not None:
+                        self.stats["early_terminations"] += 1
+                        self._release_stragglers(pending, status)
+                        pending = {}
+                        break
 
+            # Check if we have enough successful verifications
             if successful_verifications < min_required:
                 state.errors.append(
                     f"Insufficient successful verifications: {successful_verifications} "
@@ -325,42 +692,166 @@ class MultiChainConsensusEngine(IConsensusEngine):
 
             return True
 
-        except TimeoutError:
-            state.errors.append("Verification phase timeout")
-            return False
         except Exception as e:
             state.errors.append(f"Verification phase error: {e}")
             return False
 
+        finally:
+            for task in pending:
+                task.cancel()
+
+    def _decided_status(
+        self, state: ConsensusState, pending_chains: Iterable[ChainType]
+    ) -> VerificationStatus | None:
+        """
+        Get the consensus status if pending chains can no longer change it.
+
+        A pending chain either fails, adding nothing, or adds its weight to
+        the total and possibly to the verified weight. Every outcome's score
+        therefore lies between all pending chains rejecting and all of them
+        verifying, so the status is decided when both bounds agree.
+
+        Args:
+            state: Consensus state with the results received so far
+            pending_chains: Chains whose verification is still running
+
+        Returns:
+            VerificationStatus: Decided status, or None if still open
+        """
+        total_weight = 0.0
+        verified_weight = 0.0
+        for chain_type, result in state.chain_results.items():
+            weight = self.config.chain_weights.get(chain_type, 1.0)
+            total_weight += weight
+            if result.verification_status == VerificationStatus.VERIFIED:
+                verified_weight += weight
+        if total_weight == 0:
+            return None
+
+        pending_weight = sum(
+            self.config.chain_weights.get(chain_type, 1.0)
+            for chain_type in pending_chains
+        )
+        threshold = state.request.consensus_threshold
+        lowest = self._consensus_status(
+            verified_weight / (total_weight + pending_weight), threshold
+        )
+        highest = self._consensus_status(
+            (verified_weight + pending_weight) / (total_weight + pending_weight),
+            threshold,
+        )
+        return lowest if lowest == highest else None
+
+    def _release_stragglers(
+        self, pending: dict[asyncio.Task, ChainType], status: VerificationStatus
+    ) -> None:
+        """
+        Stop waiting for verifications that cannot change the outcome.
+
+        Args:
+            pending: Running verification tasks and their chains
+            status: Consensus status already decided without them
+        """
+        for task, chain_type in pending.items():
+            if self.cancel_stragglers:
+                task.cancel()
+                self.stats["stragglers_cancelled"] += 1
+            else:
+                self._straggler_tasks.add(task)
+                task.add_done_callback(
+                    lambda done, s=status: self._record_straggler(done, s)
+                )
+            self.logger.debug(
+                f"Consensus decided without {chain_type.value} verification"
+            )
+
+    def _record_straggler(self, task: asyncio.Task, status: VerificationStatus) -> None:
+        """Record a verification that finished after consensus was decided."""
+        self._straggler_tasks.discard(task)
+        if task.cancelled() or task.exception() is not None:
+            return
+
+        self.stats["late_results"] += 1
+        verified = task.result().verification_status == VerificationStatus.VERIFIED
+        if verified != (status == VerificationStatus.VERIFIED):
+            self.stats["late_disagreements"] += 1
+
     async def _verify_on_chain(
         self, adapter: IUniversalChainAdapter, state: ConsensusState
-    ) -> None:
+    ) -> ChainVerificationResult:
         """
         Perform verification on a single chain.
 
+        If the chain has not answered by its observed p95 latency and the
+        hedge budget allows, the request is also sent to the chain's hedge
+        adapter, or again to the same adapter, and the first successful
+        answer is used.
+
         Args:
             adapter: Chain adapter to use
             state: Consensus state
+
+        Returns:
+            ChainVerificationResult: Verification result of the chain
         """
-        try:
-            result = await adapter.verify_ai_output(
-                ai_agent_id=state.request.ai_agent_id,
-                verification_data=state.request.verification_data,
-            )
+        chain_type = adapter.chain_type
+        latency = self._chain_latency[chain_type]
+        self.hedge_budget.record_attempt()
 
-            state.chain_results[adapter.chain_type] = result
+        started = time.monotonic()
+        primary = asyncio.create_task(self._request_verification(adapter, state))
+        tasks = {primary}
+        try:
+            if len(latency) >= self.hedge_min_samples:
+                hedge_after = latency.percentile(self.hedge_percentile)
+                done, _ = await asyncio.wait(tasks, timeout=hedge_after)
+                if not done and self.hedge_budget.try_acquire():
+                    hedge_adapter = self.hedge_adapters.get(chain_type, adapter)
+                    tasks.add(
+                        asyncio.create_task(
+                            self._request_verification(hedge_adapter, state)
+                        )
+                    )
+                    self.stats["hedged_verifications"] += 1
 
-            self.logger.debug(
-                f"Verification completed on {adapter.chain_type.value}: "
-                f"Status={result.verification_status.value}, "
-                f"Confidence={result.confidence_score:.3f}"
-            )
+            # First successful answer wins; fail only if every request fails
+            error = None
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is not None:
+                        error = task.exception()
+                        continue
+
+                    result = task.result()
+                    latency.record(time.monotonic() - started)
+                    if task is not primary:
+                        self.stats["hedge_wins"] += 1
+                    self.logger.debug(
+                        f"Verification completed on {chain_type.value}: "
+                        f"Status={result.verification_status.value}, "
+                        f"Confidence={result.confidence_score:.3f}"
+                    )
+                    return result
+            raise error
 
         except Exception as e:
-            self.logger.error(
-                f"Chain verification error on {adapter.chain_type.value}: {e}"
-            )
+            self.logger.error(f"Chain verification error on {chain_type.value}: {e}")
             raise
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _request_verification(
+        self, adapter: IUniversalChainAdapter, state: ConsensusState
+    ) -> ChainVerificationResult:
+        """Send one verification request to an adapter."""
+        return await adapter.verify_ai_output(
+            ai_agent_id=state.request.ai_agent_id,
+            verification_data=state.request.verification_data,
+        )
 
     async def _execute_consensus_voting(self, state: ConsensusState) -> bool:
         """
@@ -429,6 +920,220 @@ class MultiChainConsensusEngine(IConsensusEngine):
             state.errors.append(f"Voting phase error: {e}")
             return False
 
+    async def _execute_batch_verification(self, states: list[ConsensusState]) -> None:
+        """
+        Verify a batch on all participating chains in parallel.
+
+        Each chain's results are recorded on the states of the requests it
+        verified; a chain that fails or misses the earliest deadline of the
+        batch contributes no results. Chain tasks still running when this
+        returns or is cancelled are cancelled.
+
+        Args:
+            states: Consensus states of the batch
+        """
+        for state in states:
+            state.phase = ConsensusPhase.VERIFICATION
+
+        requests = [state.request for state in states]
+        pending: dict[asyncio.Task, ChainType] = {}
+
+        for chain_type in states[0].participating_chains:
+            adapter = self.adapters.get(chain_type)
+            if adapter and adapter.is_connected:
+                task = asyncio.create_task(
+                    self._verify_batch_on_chain(adapter, requests)
+                )
+                pending[task] = chain_type
+            else:
+                self.logger.warning(
+                    f"Adapter for {chain_type.value} not available or disconnected"
+                )
+
+        if not pending:
+            return
+
+        deadline = min(state.timeout_time for state in states)
+        timeout_seconds = max(0.0, (deadline - datetime.utcnow()).total_seconds())
+        try:
+            done, not_done = await asyncio.wait(pending, timeout=timeout_seconds)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        for task in not_done:
+            for state in states:
+                state.errors.append(f"{pending[task].value}: verification timeout")
+
+        for task in done:
+            chain_type = pending[task]
+            error = task.exception()
+            if error is not None:
+                self.logger.error(
+                    f"Batch verification failed on {chain_type.value}: {error}"
+                )
+                for state in states:
+                    state.errors.append(f"{chain_type.value}: {error}")
+                continue
+
+            for state, result in zip(states, task.result(), strict=True):
+                if isinstance(result, Exception):
+                    state.errors.append(f"{chain_type.value}: {result}")
+                else:
+                    state.chain_results[chain_type] = result
+
+    async def _verify_batch_on_chain(
+        self, adapter: IUniversalChainAdapter, requests: list[VerificationRequest]
+    ) -> list[ChainVerificationResult | Exception]:
+        """
+        Verify a batch of requests on a single chain.
+
+        Adapters implementing ``verify_ai_output_batch`` receive the batch
+        in one call; others get one call per request, issued concurrently.
+        Requests a batch call returns no result for fail with an error.
+
+        Args:
+            adapter: Chain adapter to use
+            requests: Requests of the batch
+
+        Returns:
+            List: Result of each request, or the exception it raised
+
+        Raises:
+            ValueError: If a batch call returns more results than requests
+        """
+        # Looked up on the class so adapters without it fall back cleanly
+        if getattr(type(adapter), "verify_ai_output_batch", None) is not None:
+            items = [(req.ai_agent_id, req.verification_data) for req in requests]
+            results = list(await adapter.verify_ai_output_batch(items))
+            if len(results) > len(requests):
+                raise ValueError(
+                    f"Batch verification returned {len(results)} results "
+                    f"for {len(requests)} requests"
+                )
+            missing = ValueError("No result returned for request in batch")
+            results.extend([missing] * (len(requests) - len(results)))
+            return results
+
+        return await asyncio.gather(
+            *(
+                adapter.verify_ai_output(
+                    ai_agent_id=request.ai_agent_id,
+                    verification_data=request.verification_data,
+                )
+                for request in requests
+            ),
+            return_exceptions=True,
+        )
+
+    async def _execute_batch_voting(
+        self, batch_id: str, states: list[ConsensusState]
+    ) -> None:
+        """
+        Submit one consensus vote per chain for a batch.
+
+        A chain's vote carries the Merkle root of its verdicts on the
+        requests it verified. Each of those requests records the vote with
+        its leaf index, so its verdict can later be proven against the root.
+
+        Args:
+            batch_id: Identifier the votes are submitted under
+            states: Consensus states that passed verification
+        """
+        for state in states:
+            state.phase = ConsensusPhase.VOTING
+
+        voting_tasks = []
+
+        for chain_type in states[0].participating_chains:
+            adapter = self.adapters.get(chain_type)
+            members = [state for state in states if chain_type in state.chain_results]
+            if not members or not (adapter and adapter.is_connected):
+                continue
+
+            merkle_root = self._merkle_root(
+                [
+                    self._batch_leaf(state.request_id, state.chain_results[chain_type])
+                    for state in members
+                ]
+            ).hex()
+            vote_data = {
+                "merkle_root": merkle_root,
+                "batch_size": len(members),
+                "chain_weight": self.config.chain_weights.get(chain_type, 1.0),
+                "voter_id": f"{chain_type.value}_consensus_node",
+            }
+
+            task = asyncio.create_task(
+                adapter.submit_consensus_vote(batch_id, vote_data)
+            )
+            voting_tasks.append((chain_type, task, members, merkle_root))
+
+        for chain_type, task, members, merkle_root in voting_tasks:
+            try:
+                tx_hash = await task
+            except Exception as e:
+                self.logger.error(f"Voting failed on {chain_type.value}: {e}")
+                for state in members:
+                    state.errors.append(f"Voting error on {chain_type.value}: {e}")
+                continue
+
+            submitted_at = datetime.utcnow()
+            for index, state in enumerate(members):
+                state.votes[chain_type] = {
+                    "transaction_hash": tx_hash,
+                    "submitted_at": submitted_at,
+                    "batch_id": batch_id,
+                    "merkle_root": merkle_root,
+                    "leaf_index": index,
+                }
+
+        self.logger.info(
+            f"Batch voting completed with {len(voting_tasks)} votes "
+            f"for {len(states)} requests"
+        )
+
+    @staticmethod
+    def _batch_leaf(request_id: str, result: ChainVerificationResult) -> bytes:
+        """
+        Hash a chain's verdict on one request into a Merkle leaf.
+
+        Args:
+            request_id: Request the verdict belongs to
+            result: Chain verification result
+
+        Returns:
+            bytes: SHA-256 leaf hash
+        """
+        leaf = (
+            f"{request_id}|{result.verification_status.value}|"
+            f"{result.confidence_score!r}"
+        )
+        return hashlib.sha256(leaf.encode("utf-8")).digest()
+
+    @staticmethod
+    def _merkle_root(leaves: list[bytes]) -> bytes:
+        """
+        Compute the SHA-256 Merkle root of a list of leaf hashes.
+
+        A level with an odd number of nodes pairs its last node with itself.
+
+        Args:
+            leaves: Leaf hashes in batch order
+
+        Returns:
+            bytes: Root hash
+        """
+        level = leaves
+        while len(level) > 1:
+            if len(level) % 2:
+                level = level + [level[-1]]
+            level = [
+                hashlib.sha256(level[i] + level[i + 1]).digest()
+                for i in range(0, len(level), 2)
+            ]
+        return level[0]
+
     async def _execute_advanced_consensus_voting(self, state: ConsensusState) -> bool:
         """
         Execute advanced consensus voting using BFT algorithms.
@@ -541,13 +1246,11 @@ class MultiChainConsensusEngine(IConsensusEngine):
             average_confidence = confidence_sum / total_weight
 
             # Determine overall status
-            if consensus_score >= state.request.consensus_threshold:
-                overall_status = VerificationStatus.VERIFIED
+            overall_status = self._consensus_status(
+                consensus_score, state.request.consensus_threshold
+            )
+            if overall_status == VerificationStatus.VERIFIED:
                 self.stats["successful_consensus"] += 1
-            elif consensus_score >= 0.3:  # Partial consensus
-                overall_status = VerificationStatus.PENDING
-            else:
-                overall_status = VerificationStatus.REJECTED
 
             # Detect Byzantine faults
             if self._detect_byzantine_faults(state.chain_results):
@@ -582,6 +1285,26 @@ class MultiChainConsensusEngine(IConsensusEngine):
             state.errors.append(f"Aggregation error: {e}")
             return self._create_failed_result(state, str(e))
 
+    @staticmethod
+    def _consensus_status(
+        consensus_score: float, threshold: float
+    ) -> VerificationStatus:
+        """
+        Map a weighted consensus score to an overall status.
+
+        Args:
+            consensus_score: Verified share of the responding chains' weight
+            threshold: Share required for verification
+
+        Returns:
+            VerificationStatus: Overall status for the score
+        """
+        if consensus_score >= threshold:
+            return VerificationStatus.VERIFIED
+        if consensus_score >= 0.3:  # Partial consensus
+            return VerificationStatus.PENDING
+        return VerificationStatus.REJECTED
+
     def _detect_byzantine_faults(
         self, results: dict[ChainType, ChainVerificationResult]
     ) -> bool:
@@ -669,6 +1392,16 @@ class MultiChainConsensusEngine(IConsensusEngine):
             "success_rate": success_rate,
             "average_consensus_time": self.stats["average_consensus_time"],
             "byzantine_faults_detected": self.stats["byzantine_faults_detected"],
+            "early_terminations": self.stats["early_terminations"],
+            "stragglers_cancelled": self.stats["stragglers_cancelled"],
+            "late_results": self.stats["late_results"],
+            "late_disagreements": self.stats["late_disagreements"],
+            "hedged_verifications": self.stats["hedged_verifications"],
+            "hedge_wins": self.stats["hedge_wins"],
+            "hedge_budget": self.hedge_budget.get_stats(),
+            "deduplicated_requests": self.stats["deduplicated_requests"],
+            "batches_verified": self.stats["batches_verified"],
+            "batched_requests": self.stats["batched_requests"],
             "active_adapters": len(self.adapters),
             "active_requests": len(self.active_requests),
         }
@@ -7,7 +7,6 @@ Bridge adapter implementation for Ethereum-based networks
 """
 
 import hashlib
-import json
 import logging
 from datetime import datetime
 from typing import Any
@@ -19,6 +18,7 @@ from bridge.interfaces import (
     BridgeMetrics,
     IBridgeAdapter,
 )
+from bridge.wire_format import encode_message, encode_message_batch
 from core.interfaces import ChainType
 
 
@@ -38,11 +38,13 @@ class EthereumBridgeAdapter(IBridgeAdapter):
         self.outbound_messages: dict[str, BridgeMessage] = {}
         self.inbound_messages: dict[str, BridgeMessage] = {}
         self.delivery_confirmations: dict[str, bool] = {}
+        self.message_transactions: dict[str, str] = {}  # message_id -> tx hash
 
         # Configuration
         self.confirmation_blocks = 12  # Number of blocks for confirmation
         self.gas_limit = 500000
         self.max_retry_attempts = 3
+        self.batch_size_limit = 64  # Messages packed into one transaction
 
         self.logger = logging.getLogger(f"{__name__}.eth_bridge")
 
@@ -54,6 +56,7 @@ class EthereumBridgeAdapter(IBridgeAdapter):
             "total_received": 0,
             "average_latency_ms": 0.0,
             "total_gas_used": 0,
+            "batches_transmitted": 0,
         }
 
     @property
@@ -66,6 +69,11 @@ class EthereumBridgeAdapter(IBridgeAdapter):
         """Check if the bridge adapter is operational."""
         return self.ethereum_adapter.is_connected
 
+    @property
+    def max_batch_size(self) -> int:
+        """Return the most messages packed into one transaction."""
+        return self.batch_size_limit
+
     async def initialize(self, config: dict[str, Any]) -> bool:
         """
         Initialize the bridge adapter with configuration.
@@ -85,6 +93,7 @@ class EthereumBridgeAdapter(IBridgeAdapter):
             self.max_retry_attempts = config.get(
                 "max_retry_attempts", self.max_retry_attempts
             )
+            self.batch_size_limit = config.get("max_batch_size", self.batch_size_limit)
 
             # Ensure underlying adapter is connected
             if not self.ethereum_adapter.is_connected:
@@ -125,6 +134,7 @@ class EthereumBridgeAdapter(IBridgeAdapter):
             # For Phase 1, simulate transaction submission
             # In production, this would submit to the actual blockchain
             tx_hash = self._simulate_transaction_submission(tx_data)
+            self.message_transactions[message.message_id] = tx_hash
 
             # Update message status
             message.status = BridgeMessageStatus.TRANSMITTED
@@ -150,6 +160,71 @@ class EthereumBridgeAdapter(IBridgeAdapter):
             message.error_message = str(e)
             return False
 
+    async def transmit_batch(self, messages: list[BridgeMessage]) -> list[bool]:
+        """
+        Transmit several messages in a single transaction.
+
+        Args:
+            messages: Bridge messages to transmit
+
+        Returns:
+            List[bool]: Transmission success for each message, in order
+        """
+        if not self.is_operational:
+            self.logger.error("Bridge adapter not operational")
+            return [False] * len(messages)
+
+        results = []
+        for offset in range(0, len(messages), self.batch_size_limit):
+            chunk = messages[offset : offset + self.batch_size_limit]
+            results.extend(await self._transmit_chunk(chunk))
+        return results
+
+    async def _transmit_chunk(self, messages: list[BridgeMessage]) -> list[bool]:
+        """
+        Submit one transaction carrying a batch of messages.
+
+        Args:
+            messages: Messages that fit in one transaction
+
+        Returns:
+            List[bool]: Transmission success for each message, in order
+        """
+        try:
+            start_time = datetime.utcnow()
+
+            for message in messages:
+                self.outbound_messages[message.message_id] = message
+
+            # One transaction for the whole batch
+            tx_data = self._encode_bridge_batch(messages)
+            tx_hash = self._simulate_transaction_submission(tx_data)
+
+            for message in messages:
+                message.status = BridgeMessageStatus.TRANSMITTED
+                self.message_transactions[message.message_id] = tx_hash
+
+            latency_ms = (datetime.utcnow() - start_time).total_seconds() * 1000
+
+            self._metrics["total_transmitted"] += len(messages)
+            self._metrics["successful_transmissions"] += len(messages)
+            self._metrics["batches_transmitted"] += 1
+            self._update_average_latency(latency_ms)
+
+            self.logger.info(
+                f"Transmitted batch of {len(messages)} messages with tx hash {tx_hash}"
+            )
+            return [True] * len(messages)
+
+        except Exception as e:
+            self.logger.error(f"Failed to transmit batch of {len(messages)}: {e}")
+            self._metrics["total_transmitted"] += len(messages)
+            self._metrics["failed_transmissions"] += len(messages)
+            for message in messages:
+                message.status = BridgeMessageStatus.FAILED
+                message.error_message = str(e)
+            return [False] * len(messages)
+
     async def receive_messages(
         self, chain_type: ChainType, timeout_seconds: int = 30
     ) -> list[BridgeMessage]:
@@ -240,6 +315,52 @@ class EthereumBridgeAdapter(IBridgeAdapter):
             )
             return False
 
+    async def confirm_batch(
+        self, message_ids: list[str], target_chain: ChainType
+    ) -> list[bool]:
+        """
+        Confirm delivery of several messages, checking each transaction once.
+
+        Args:
+            message_ids: Message identifiers
+            target_chain: Target blockchain
+
+        Returns:
+            List[bool]: Delivery confirmed for each message, in order
+        """
+        if not self.is_operational:
+            return [False] * len(message_ids)
+
+        try:
+            tx_confirmations: dict[str, bool] = {}
+            results = []
+            for message_id in message_ids:
+                if message_id in self.delivery_confirmations:
+                    results.append(self.delivery_confirmations[message_id])
+                    continue
+
+                # Messages in the same transaction share one confirmation check
+                tx_hash = self.message_transactions.get(message_id, message_id)
+                if tx_hash not in tx_confirmations:
+                    tx_confirmations[tx_hash] = (
+                        await self._check_transaction_confirmation(
+                            message_id, target_chain
+                        )
+                    )
+                confirmed = tx_confirmations[tx_hash]
+                self.delivery_confirmations[message_id] = confirmed
+                results.append(confirmed)
+
+            self.logger.debug(
+                f"Confirmed {sum(results)}/{len(message_ids)} messages "
+                f"in {len(tx_confirmations)} transactions on {target_chain.value}"
+            )
+            return results
+
+        except Exception as e:
+            self.logger.error(f"Failed to confirm delivery of batch: {e}")
+            return [False] * len(message_ids)
+
     async def get_bridge_metrics(
         self, source_chain: ChainType, target_chain: ChainType
     ) -> BridgeMetrics:
@@ -295,21 +416,19 @@ class EthereumBridgeAdapter(IBridgeAdapter):
         Returns:
             bytes: Encoded message data
         """
-        # Create a deterministic encoding of the message
-        message_data = {
-            "message_id": message.message_id,
-            "message_type": message.message_type.value,
-            "source_chain": message.source_chain.value,
-            "target_chain": message.target_chain.value,
-            "payload": message.payload,
-            "timestamp": message.timestamp.isoformat(),
-            "timeout_seconds": message.timeout_seconds,
-            "priority": message.priority,
-        }
+        return encode_message(message)
 
-        # Convert to JSON and encode
-        json_data = json.dumps(message_data, sort_keys=True)
-        return json_data.encode("utf-8")
+    def _encode_bridge_batch(self, messages: list[BridgeMessage]) -> bytes:
+        """
+        Encode several bridge messages as one transaction payload.
+
+        Args:
+            messages: Messages to encode
+
+        Returns:
+            bytes: Encoded batch data
+        """
+        return encode_message_batch(messages)
 
     def _simulate_transaction_submission(self, tx_data: bytes) -> str:
         """
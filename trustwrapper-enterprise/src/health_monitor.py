@@ -140,6 +140,9 @@ class RouteHealthTracker:
         self.latency_samples.append((timestamp, latency_ms))
         if len(self.latency_samples) > self.window_size:
             self.latency_samples.pop(0)
+        self.error_samples.append((timestamp, success))
+        if len(self.error_samples) > self.window_size:
+            self.error_samples.pop(0)
 
         # Update counters
         self.current_metrics.total_messages += 1
@@ -170,6 +173,27 @@ class RouteHealthTracker:
 
         self._update_metrics()
 
+    def get_error_rate(
+        self, since: float = 0.0, window_seconds: float = 60.0
+    ) -> tuple[float, int]:
+        """
+        Get the error rate of recent messages.
+
+        Args:
+            since: Only count messages recorded after this Unix time
+            window_seconds: Only count messages from this many seconds back
+
+        Returns:
+            Tuple[float, int]: Error rate and number of messages counted
+        """
+        start = max(since, time.time() - window_seconds)
+        outcomes = [
+            success for timestamp, success in self.error_samples if timestamp > start
+        ]
+        if not outcomes:
+            return 0.0, 0
+        return outcomes.count(False) / len(outcomes), len(outcomes)
+
     def mark_route_down(self) -> None:
         """Mark the route as down."""
         if self.downtime_start is None:
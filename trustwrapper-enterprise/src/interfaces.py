@@ -46,7 +46,7 @@ class BridgeConsensusType(Enum):
     THRESHOLD_SIGNATURE = "threshold_signature"
 
 
-@dataclass
+@dataclass(slots=True)
 class BridgeMessage:
     """Cross-chain bridge message structure."""
 
@@ -171,6 +171,30 @@ class IBridgeAdapter(ABC):
         """
         pass
 
+    @property
+    def max_batch_size(self) -> int:
+        """
+        Return the most messages the adapter can send in one transmission.
+
+        Adapters that pack several messages into one transaction override
+        this together with ``transmit_batch`` and ``confirm_batch``.
+        """
+        return 1
+
+    async def transmit_batch(self, messages: list[BridgeMessage]) -> list[bool]:
+        """
+        Transmit several messages to the same target blockchain.
+
+        The default transmits the messages one at a time.
+
+        Args:
+            messages: Bridge messages to transmit
+
+        Returns:
+            List[bool]: Transmission success for each message, in order
+        """
+        return [await self.transmit_message(message) for message in messages]
+
     @abstractmethod
     async def receive_messages(
         self, chain_type: ChainType, timeout_seconds: int = 30
@@ -203,6 +227,26 @@ class IBridgeAdapter(ABC):
         """
         pass
 
+    async def confirm_batch(
+        self, message_ids: list[str], target_chain: ChainType
+    ) -> list[bool]:
+        """
+        Confirm delivery of several messages.
+
+        The default confirms the messages one at a time.
+
+        Args:
+            message_ids: Message identifiers
+            target_chain: Target blockchain
+
+        Returns:
+            List[bool]: Delivery confirmed for each message, in order
+        """
+        return [
+            await self.confirm_message_delivery(message_id, target_chain)
+            for message_id in message_ids
+        ]
+
     @abstractmethod
     async def get_bridge_metrics(
         self, source_chain: ChainType, target_chain: ChainType
@@ -7,10 +7,15 @@ Handles message routing, queuing, delivery confirmation, and error recovery.
 """
 
 import asyncio
+import heapq
+import itertools
 import logging
+import time
 import uuid
+from collections import deque
 from datetime import datetime
 
+from bridge.health_monitor import RouteHealthTracker
 from bridge.interfaces import (
     BridgeMessage,
     BridgeMessageStatus,
@@ -18,38 +23,267 @@ from bridge.interfaces import (
     BridgeRoute,
     IBridgeAdapter,
 )
+from bridge.message_wal import MessageWAL
+from bridge.timer_wheel import TimerHandle, TimerWheel
 from core.interfaces import ChainType
+from core.resilience import (
+    CircuitBreaker,
+    CircuitState,
+    DecorrelatedJitterBackoff,
+    RetryBudget,
+)
+
+# Priority used when a caller does not give one; consensus traffic first
+DEFAULT_MESSAGE_PRIORITIES = {
+    BridgeMessageType.CONSENSUS_VOTE: 3,
+    BridgeMessageType.CONSENSUS_RESULT: 3,
+    BridgeMessageType.VERIFICATION_REQUEST: 2,
+    BridgeMessageType.VERIFICATION_RESPONSE: 2,
+    BridgeMessageType.HEALTH_CHECK: 1,
+    BridgeMessageType.SYNCHRONIZATION: 0,
+}
+
+
+# Message record states
+RECORD_QUEUED = 0  # Waiting in a route queue
+RECORD_PROCESSING = 1  # Dequeued by a worker
+RECORD_IDLE = 2  # Outside the queue, e.g. waiting for a retry
+RECORD_FINISHED = 3  # Completed, failed or timed out; no longer indexed
+
+
+class MessageRecord:
+    """
+    Compact bookkeeping for one live message.
+
+    Holds everything the broker tracks per message besides the message
+    itself: queue state, a monotonic deadline and the retry and expiry
+    timers. Queues, heaps and timers refer to the record, never to the
+    message ID string.
+    """
+
+    __slots__ = (
+        "message",
+        "state",
+        "priority",
+        "deadline",
+        "sequence",
+        "in_deadline_heap",
+        "expiry_timer",
+        "retry_timer",
+        "retry_delay",
+    )
+
+    def __init__(self, message: BridgeMessage, deadline: float):
+        self.message = message
+        self.state = RECORD_IDLE
+        self.priority = message.priority
+        self.deadline = deadline  # time.monotonic() at which it expires
+        self.sequence = -1  # Queue position of the current enqueue
+        self.in_deadline_heap = False
+        self.expiry_timer: TimerHandle | None = None
+        self.retry_timer: TimerHandle | None = None
+        self.retry_delay: float | None = None  # Last backoff delay used
+
+    def __lt__(self, other: "MessageRecord") -> bool:
+        return self.deadline < other.deadline
+
+
+class MessageTable:
+    """
+    Live message records, indexed once by message ID.
+
+    Finished messages are dropped from the index; only their final status
+    is kept, for the most recent ``finished_limit`` messages, so status
+    lookups keep working without holding on to payloads.
+    """
+
+    def __init__(self, finished_limit: int = 10000):
+        self.finished_limit = finished_limit
+        self._records: dict[str, MessageRecord] = {}
+        self._finished: dict[str, BridgeMessageStatus] = {}  # Insertion ordered
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def __contains__(self, message_id: str) -> bool:
+        return message_id in self._records
+
+    def add(self, message: BridgeMessage) -> MessageRecord:
+        """
+        Get the record of a message, creating it on first use.
+
+        Args:
+            message: Message to track
+
+        Returns:
+            MessageRecord: Record for the message
+        """
+        record = self._records.get(message.message_id)
+        if record is None:
+            elapsed = (datetime.utcnow() - message.timestamp).total_seconds()
+            deadline = time.monotonic() + message.timeout_seconds - elapsed
+            record = MessageRecord(message, deadline)
+            self._records[message.message_id] = record
+        return record
+
+    def get(self, message_id: str) -> MessageRecord | None:
+        """Get the record of a live message."""
+        return self._records.get(message_id)
+
+    def release(self, message_id: str) -> None:
+        """
+        Drop a finished message, keeping only its final status.
+
+        Args:
+            message_id: Message identifier
+        """
+        record = self._records.pop(message_id, None)
+        if record is None:
+            return
+        record.state = RECORD_FINISHED
+        self._finished[message_id] = record.message.status
+        if len(self._finished) > self.finished_limit:
+            del self._finished[next(iter(self._finished))]
+
+    def get_status(self, message_id: str) -> BridgeMessageStatus | None:
+        """Get the status of a live or recently finished message."""
+        record = self._records.get(message_id)
+        if record is not None:
+            return record.message.status
+        return self._finished.get(message_id)
 
 
 class MessageQueue:
-    """Thread-safe message queue for cross-chain operations."""
+    """
+    Priority-aware message queue for cross-chain operations.
+
+    Messages are kept in one FIFO per priority level. Levels are served by
+    weighted fair (stride) scheduling: a level with twice the weight gets
+    twice the dequeues while both are backlogged, and every backlogged level
+    is served eventually, so low priorities cannot starve. Messages within
+    ``deadline_margin`` seconds of their timeout jump ahead of the fair
+    schedule, earliest deadline first.
+
+    Per-message state lives in a ``MessageTable``, which route queues of a
+    broker share. With a write-ahead log attached, enqueues, retries and
+    completions are logged so unfinished messages can be restored after a
+    restart.
+    """
 
-    def __init__(self, max_size: int = 10000):
+    def __init__(
+        self,
+        max_size: int = 10000,
+        priority_weights: dict[int, float] | None = None,
+        deadline_margin: float = 10.0,
+        wal: MessageWAL | None = None,
+        table: MessageTable | None = None,
+    ):
         self.max_size = max_size
-        self._queue = asyncio.Queue(maxsize=max_size)
-        self._pending = {}  # message_id -> BridgeMessage
-        self._processing = set()  # Set of message_ids being processed
+        self.priority_weights = priority_weights or {}
+        self.deadline_margin = deadline_margin
+        self.wal = wal
+        self.table = table if table is not None else MessageTable()
+
+        # FIFO entries are (sequence, record); an entry is stale once its
+        # record left the queue or was queued again under a new sequence
+        self._levels: dict[int, deque[tuple[int, MessageRecord]]] = {}
+        self._level_sizes: dict[int, int] = {}
+        self._level_stale: dict[int, int] = {}
+        self._level_pass: dict[int, float] = {}
+        self._virtual_time = 0.0
+        # Heap by deadline; records no longer queued are skipped lazily. A
+        # deadline never changes, so a requeued record reuses its old entry.
+        self._deadlines: list[MessageRecord] = []
+        self._size = 0
+        self._reserved = 0  # Slots held by enqueues waiting on the WAL
+        self._sequence = itertools.count()
+        self._not_empty = asyncio.Event()
+        self._deadline_promotions = 0
+
+        self._pending_count = 0  # Enqueued and not yet completed
+        self._processing_count = 0  # Dequeued and not yet completed
         self.logger = logging.getLogger(f"{__name__}.queue")
 
-    async def enqueue(self, message: BridgeMessage) -> bool:
+    def priority_weight(self, priority: int) -> float:
+        """
+        Get the scheduling weight of a priority level.
+
+        Args:
+            priority: Message priority (higher = more urgent)
+
+        Returns:
+            float: Relative share of dequeues for the level
+        """
+        if priority in self.priority_weights:
+            return self.priority_weights[priority]
+        return float(2 ** max(0, min(priority, 10)))
+
+    async def enqueue(self, message: BridgeMessage, log: bool = True) -> bool:
         """
         Add message to queue.
 
         Args:
             message: Message to enqueue
+            log: Whether to write the message to the WAL (False on replay)
 
         Returns:
             bool: True if enqueued successfully
         """
         try:
-            if self._queue.full():
+            if self._size + self._reserved >= self.max_size:
                 self.logger.warning(
                     f"Message queue full, dropping message {message.message_id}"
                 )
                 return False
 
-            await self._queue.put(message)
-            self._pending[message.message_id] = message
+            record = self.table.get(message.message_id)
+            if record is not None and record.state == RECORD_QUEUED:
+                return True
+
+            # Log before publishing: once queued, a worker may deliver the
+            # message, so it must not be handed out if the write fails
+            if self.wal is not None and log:
+                self.wal.append_enqueue(message)
+                if self.wal.sync_commit:
+                    self._reserved += 1
+                    try:
+                        await self.wal.commit()
+                    except Exception:
+                        if record is None:
+                            # The WAL writes the record again later, so
+                            # cancel it or replay would restore the message
+                            self.wal.append_complete(message.message_id)
+                        raise
+                    finally:
+                        self._reserved -= 1
+
+            new = message.message_id not in self.table
+            record = self.table.add(message)
+            if record.state == RECORD_QUEUED:
+                return True
+            if new:
+                self._pending_count += 1
+
+            record.state = RECORD_QUEUED
+            record.sequence = next(self._sequence)
+            priority = record.priority
+            if not self._level_sizes.get(priority):
+                # A level that was idle must not bank credit from the past
+                self._levels.setdefault(priority, deque())
+                self._level_pass[priority] = max(
+                    self._level_pass.get(priority, 0.0), self._virtual_time
+                )
+            self._levels[priority].append((record.sequence, record))
+            self._level_sizes[priority] = self._level_sizes.get(priority, 0) + 1
+
+            if not record.in_deadline_heap:
+                record.in_deadline_heap = True
+                heapq.heappush(self._deadlines, record)
+            if len(self._deadlines) > 2 * self._size + 1024:
+                self._compact_deadlines()
+
+            self._size += 1
+            self._not_empty.set()
 
             self.logger.debug(
                 f"Enqueued message {message.message_id} ({message.message_type.value})"
@@ -70,16 +304,58 @@ class MessageQueue:
         Returns:
             BridgeMessage: Next message or None if timeout
         """
+        messages = await self.dequeue_many(1, max_wait=timeout)
+        return messages[0] if messages else None
+
+    async def wait_for_messages(self) -> None:
+        """Wait, without a timer, until at least one message is queued."""
+        while not self._size:
+            self._not_empty.clear()
+            await self._not_empty.wait()
+
+    async def dequeue_many(
+        self, max_items: int, max_wait: float | None = None
+    ) -> list[BridgeMessage]:
+        """
+        Get up to ``max_items`` messages in one call.
+
+        Waits until at least one message is queued, then takes whatever is
+        available up to ``max_items`` without waiting further. Without
+        ``max_wait`` the wait is purely event-driven, with no timer.
+
+        Args:
+            max_items: Maximum number of messages to return
+            max_wait: Maximum time to wait for the first message; None waits
+                indefinitely, 0 returns immediately
+
+        Returns:
+            List[BridgeMessage]: Messages in dequeue order, empty on timeout
+        """
         try:
-            message = await asyncio.wait_for(self._queue.get(), timeout=timeout)
-            self._processing.add(message.message_id)
-            return message
+            while not self._size:
+                if max_wait is not None and max_wait <= 0:
+                    return []
+                self._not_empty.clear()
+                if max_wait is None:
+                    await self._not_empty.wait()
+                else:
+                    await asyncio.wait_for(self._not_empty.wait(), timeout=max_wait)
+                    if not self._size:
+                        return []  # Taken by another consumer
+
+            messages = []
+            for _ in range(min(max_items, self._size)):
+                record = self._pop_next()
+                record.state = RECORD_PROCESSING
+                messages.append(record.message)
+            self._processing_count += len(messages)
+            return messages
 
         except TimeoutError:
-            return None
+            return []
         except Exception as e:
-            self.logger.error(f"Failed to dequeue message: {e}")
-            return None
+            self.logger.error(f"Failed to dequeue messages: {e}")
+            return []
 
     async def mark_completed(self, message_id: str, success: bool) -> None:
         """
@@ -89,29 +365,266 @@ class MessageQueue:
             message_id: Message identifier
             success: Whether processing was successful
         """
-        self._processing.discard(message_id)
-
-        if message_id in self._pending:
-            message = self._pending[message_id]
+        record = self.table.get(message_id)
+        if record is not None:
+            if record.state == RECORD_QUEUED:
+                self.remove(message_id)
+            elif record.state == RECORD_PROCESSING:
+                self._processing_count -= 1
+            self._pending_count -= 1
+
+            message = record.message
             if success:
                 message.status = BridgeMessageStatus.CONFIRMED
-            else:
+            elif message.status != BridgeMessageStatus.TIMEOUT:
                 message.status = BridgeMessageStatus.FAILED
+            self.table.release(message_id)
+
+        if self.wal is not None:
+            self.wal.append_complete(message_id)
+
+    async def mark_retrying(self, message: BridgeMessage) -> None:
+        """
+        Mark message as processed but waiting to be retried.
+
+        The message stays pending, and its retry count is logged so a
+        restart resumes from the same attempt.
+
+        Args:
+            message: Message awaiting a retry
+        """
+        record = self.table.get(message.message_id)
+        if record is not None and record.state == RECORD_PROCESSING:
+            record.state = RECORD_IDLE
+            self._processing_count -= 1
+        if self.wal is not None:
+            self.wal.append_enqueue(message)
+
+    def remove(self, message_id: str) -> bool:
+        """
+        Take a message out of the queue without dequeuing it.
+
+        Args:
+            message_id: Message identifier
+
+        Returns:
+            bool: True if the message was queued and has been removed
+        """
+        record = self.table.get(message_id)
+        if record is None or record.state != RECORD_QUEUED:
+            return False
 
-            # Remove from pending after processing
-            del self._pending[message_id]
+        # The record is skipped lazily by the level FIFO and deadline heap
+        record.state = RECORD_IDLE
+        self._size -= 1
+        self._release_level_entry(record.priority)
+        return True
 
     def get_pending_count(self) -> int:
         """Get number of pending messages."""
-        return len(self._pending)
+        return self._pending_count
 
     def get_processing_count(self) -> int:
         """Get number of messages being processed."""
-        return len(self._processing)
+        return self._processing_count
+
+    def get_waiting_count(self) -> int:
+        """Get number of pending messages outside the queue, awaiting a retry."""
+        return self._pending_count - self._size - self._processing_count
 
     def get_queue_size(self) -> int:
         """Get current queue size."""
-        return self._queue.qsize()
+        return self._size
+
+    def get_depth_by_priority(self) -> dict[int, int]:
+        """Get number of queued messages per priority level."""
+        return {
+            priority: size
+            for priority, size in sorted(self._level_sizes.items(), reverse=True)
+            if size
+        }
+
+    def get_deadline_promotions(self) -> int:
+        """Get number of messages served early because of their deadline."""
+        return self._deadline_promotions
+
+    def _compact_deadlines(self) -> None:
+        """Drop records that are no longer queued from the deadline heap."""
+        live = []
+        for record in self._deadlines:
+            if record.state == RECORD_QUEUED:
+                live.append(record)
+            else:
+                record.in_deadline_heap = False
+        heapq.heapify(live)
+        self._deadlines = live
+
+    def _pop_next(self) -> MessageRecord:
+        """Remove the next record: deadline-urgent first, then fair share."""
+        record = self._pop_urgent()
+        if record is None:
+            priority = min(
+                (p for p, size in self._level_sizes.items() if size),
+                key=lambda p: (self._level_pass[p], -p),
+            )
+            level = self._levels[priority]
+            sequence, record = level.popleft()
+            while not self._is_live(sequence, record):  # Served early or removed
+                self._level_stale[priority] -= 1
+                sequence, record = level.popleft()
+            self._virtual_time = self._level_pass[priority]
+            self._level_pass[priority] += 1.0 / self.priority_weight(priority)
+            self._level_sizes[priority] -= 1
+            if not self._level_sizes[priority]:
+                level.clear()
+                self._level_stale[priority] = 0
+        else:
+            self._deadline_promotions += 1
+            self._release_level_entry(record.priority)
+
+        record.state = RECORD_IDLE
+        self._size -= 1
+        return record
+
+    @staticmethod
+    def _is_live(sequence: int, record: MessageRecord) -> bool:
+        """Whether a level FIFO entry is the record's current enqueue."""
+        return record.state == RECORD_QUEUED and record.sequence == sequence
+
+    def _release_level_entry(self, priority: int) -> None:
+        """
+        Account for a record that left a level without its FIFO entry.
+
+        The entry stays in the FIFO as stale; once stale entries outnumber
+        live ones the FIFO is compacted, so traffic served by deadline or
+        removed never accumulates there.
+
+        Args:
+            priority: Level the record was queued on
+        """
+        live = self._level_sizes[priority] - 1
+        self._level_sizes[priority] = live
+        stale = self._level_stale.get(priority, 0) + 1
+        if not live:
+            self._levels[priority].clear()
+            stale = 0
+        elif stale > live:
+            self._levels[priority] = deque(
+                entry for entry in self._levels[priority] if self._is_live(*entry)
+            )
+            stale = 0
+        self._level_stale[priority] = stale
+
+    def _pop_urgent(self) -> MessageRecord | None:
+        """Pop the earliest-deadline record if it is within the margin."""
+        deadlines = self._deadlines
+        while deadlines and deadlines[0].state != RECORD_QUEUED:
+            heapq.heappop(deadlines).in_deadline_heap = False
+        urgent_before = time.monotonic() + self.deadline_margin
+        if deadlines and deadlines[0].deadline <= urgent_before:
+            record = heapq.heappop(deadlines)
+            record.in_deadline_heap = False
+            return record
+        return None
+
+
+class RouteShard:
+    """Queue, worker pool, latency counters and circuit breaker for one route."""
+
+    def __init__(
+        self,
+        route_id: str,
+        max_queue_size: int,
+        max_concurrency: int,
+        wal: MessageWAL | None = None,
+        tracker: RouteHealthTracker | None = None,
+        table: MessageTable | None = None,
+    ):
+        self.route_id = route_id
+        self.queue = MessageQueue(max_queue_size, wal=wal, table=table)
+        self.max_concurrency = max_concurrency
+        self.workers: list[asyncio.Task] = []
+
+        # Delivery outcomes feed the health tracker, whose error rate
+        # drives the breaker; without a tracker the breaker counts its own
+        self.tracker = None
+        self.breaker = CircuitBreaker(route_id)
+        if tracker is not None:
+            self.attach_tracker(tracker)
+
+        # Messages in processing, and how many of those shared workers hold
+        self.in_flight = 0
+        self.shared_in_flight = 0
+
+        self.processed = 0
+        self.failed = 0
+        self.total_latency_seconds = 0.0
+        self.max_latency_seconds = 0.0
+
+    @property
+    def shared_capacity(self) -> int:
+        """Slots shared workers may use without exceeding the route limit."""
+        return self.max_concurrency - len(self.workers) - self.shared_in_flight
+
+    def attach_tracker(self, tracker: RouteHealthTracker) -> None:
+        """
+        Use a route health tracker as the breaker's error-rate source.
+
+        Args:
+            tracker: Health tracker for this route
+        """
+        self.tracker = tracker
+        self.breaker.error_rate_source = tracker.get_error_rate
+
+    def record(self, latency_seconds: float, delivered: bool) -> None:
+        """
+        Record a processed message.
+
+        Args:
+            latency_seconds: Processing time for the message
+            delivered: Whether the message was delivered on this attempt
+        """
+        self.processed += 1
+        if not delivered:
+            self.failed += 1
+        self.total_latency_seconds += latency_seconds
+        self.max_latency_seconds = max(self.max_latency_seconds, latency_seconds)
+
+        if self.tracker is not None:
+            self.tracker.record_message(latency_seconds * 1000, delivered)
+        if delivered:
+            self.breaker.record_success()
+        else:
+            self.breaker.record_failure()
+
+    def drain_rate(self) -> float:
+        """
+        Estimate how many messages per second the route can deliver.
+
+        Returns:
+            float: Messages per second at full concurrency, 0.0 before any
+            message has been processed
+        """
+        if not self.total_latency_seconds:
+            return 0.0
+        return self.max_concurrency * self.processed / self.total_latency_seconds
+
+    def get_stats(self) -> dict[str, any]:
+        """Get queue depth, concurrency and latency for the route."""
+        return {
+            "queue_size": self.queue.get_queue_size(),
+            "queue_depth_by_priority": self.queue.get_depth_by_priority(),
+            "in_flight": self.in_flight,
+            "max_concurrency": self.max_concurrency,
+            "dedicated_workers": len(self.workers),
+            "processed": self.processed,
+            "failed": self.failed,
+            "average_latency_ms": (
+                self.total_latency_seconds / max(self.processed, 1) * 1000
+            ),
+            "max_latency_ms": self.max_latency_seconds * 1000,
+            "circuit_breaker": self.breaker.get_stats(),
+        }
 
 
 class CrossChainMessageBroker:
@@ -122,21 +635,49 @@ class CrossChainMessageBroker:
     across multiple blockchain networks.
     """
 
-    def __init__(self, max_queue_size: int = 10000):
-        self.message_queue = MessageQueue(max_queue_size)
+    def __init__(
+        self,
+        max_queue_size: int = 10000,
+        route_concurrency: int = 4,
+        shared_workers: int = 5,
+        wal_path: str | None = None,
+    ):
+        # One queue and worker pool per route, so a slow target chain only
+        # backs up its own routes. Shared workers drain whichever routes are
+        # backlogged, up to each route's concurrency limit.
+        self.max_queue_size = max_queue_size  # Per route
+        self.route_concurrency = route_concurrency
+        self.shared_workers = shared_workers
+        self.shards: dict[str, RouteShard] = {}
+        self.message_priorities = dict(DEFAULT_MESSAGE_PRIORITIES)
         self.adapters: dict[ChainType, IBridgeAdapter] = {}
         self.routes: dict[str, BridgeRoute] = {}
-        self.active_messages: dict[str, BridgeMessage] = {}
+        self.messages = MessageTable()  # Live messages of every route
+
+        # Durable log of queued messages, replayed on initialize()
+        self.wal = MessageWAL(wal_path) if wal_path else None
+        self._wal_recovered = False
 
         # Configuration
-        self.retry_delays = [1, 5, 15, 60]  # Exponential backoff in seconds
+        self.retry_backoff = {  # Jittered backoff per failure reason
+            "error": DecorrelatedJitterBackoff(base=1, cap=60),
+            "rejected": DecorrelatedJitterBackoff(base=5, cap=120),
+            "unconfirmed": DecorrelatedJitterBackoff(base=15, cap=300),
+        }
+        self.retry_budget = RetryBudget()  # Caps retries relative to new sends
         self.message_timeout = 300  # 5 minutes default timeout
         self.health_check_interval = 30  # 30 seconds
+        self.max_batch_size = 32  # Upper bound on messages per transmission
+        self.batch_linger_seconds = 0.01  # Wait for more messages to batch
 
         # State tracking
         self._running = False
         self._worker_tasks = []
         self._health_check_task = None
+        self._work_available = asyncio.Event()
+
+        # Retry and expiry timers share one timer wheel and driver task
+        self.timers = TimerWheel()
 
         self.logger = logging.getLogger(f"{__name__}.broker")
 
@@ -146,7 +687,9 @@ class CrossChainMessageBroker:
             "successful_messages": 0,
             "failed_messages": 0,
             "retry_attempts": 0,
+            "retries_rejected": 0,
             "timeouts": 0,
+            "batches_transmitted": 0,
         }
 
     async def initialize(
@@ -167,8 +710,12 @@ class CrossChainMessageBroker:
 
             # Register routes
             for route in routes:
-                route_id = f"{route.source_chain.value}_{route.target_chain.value}"
+                route_id = self._route_id(route.source_chain, route.target_chain)
                 self.routes[route_id] = route
+                self._get_shard(route_id)
+
+            if self.wal is not None and not self._wal_recovered:
+                await self._recover_messages()
 
             self.logger.info(
                 f"Initialized message broker with {len(adapters)} adapters and {len(routes)} routes"
@@ -186,11 +733,15 @@ class CrossChainMessageBroker:
 
         self._running = True
 
-        # Start message processing workers
-        num_workers = min(5, len(self.adapters))
-        for i in range(num_workers):
-            task = asyncio.create_task(self._message_worker(f"worker-{i}"))
+        # Start one dedicated worker per route plus the shared pool
+        for shard in self.shards.values():
+            self._start_shard_worker(shard)
+        for i in range(self.shared_workers):
+            task = asyncio.create_task(self._shared_worker(f"shared-{i}"))
             self._worker_tasks.append(task)
+        num_workers = len(self._worker_tasks)
+
+        await self.timers.start()
 
         # Start health check task
         self._health_check_task = asyncio.create_task(self._health_check_loop())
@@ -217,7 +768,13 @@ class CrossChainMessageBroker:
         )
 
         self._worker_tasks.clear()
+        for shard in self.shards.values():
+            shard.workers.clear()
         self._health_check_task = None
+        await self.timers.stop()
+
+        if self.wal is not None:
+            await self.wal.close()
 
         self.logger.info("Stopped message broker")
 
@@ -227,7 +784,7 @@ class CrossChainMessageBroker:
         source_chain: ChainType,
         target_chain: ChainType,
         payload: dict[str, any],
-        priority: int = 0,
+        priority: int | None = None,
         timeout_seconds: int = None,
     ) -> str:
         """
@@ -238,12 +795,16 @@ class CrossChainMessageBroker:
             source_chain: Source blockchain
             target_chain: Target blockchain
             payload: Message payload
-            priority: Message priority (higher = more urgent)
+            priority: Message priority (higher = more urgent); defaults by
+                message type, see ``message_priorities``
             timeout_seconds: Message timeout
 
         Returns:
             str: Message identifier
         """
+        if priority is None:
+            priority = self.message_priorities.get(message_type, 0)
+
         # Create message
         message_id = str(uuid.uuid4())
         message = BridgeMessage(
@@ -258,23 +819,15 @@ class CrossChainMessageBroker:
         )
 
         # Validate route exists
-        route_id = f"{source_chain.value}_{target_chain.value}"
-        if route_id not in self.routes:
-            raise ValueError(
-                f"No route available from {source_chain.value} to {target_chain.value}"
-            )
-
-        route = self.routes[route_id]
-        if not route.is_active:
-            raise ValueError(f"Route {route_id} is not active")
+        self.require_active_route(source_chain, target_chain)
 
         # Add to queue
-        success = await self.message_queue.enqueue(message)
+        success = await self._enqueue(message)
         if not success:
             raise RuntimeError(f"Failed to enqueue message {message_id}")
 
-        self.active_messages[message_id] = message
         self._stats["total_messages"] += 1
+        self.retry_budget.record_attempt()
 
         self.logger.info(
             f"Queued message {message_id} from {source_chain.value} to {target_chain.value}"
@@ -291,9 +844,7 @@ class CrossChainMessageBroker:
         Returns:
             BridgeMessageStatus: Message status or None if not found
         """
-        if message_id in self.active_messages:
-            return self.active_messages[message_id].status
-        return None
+        return self.messages.get_status(message_id)
 
     async def get_broker_stats(self) -> dict[str, any]:
         """
@@ -302,52 +853,228 @@ class CrossChainMessageBroker:
         Returns:
             Dict: Broker statistics and metrics
         """
+        queues = [shard.queue for shard in self.shards.values()]
+        retry_timers = sum(q.get_waiting_count() for q in queues)
+        depth_by_priority: dict[int, int] = {}
+        for queue in queues:
+            for priority, depth in queue.get_depth_by_priority().items():
+                depth_by_priority[priority] = depth_by_priority.get(priority, 0) + depth
+
         return {
             **self._stats,
-            "queue_size": self.message_queue.get_queue_size(),
-            "pending_messages": self.message_queue.get_pending_count(),
-            "processing_messages": self.message_queue.get_processing_count(),
-            "active_messages": len(self.active_messages),
+            "queue_size": sum(q.get_queue_size() for q in queues),
+            "queue_depth_by_priority": dict(
+                sorted(depth_by_priority.items(), reverse=True)
+            ),
+            "deadline_promotions": sum(q.get_deadline_promotions() for q in queues),
+            "pending_messages": sum(q.get_pending_count() for q in queues),
+            "processing_messages": sum(q.get_processing_count() for q in queues),
+            "active_messages": len(self.messages),
             "active_routes": len([r for r in self.routes.values() if r.is_active]),
             "total_routes": len(self.routes),
             "success_rate": (
                 self._stats["successful_messages"]
                 / max(self._stats["total_messages"], 1)
             ),
+            "shards": {
+                route_id: shard.get_stats() for route_id, shard in self.shards.items()
+            },
+            "wal": self.wal.get_stats() if self.wal is not None else None,
+            "retry_budget": self.retry_budget.get_stats(),
+            "timers": {
+                **self.timers.get_stats(),
+                "retry_timers": retry_timers,
+                "expiry_timers": self.timers.scheduled_count - retry_timers,
+            },
         }
 
-    async def _message_worker(self, worker_id: str) -> None:
+    @staticmethod
+    def _route_id(source_chain: ChainType, target_chain: ChainType) -> str:
+        """Get the identifier of the route between two chains."""
+        return f"{source_chain.value}_{target_chain.value}"
+
+    def require_active_route(
+        self, source_chain: ChainType, target_chain: ChainType
+    ) -> BridgeRoute:
         """
-        Message processing worker.
+        Get the route between two chains, checking it can take messages.
 
         Args:
+            source_chain: Source blockchain
+            target_chain: Target blockchain
+
+        Returns:
+            BridgeRoute: The active route
+
+        Raises:
+            ValueError: If there is no route or it is not active
+        """
+        route_id = self._route_id(source_chain, target_chain)
+        route = self.routes.get(route_id)
+        if route is None:
+            raise ValueError(
+                f"No route available from {source_chain.value} to {target_chain.value}"
+            )
+        if not route.is_active:
+            raise ValueError(f"Route {route_id} is not active")
+        return route
+
+    def get_route_shard(
+        self, source_chain: ChainType, target_chain: ChainType
+    ) -> RouteShard | None:
+        """
+        Get the queue shard of a route, if it has one.
+
+        Args:
+            source_chain: Source blockchain
+            target_chain: Target blockchain
+
+        Returns:
+            RouteShard: Shard of the route, or None
+        """
+        return self.shards.get(self._route_id(source_chain, target_chain))
+
+    def use_health_trackers(self, trackers: dict[str, RouteHealthTracker]) -> None:
+        """
+        Record delivery outcomes in shared route health trackers.
+
+        Lets the bridge health monitor see broker traffic and drive the
+        route circuit breakers from the same error rates it alerts on.
+
+        Args:
+            trackers: Health trackers keyed by route identifier
+        """
+        for route_id, tracker in trackers.items():
+            self._get_shard(route_id).attach_tracker(tracker)
+
+    def _get_shard(self, route_id: str) -> RouteShard:
+        """Get the shard for a route, creating it on first use."""
+        shard = self.shards.get(route_id)
+        if shard is None:
+            route = self.routes.get(route_id)
+            shard = RouteShard(
+                route_id,
+                self.max_queue_size,
+                self.route_concurrency,
+                self.wal,
+                tracker=RouteHealthTracker(route) if route is not None else None,
+                table=self.messages,
+            )
+            self.shards[route_id] = shard
+            if self._running:
+                self._start_shard_worker(shard)
+        return shard
+
+    def _start_shard_worker(self, shard: RouteShard) -> None:
+        """Start the dedicated worker of a route shard."""
+        task = asyncio.create_task(
+            self._message_worker(shard, f"{shard.route_id}-worker")
+        )
+        shard.workers.append(task)
+        self._worker_tasks.append(task)
+
+    async def _recover_messages(self) -> None:
+        """Re-queue messages that were unfinished when the process stopped."""
+        self._wal_recovered = True
+        recovered = 0
+        for message in self.wal.replay():
+            shard = self._get_shard(
+                self._route_id(message.source_chain, message.target_chain)
+            )
+            if await shard.queue.enqueue(message, log=False):
+                self._arm_expiry(shard, self.messages.get(message.message_id))
+                recovered += 1
+
+        if recovered:
+            self._work_available.set()
+            self.logger.info(f"Recovered {recovered} messages from write-ahead log")
+
+    async def _enqueue(self, message: BridgeMessage) -> bool:
+        """Add a message to its route's queue and wake shared workers."""
+        shard = self._get_shard(
+            self._route_id(message.source_chain, message.target_chain)
+        )
+        success = await shard.queue.enqueue(message)
+        if success:
+            self._arm_expiry(shard, self.messages.get(message.message_id))
+            self._work_available.set()
+        return success
+
+    def _arm_expiry(self, shard: RouteShard, record: MessageRecord) -> None:
+        """Schedule proactive expiry of a message at its deadline."""
+        if record.expiry_timer is not None:
+            return
+        record.expiry_timer = self.timers.schedule(
+            record.deadline - time.monotonic(), self._expire_message, shard, record
+        )
+
+    @staticmethod
+    def _disarm_timers(record: MessageRecord) -> None:
+        """Cancel the retry and expiry timers of a finished message."""
+        for timer in (record.retry_timer, record.expiry_timer):
+            if timer is not None:
+                timer.cancel()
+        record.retry_timer = record.expiry_timer = None
+
+    async def _expire_message(self, shard: RouteShard, record: MessageRecord) -> None:
+        """
+        Time out a message that reached its deadline while waiting.
+
+        Messages still queued or waiting for a retry are removed at once,
+        so they stop occupying queue slots. Messages being processed are
+        left to their worker.
+
+        Args:
+            shard: Route shard of the message
+            record: Record of the message whose deadline passed
+        """
+        record.expiry_timer = None
+        if record.state == RECORD_PROCESSING or record.state == RECORD_FINISHED:
+            return
+
+        await self._handle_message_timeout(shard, record.message)
+
+    async def _message_worker(self, shard: RouteShard, worker_id: str) -> None:
+        """
+        Dedicated message processing worker for one route.
+
+        Args:
+            shard: Route shard to serve
             worker_id: Worker identifier
         """
         self.logger.info(f"Started message worker {worker_id}")
 
         while self._running:
             try:
-                # Get next message from queue
-                message = await self.message_queue.dequeue(timeout=1.0)
-                if message is None:
+                # Wait for work without polling, and leave it queued while the
+                # route's breaker is open so it still expires on time
+                await shard.queue.wait_for_messages()
+                if (wait := shard.breaker.retry_after()) > 0:
+                    await asyncio.sleep(min(wait, 1.0))
                     continue
 
-                # Check if message has expired
-                if self._is_message_expired(message):
-                    await self._handle_message_timeout(message)
+                probing = shard.breaker.state == CircuitState.HALF_OPEN
+                if not shard.breaker.allow_request():
+                    await asyncio.sleep(0.1)  # Wait for the probe's outcome
                     continue
 
-                # Process the message
-                success = await self._process_message(message)
+                if not probing:
+                    # Take what fits in one transmission
+                    messages = await shard.queue.dequeue_many(
+                        self._transmission_size(shard), max_wait=0
+                    )
+                    if messages:
+                        await self._dispatch(shard, messages)
+                    continue
 
-                # Mark as completed
-                await self.message_queue.mark_completed(message.message_id, success)
-
-                # Update statistics
-                if success:
-                    self._stats["successful_messages"] += 1
-                else:
-                    self._stats["failed_messages"] += 1
+                # A half-open route gets a single message as its probe
+                try:
+                    messages = await shard.queue.dequeue_many(1, max_wait=0)
+                    if messages:
+                        await self._handle_message(shard, messages[0])
+                finally:
+                    # An expired probe records no outcome; free its slot
+                    shard.breaker.release_probe()
 
             except Exception as e:
                 self.logger.error(f"Error in message worker {worker_id}: {e}")
@@ -355,6 +1082,218 @@ class CrossChainMessageBroker:
 
         self.logger.info(f"Stopped message worker {worker_id}")
 
+    async def _shared_worker(self, worker_id: str) -> None:
+        """
+        Shared message processing worker.
+
+        Serves the most backlogged route that still has spare concurrency,
+        so idle capacity moves to wherever messages are waiting.
+
+        Args:
+            worker_id: Worker identifier
+        """
+        self.logger.info(f"Started shared message worker {worker_id}")
+
+        while self._running:
+            try:
+                shard = self._select_backlogged_shard()
+                if shard is None:
+                    self._work_available.clear()
+                    await self._work_available.wait()
+                    continue
+
+                messages = await shard.queue.dequeue_many(
+                    self._transmission_size(shard), max_wait=0
+                )
+                if not messages:
+                    continue
+
+                shard.shared_in_flight += 1
+                try:
+                    await self._dispatch(shard, messages)
+                finally:
+                    shard.shared_in_flight -= 1
+                    self._work_available.set()  # Capacity freed on this route
+
+            except Exception as e:
+                self.logger.error(f"Error in shared message worker {worker_id}: {e}")
+                await asyncio.sleep(1)
+
+        self.logger.info(f"Stopped shared message worker {worker_id}")
+
+    def _select_backlogged_shard(self) -> RouteShard | None:
+        """
+        Get the route with the deepest queue that has spare shared capacity.
+
+        Routes whose breaker is not closed are left to their dedicated
+        worker, so a half-open route sees a single probe at a time.
+        """
+        best = None
+        best_depth = 0
+        for shard in self.shards.values():
+            depth = shard.queue.get_queue_size()
+            if (
+                depth > best_depth
+                and shard.shared_capacity > 0
+                and shard.breaker.state == CircuitState.CLOSED
+            ):
+                best, best_depth = shard, depth
+        return best
+
+    def _transmission_size(self, shard: RouteShard) -> int:
+        """
+        Get how many messages of a route go out in one transmission.
+
+        Args:
+            shard: Route shard
+
+        Returns:
+            int: 1 unless the route's target adapter supports batches
+        """
+        route = self.routes.get(shard.route_id)
+        if route is None:
+            return 1
+        adapter = self.adapters.get(route.target_chain)
+        return max(1, min(self.max_batch_size, getattr(adapter, "max_batch_size", 1)))
+
+    async def _dispatch(self, shard: RouteShard, messages: list[BridgeMessage]) -> None:
+        """
+        Handle dequeued messages, batching them when the adapter supports it.
+
+        Args:
+            shard: Route shard the messages came from
+            messages: Dequeued messages
+        """
+        limit = self._transmission_size(shard)
+        if limit > 1:
+            messages = await self._collect_batch(shard, messages, limit)
+            if len(messages) > 1:
+                await self._handle_batch(shard, messages)
+                return
+
+        for message in messages:
+            await self._handle_message(shard, message)
+
+    async def _collect_batch(
+        self, shard: RouteShard, messages: list[BridgeMessage], limit: int
+    ) -> list[BridgeMessage]:
+        """
+        Top up dequeued messages for the same route into one batch.
+
+        Args:
+            shard: Route shard to take messages from
+            messages: Messages already dequeued
+            limit: Maximum batch size
+
+        Returns:
+            List[BridgeMessage]: Up to ``limit`` messages, ``messages`` first
+        """
+        batch = list(messages)
+        linger_until = time.monotonic() + self.batch_linger_seconds
+        while len(batch) < limit:
+            remaining = linger_until - time.monotonic()
+            if remaining <= 0 and not shard.queue.get_queue_size():
+                break
+            more = await shard.queue.dequeue_many(
+                limit - len(batch), max_wait=max(remaining, 0)
+            )
+            if not more:
+                break
+            batch.extend(more)
+        return batch
+
+    async def _handle_batch(
+        self, shard: RouteShard, messages: list[BridgeMessage]
+    ) -> None:
+        """
+        Process a batch of dequeued messages and record the outcomes.
+
+        Args:
+            shard: Route shard the messages came from
+            messages: Messages for the same route
+        """
+        live = []
+        for message in messages:
+            if self._is_message_expired(message):
+                await self._handle_message_timeout(shard, message)
+            else:
+                live.append(message)
+        if not live:
+            return
+
+        shard.in_flight += 1
+        started = time.monotonic()
+        try:
+            results = await self._process_batch(live)
+        finally:
+            shard.in_flight -= 1
+        latency = time.monotonic() - started
+
+        for message, success in zip(live, results):
+            await self._complete_message(shard, message, success, latency)
+
+    async def _handle_message(self, shard: RouteShard, message: BridgeMessage) -> None:
+        """
+        Process a dequeued message and record the outcome.
+
+        Args:
+            shard: Route shard the message came from
+            message: Message to handle
+        """
+        # Check if message has expired
+        if self._is_message_expired(message):
+            await self._handle_message_timeout(shard, message)
+            return
+
+        # Process the message
+        shard.in_flight += 1
+        started = time.monotonic()
+        try:
+            success = await self._process_message(message)
+        finally:
+            shard.in_flight -= 1
+        await self._complete_message(
+            shard, message, success, time.monotonic() - started
+        )
+
+    async def _complete_message(
+        self,
+        shard: RouteShard,
+        message: BridgeMessage,
+        success: bool,
+        latency_seconds: float,
+    ) -> None:
+        """
+        Mark a processed message as completed, or as waiting for its retry.
+
+        Args:
+            shard: Route shard the message came from
+            message: Processed message
+            success: Whether processing was successful or a retry is scheduled
+            latency_seconds: Processing time for the attempt
+        """
+        record = self.messages.get(message.message_id)
+        retrying = record is not None and record.retry_timer is not None
+        shard.record(latency_seconds, success and not retrying)
+        if shard.queue.get_queue_size():
+            # The outcome may have closed the breaker; idle shared workers
+            # only wake on events
+            self._work_available.set()
+        if retrying:
+            await shard.queue.mark_retrying(message)
+            return
+
+        # Mark as completed
+        if record is not None:
+            self._disarm_timers(record)
+        await shard.queue.mark_completed(message.message_id, success)
+
+        # Update statistics
+        if success:
+            self._stats["successful_messages"] += 1
+        else:
+            self._stats["failed_messages"] += 1
+
     async def _process_message(self, message: BridgeMessage) -> bool:
         """
         Process a single message.
@@ -396,22 +1335,80 @@ class CrossChainMessageBroker:
                     self.logger.warning(
                         f"Message {message.message_id} transmitted but not confirmed"
                     )
-                    return await self._retry_message(message)
+                    return await self._retry_message(message, "unconfirmed")
             else:
                 self.logger.warning(f"Failed to transmit message {message.message_id}")
-                return await self._retry_message(message)
+                return await self._retry_message(message, "rejected")
 
         except Exception as e:
             self.logger.error(f"Error processing message {message.message_id}: {e}")
             message.error_message = str(e)
-            return await self._retry_message(message)
+            return await self._retry_message(message, "error")
+
+    async def _process_batch(self, messages: list[BridgeMessage]) -> list[bool]:
+        """
+        Process messages for one target chain with a single transmission.
+
+        Args:
+            messages: Messages to process
+
+        Returns:
+            List[bool]: Processing success for each message, in order
+        """
+        target_chain = messages[0].target_chain
+        adapter = self.adapters[target_chain]
+
+        try:
+            for message in messages:
+                message.status = BridgeMessageStatus.TRANSMITTED
+
+            # Transmit the batch, then confirm what was sent in one round-trip
+            transmitted = await adapter.transmit_batch(messages)
+            sent = [m for m, ok in zip(messages, transmitted) if ok]
+            confirmed = set()
+            if sent:
+                results = await adapter.confirm_batch(
+                    [m.message_id for m in sent], target_chain
+                )
+                confirmed = {m.message_id for m, ok in zip(sent, results) if ok}
+
+            self._stats["batches_transmitted"] += 1
+            self.logger.info(
+                f"Transmitted batch of {len(messages)} messages to "
+                f"{target_chain.value}, {len(confirmed)} confirmed"
+            )
 
-    async def _retry_message(self, message: BridgeMessage) -> bool:
+        except Exception as e:
+            self.logger.error(
+                f"Error processing batch of {len(messages)} messages: {e}"
+            )
+            for message in messages:
+                message.error_message = str(e)
+            return [
+                await self._retry_message(message, "error") for message in messages
+            ]
+
+        sent_ids = {m.message_id for m in sent}
+        outcomes = []
+        for message in messages:
+            if message.message_id in confirmed:
+                message.status = BridgeMessageStatus.CONFIRMED
+                outcomes.append(True)
+            else:
+                reason = "unconfirmed" if message.message_id in sent_ids else "rejected"
+                outcomes.append(await self._retry_message(message, reason))
+        return outcomes
+
+    async def _retry_message(
+        self, message: BridgeMessage, reason: str = "error"
+    ) -> bool:
         """
         Retry a failed message.
 
         Args:
             message: Message to retry
+            reason: Failure reason selecting the backoff policy: "error",
+                "rejected" or "unconfirmed"
 
         Returns:
             bool: True if retry was scheduled
@@ -421,33 +1418,50 @@ class CrossChainMessageBroker:
             self.logger.error(f"Message {message.message_id} exceeded max retries")
             return False
 
-        # Calculate retry delay
-        delay_index = min(message.retry_count, len(self.retry_delays) - 1)
-        delay = self.retry_delays[delay_index]
+        record = self.messages.get(message.message_id)
+        if record is None:
+            return False
+
+        if not self.retry_budget.try_acquire():
+            message.status = BridgeMessageStatus.FAILED
+            message.error_message = "Retry budget exhausted"
+            self._stats["retries_rejected"] += 1
+            self.logger.error(
+                f"Message {message.message_id} failed: retry budget exhausted"
+            )
+            return False
+
+        # Calculate retry delay, no earlier than the route's breaker reopens
+        backoff = self.retry_backoff.get(reason, self.retry_backoff["error"])
+        delay = backoff.next_delay(record.retry_delay)
+        shard = self.shards.get(
+            self._route_id(message.source_chain, message.target_chain)
+        )
+        if shard is not None:
+            delay = max(delay, shard.breaker.retry_after())
+        record.retry_delay = delay
 
         message.retry_count += 1
         self._stats["retry_attempts"] += 1
 
         self.logger.info(
-            f"Retrying message {message.message_id} in {delay} seconds (attempt {message.retry_count})"
+            f"Retrying message {message.message_id} in {delay:.1f} seconds (attempt {message.retry_count})"
         )
 
         # Schedule retry
-        asyncio.create_task(self._schedule_retry(message, delay))
+        record.retry_timer = self.timers.schedule(delay, self._resume_retry, record)
         return True
 
-    async def _schedule_retry(self, message: BridgeMessage, delay: float) -> None:
+    async def _resume_retry(self, record: MessageRecord) -> None:
         """
-        Schedule a message retry after delay.
+        Re-queue a message whose retry delay has passed.
 
         Args:
-            message: Message to retry
-            delay: Delay in seconds
+            record: Record of the message to retry
         """
-        await asyncio.sleep(delay)
-
-        if self._running and message.message_id in self.active_messages:
-            await self.message_queue.enqueue(message)
+        record.retry_timer = None
+        if self._running and record.state == RECORD_IDLE:
+            await self._enqueue(record.message)
 
     def _is_message_expired(self, message: BridgeMessage) -> bool:
         """
@@ -459,26 +1473,33 @@ class CrossChainMessageBroker:
         Returns:
             bool: True if expired
         """
+        record = self.messages.get(message.message_id)
+        if record is not None:
+            return time.monotonic() > record.deadline
         elapsed = (datetime.utcnow() - message.timestamp).total_seconds()
         return elapsed > message.timeout_seconds
 
-    async def _handle_message_timeout(self, message: BridgeMessage) -> None:
+    async def _handle_message_timeout(
+        self, shard: RouteShard, message: BridgeMessage
+    ) -> None:
         """
-        Handle a timed-out message.
+        Handle a timed-out message and take it off its route.
 
         Args:
+            shard: Route shard of the message
             message: Timed-out message
         """
         message.status = BridgeMessageStatus.TIMEOUT
         self._stats["timeouts"] += 1
+        record = self.messages.get(message.message_id)
+        if record is not None:
+            self._disarm_timers(record)
 
         self.logger.warning(
             f"Message {message.message_id} timed out after {message.timeout_seconds} seconds"
         )
 
-        # Remove from active messages
-        if message.message_id in self.active_messages:
-            del self.active_messages[message.message_id]
+        await shard.queue.mark_completed(message.message_id, False)
 
     async def _health_check_loop(self) -> None:
         """Background task for health checking bridge routes."""
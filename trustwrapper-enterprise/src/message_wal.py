@@ -0,0 +1,423 @@
+"""
+Bridge Message Write-Ahead Log
+==============================
+
+Durable, append-only log of bridge message queue operations for
+TrustWrapper v3.0. Lets the message broker restore pending and retrying
+messages after a process restart.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import zlib
+from collections import defaultdict
+from datetime import datetime
+
+from bridge.interfaces import BridgeMessage, BridgeMessageStatus, BridgeMessageType
+from core.interfaces import ChainType
+
+# Record header: body length, CRC32 of the body, record type
+RECORD_HEADER = struct.Struct("<IIB")
+
+RECORD_ENQUEUE = 1  # Body is the encoded message; supersedes earlier records
+RECORD_COMPLETE = 2  # Body is the message id; the message is finished
+
+SEGMENT_PREFIX = "wal-"
+SEGMENT_SUFFIX = ".log"
+
+
+def encode_wal_message(message: BridgeMessage) -> bytes:
+    """
+    Encode a bridge message as a WAL record body.
+
+    Args:
+        message: Message to encode
+
+    Returns:
+        bytes: Encoded message
+    """
+    return json.dumps(
+        {
+            "message_id": message.message_id,
+            "message_type": message.message_type.value,
+            "source_chain": message.source_chain.value,
+            "target_chain": message.target_chain.value,
+            "payload": message.payload,
+            "timestamp": message.timestamp.isoformat(),
+            "timeout_seconds": message.timeout_seconds,
+            "priority": message.priority,
+            "retry_count": message.retry_count,
+            "max_retries": message.max_retries,
+            "status": message.status.value,
+            "error_message": message.error_message,
+        },
+        separators=(",", ":"),
+        default=str,
+    ).encode("utf-8")
+
+
+def decode_wal_message(data: bytes) -> BridgeMessage:
+    """
+    Decode a bridge message from a WAL record body.
+
+    Args:
+        data: Encoded message
+
+    Returns:
+        BridgeMessage: Decoded message
+    """
+    fields = json.loads(data)
+    return BridgeMessage(
+        message_id=fields["message_id"],
+        message_type=BridgeMessageType(fields["message_type"]),
+        source_chain=ChainType(fields["source_chain"]),
+        target_chain=ChainType(fields["target_chain"]),
+        payload=fields["payload"],
+        timestamp=datetime.fromisoformat(fields["timestamp"]),
+        timeout_seconds=fields["timeout_seconds"],
+        priority=fields["priority"],
+        retry_count=fields["retry_count"],
+        max_retries=fields["max_retries"],
+        status=BridgeMessageStatus(fields["status"]),
+        error_message=fields["error_message"],
+    )
+
+
+class MessageWAL:
+    """
+    Segment-rotated write-ahead log with group commit.
+
+    Appends only encode the record into an in-memory buffer. A single
+    flusher task writes the buffer and fsyncs it every ``flush_interval``
+    seconds, so one fsync covers every record appended in that window and
+    ``commit()`` waiters are released together. Records go to numbered
+    segment files; once every message in the oldest segments is completed
+    or superseded by a newer record that has been flushed, those segments
+    are deleted. When a write fails, waiting ``commit()`` calls get the
+    error and the records are written again, to a new segment, by the next
+    flush.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        segment_max_bytes: int = 64 * 1024 * 1024,
+        flush_interval: float = 0.002,
+        sync_commit: bool = True,
+        fsync: bool = True,
+    ):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self.flush_interval = flush_interval
+        self.sync_commit = sync_commit  # Whether enqueue waits for commit()
+        self.fsync = fsync
+
+        os.makedirs(directory, exist_ok=True)
+
+        self._segment_no = 0
+        self._segment_bytes = 0
+        self._segments: list[int] = []  # Segment numbers on disk, oldest first
+        self._files = {}  # segment number -> open file
+
+        # Live messages: message_id -> segment holding its latest record
+        self._live: dict[str, int] = {}
+        # The same for flushed records only, which decide segment deletion
+        self._durable_live: dict[str, int] = {}
+        self._segment_live: dict[int, int] = defaultdict(int)
+
+        self._buffer: list[tuple[int, bytearray]] = []
+        # Liveness changes of buffered records: (message_id, segment or None)
+        self._buffered_changes: list[tuple[str, int | None]] = []
+        self._waiters: list[asyncio.Future] = []
+        self._data_ready: asyncio.Event | None = None
+        self._flush_task: asyncio.Task | None = None
+
+        self.logger = logging.getLogger(f"{__name__}.wal")
+
+        # Statistics
+        self._stats = {
+            "records_appended": 0,
+            "bytes_written": 0,
+            "group_commits": 0,
+            "segments_deleted": 0,
+            "recovered_messages": 0,
+        }
+
+    def replay(self) -> list[BridgeMessage]:
+        """
+        Read existing segments and return messages that never completed.
+
+        New records are written to a fresh segment, so a torn record at the
+        end of the last segment is never appended to.
+
+        Returns:
+            List[BridgeMessage]: Live messages in original enqueue order
+        """
+        live: dict[str, tuple[int, BridgeMessage]] = {}
+        segments = sorted(
+            int(name[len(SEGMENT_PREFIX) : -len(SEGMENT_SUFFIX)])
+            for name in os.listdir(self.directory)
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+        )
+
+        for segment_no in segments:
+            with open(self._segment_path(segment_no), "rb") as f:
+                data = f.read()
+            for record_type, body in self._iter_records(data, segment_no):
+                if record_type == RECORD_ENQUEUE:
+                    message = decode_wal_message(body)
+                    live.pop(message.message_id, None)
+                    live[message.message_id] = (segment_no, message)
+                elif record_type == RECORD_COMPLETE:
+                    live.pop(body.decode("utf-8"), None)
+
+        self._segments = segments
+        self._segment_no = segments[-1] + 1 if segments else 0
+        self._segment_bytes = 0
+        self._live = {message_id: segment for message_id, (segment, _) in live.items()}
+        self._durable_live = dict(self._live)
+        self._segment_live = defaultdict(int)
+        for segment_no in self._live.values():
+            self._segment_live[segment_no] += 1
+
+        self._stats["recovered_messages"] += len(live)
+        if live:
+            self.logger.info(
+                f"Recovered {len(live)} messages from {len(segments)} WAL segments"
+            )
+        return [message for _, message in live.values()]
+
+    def append_enqueue(self, message: BridgeMessage) -> None:
+        """
+        Log a message as queued, replacing any earlier record for it.
+
+        Args:
+            message: Message that was queued or rescheduled
+        """
+        segment_no = self._append(RECORD_ENQUEUE, encode_wal_message(message))
+        self._live[message.message_id] = segment_no
+        self._buffered_changes.append((message.message_id, segment_no))
+
+    def append_complete(self, message_id: str) -> None:
+        """
+        Log a message as finished, so it is not restored on replay.
+
+        Args:
+            message_id: Message identifier
+        """
+        if self._live.pop(message_id, None) is None:
+            return
+        self._append(RECORD_COMPLETE, message_id.encode("utf-8"))
+        self._buffered_changes.append((message_id, None))
+
+    async def commit(self) -> None:
+        """Wait until every record appended so far is durable."""
+        self._ensure_flusher()
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._data_ready.set()
+        await waiter
+
+    async def close(self) -> None:
+        """Flush buffered records, stop the flusher and close segment files."""
+        if self._flush_task is not None:
+            if self._buffer or self._waiters:
+                await self.commit()
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+            self._data_ready = None
+
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+
+    def get_stats(self) -> dict[str, any]:
+        """
+        Get write-ahead log statistics.
+
+        Returns:
+            Dict: WAL statistics
+        """
+        return {
+            **self._stats,
+            "live_messages": len(self._live),
+            "segments": len(self._segments),
+            "current_segment": self._segment_no,
+            "buffered_bytes": sum(len(data) for _, data in self._buffer),
+        }
+
+    def _append(self, record_type: int, body: bytes) -> int:
+        """Buffer one record; returns the segment number it belongs to."""
+        record = RECORD_HEADER.pack(len(body), zlib.crc32(body), record_type) + body
+
+        if (
+            self._segment_bytes
+            and self._segment_bytes + len(record) > self.segment_max_bytes
+        ):
+            self._segment_no += 1
+            self._segment_bytes = 0
+        self._segment_bytes += len(record)
+
+        segment_no = self._segment_no
+        if not self._segments or self._segments[-1] != segment_no:
+            self._segments.append(segment_no)
+        if self._buffer and self._buffer[-1][0] == segment_no:
+            self._buffer[-1][1].extend(record)
+        else:
+            self._buffer.append((segment_no, bytearray(record)))
+
+        self._stats["records_appended"] += 1
+        self._ensure_flusher()
+        self._data_ready.set()
+        return segment_no
+
+    def _ensure_flusher(self) -> None:
+        """Start the group commit task if it is not running."""
+        if self._flush_task is None or self._flush_task.done():
+            self._data_ready = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        """Write and fsync buffered records in groups."""
+        while True:
+            await self._data_ready.wait()
+            await asyncio.sleep(self.flush_interval)  # Let a group accumulate
+            self._data_ready.clear()
+
+            buffer, self._buffer = self._buffer, []
+            changes, self._buffered_changes = self._buffered_changes, []
+            waiters, self._waiters = self._waiters, []
+            try:
+                if buffer:
+                    await asyncio.to_thread(self._write, buffer)
+                    self._stats["group_commits"] += 1
+            except Exception as e:
+                self.logger.error(f"Failed to write WAL records: {e}")
+                self._requeue_failed_write(buffer, changes)
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(e)
+                continue
+
+            # Records appended during the write are not durable yet, so they
+            # do not count until a later flush writes them
+            self._apply_durable_changes(changes)
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+            self._delete_dead_segments()
+
+    def _write(self, buffer: list[tuple[int, bytearray]]) -> None:
+        """Append buffered records to their segments and make them durable."""
+        touched = []
+        for segment_no, data in buffer:
+            f = self._files.get(segment_no)
+            if f is None:
+                f = open(self._segment_path(segment_no), "ab")
+                self._files[segment_no] = f
+            f.write(data)
+            touched.append(f)
+            self._stats["bytes_written"] += len(data)
+
+        for f in touched:
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+
+        # Only the newest segment is still appended to
+        for segment_no in [n for n in self._files if n < self._segment_no]:
+            self._files.pop(segment_no).close()
+
+    def _requeue_failed_write(
+        self,
+        buffer: list[tuple[int, bytearray]],
+        changes: list[tuple[str, int | None]],
+    ) -> None:
+        """
+        Move records of a failed write to a fresh segment for the next flush.
+
+        The failed write may have left a partial record at the end of a
+        segment, and replay stops at the first bad record, so nothing more
+        is appended to the segments it touched. Records appended while the
+        write was running move too, after the failed ones, so the log keeps
+        its order.
+        """
+        for f in self._files.values():
+            f.close()
+        self._files.clear()
+
+        self._segment_no += 1
+        data = bytearray()
+        for _, records in buffer + self._buffer:
+            data.extend(records)
+        self._buffer = [(self._segment_no, data)] if data else []
+        self._segment_bytes = len(data)
+        if data:
+            self._segments.append(self._segment_no)
+
+        # Messages whose latest record is buffered now live in the new segment
+        self._buffered_changes = [
+            (message_id, None if segment_no is None else self._segment_no)
+            for message_id, segment_no in changes + self._buffered_changes
+        ]
+        for message_id, segment_no in self._buffered_changes:
+            if segment_no is not None and message_id in self._live:
+                self._live[message_id] = segment_no
+
+    def _apply_durable_changes(self, changes: list[tuple[str, int | None]]) -> None:
+        """Move flushed liveness changes into the per-segment live counts."""
+        for message_id, segment_no in changes:
+            previous = self._durable_live.pop(message_id, None)
+            if previous is not None:
+                self._segment_live[previous] -= 1
+            if segment_no is not None:
+                self._durable_live[message_id] = segment_no
+                self._segment_live[segment_no] += 1
+
+    def _delete_dead_segments(self) -> None:
+        """Delete the oldest segments once they hold no live messages."""
+        # Completion records may refer to older segments, so only a prefix of
+        # fully dead segments can go without resurrecting messages on replay.
+        # Segments with records still buffered are not complete on disk yet.
+        buffered = {segment_no for segment_no, _ in self._buffer}
+        while (
+            self._segments
+            and self._segments[0] < self._segment_no
+            and self._segments[0] not in buffered
+            and self._segment_live.get(self._segments[0], 0) <= 0
+        ):
+            segment_no = self._segments.pop(0)
+            self._segment_live.pop(segment_no, None)
+            f = self._files.pop(segment_no, None)
+            if f is not None:
+                f.close()
+            try:
+                os.remove(self._segment_path(segment_no))
+                self._stats["segments_deleted"] += 1
+            except FileNotFoundError:
+                pass
+
+    def _iter_records(self, data: bytes, segment_no: int):
+        """Yield (record type, body) pairs, stopping at a torn or corrupt tail."""
+        offset = 0
+        while offset + RECORD_HEADER.size <= len(data):
+            length, checksum, record_type = RECORD_HEADER.unpack_from(data, offset)
+            start = offset + RECORD_HEADER.size
+            body = data[start : start + length]
+            if len(body) < length or zlib.crc32(body) != checksum:
+                self.logger.warning(
+                    f"Discarding torn WAL record in segment {segment_no} at {offset}"
+                )
+                return
+            yield record_type, body
+            offset = start + length
+
+    def _segment_path(self, segment_no: int) -> str:
+        """Get the file path of a segment."""
+        return os.path.join(
+            self.directory, f"{SEGMENT_PREFIX}{segment_no:08d}{SEGMENT_SUFFIX}"
+        )
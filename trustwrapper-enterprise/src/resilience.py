@@ -0,0 +1,374 @@
+"""
+Resilience Primitives
+=====================
+
+Shared retry and failure-isolation building blocks for TrustWrapper v3.0:
+decorrelated-jitter backoff, retry budgets, circuit breakers, token
+buckets and latency windows. Used by the cross-chain message broker and
+bridge, the multi-chain connection manager and the consensus engine.
+"""
+
+import random
+import time
+from collections import deque
+from collections.abc import Callable
+from enum import Enum
+
+
+class DecorrelatedJitterBackoff:
+    """
+    Decorrelated-jitter exponential backoff.
+
+    Each delay is drawn uniformly between ``base`` and three times the
+    previous delay, capped at ``cap``. Delays grow roughly exponentially
+    while retries from many callers spread out instead of arriving in
+    synchronized waves.
+    """
+
+    def __init__(self, base: float = 1.0, cap: float = 60.0):
+        self.base = base
+        self.cap = cap
+
+    def next_delay(self, previous: float | None = None) -> float:
+        """
+        Get the delay before the next attempt.
+
+        Args:
+            previous: Delay used before the previous attempt, if any
+
+        Returns:
+            float: Delay in seconds
+        """
+        upper = max(self.base, (previous or self.base) * 3)
+        return min(self.cap, random.uniform(self.base, upper))  # noqa: S311  # nosec B311
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of recent first attempts.
+
+    Over a sliding window, retries may not exceed ``ratio`` times the
+    number of first attempts plus a floor of ``min_retries_per_second``.
+    When a dependency is failing everything, this keeps retries from
+    multiplying the load on it.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.2,
+        min_retries_per_second: float = 10.0,
+        window_seconds: int = 10,
+    ):
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window_seconds = window_seconds
+
+        self._buckets: deque[list[int]] = deque()  # [second, attempts, retries]
+        self.rejected = 0
+
+    def record_attempt(self) -> None:
+        """Record a first attempt, which earns retry budget."""
+        self._current_bucket()[1] += 1
+
+    def try_acquire(self) -> bool:
+        """
+        Spend budget for one retry.
+
+        Returns:
+            bool: True if the retry may go ahead
+        """
+        bucket = self._current_bucket()
+        attempts = sum(b[1] for b in self._buckets)
+        retries = sum(b[2] for b in self._buckets)
+        allowed = self.min_retries_per_second * self.window_seconds
+        allowed += self.ratio * attempts
+
+        if retries >= allowed:
+            self.rejected += 1
+            return False
+
+        bucket[2] += 1
+        return True
+
+    def get_stats(self) -> dict[str, any]:
+        """
+        Get retry budget statistics.
+
+        Returns:
+            Dict: Attempts and retries in the window, and rejected retries
+        """
+        self._current_bucket()
+        return {
+            "attempts": sum(b[1] for b in self._buckets),
+            "retries": sum(b[2] for b in self._buckets),
+            "rejected": self.rejected,
+            "ratio": self.ratio,
+        }
+
+    def _current_bucket(self) -> list[int]:
+        """Get the bucket for this second, dropping buckets outside the window."""
+        second = int(time.monotonic())
+        while self._buckets and self._buckets[0][0] <= second - self.window_seconds:
+            self._buckets.popleft()
+        if not self._buckets or self._buckets[-1][0] != second:
+            self._buckets.append([second, 0, 0])
+        return self._buckets[-1]
+
+
+class CircuitState(Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker with closed, open and half-open states.
+
+    While closed, calls pass and the error rate since the breaker last
+    closed is watched; once at least ``minimum_calls`` outcomes show an
+    error rate of ``failure_threshold`` or more, the breaker opens and
+    rejects calls for ``open_seconds``. It then lets ``half_open_calls``
+    probe calls through: a success closes it, a failure opens it again.
+
+    The error rate comes from ``error_rate_source(since)`` when given, so
+    an existing health tracker can drive the breaker. The source returns
+    an (error rate, sample count) pair for outcomes after the wall-clock
+    time ``since``. Without a source, the breaker keeps its own window.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        open_seconds: float = 30.0,
+        half_open_calls: int = 1,
+        window_seconds: float = 60.0,
+        error_rate_source: Callable[[float], tuple[float, int]] | None = None,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.minimum_calls = minimum_calls
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self.window_seconds = window_seconds
+        self.error_rate_source = error_rate_source
+
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._closed_since = time.time()
+        self._half_open_in_flight = 0
+        self._outcomes: deque[tuple[float, bool]] = deque()
+
+        # Statistics
+        self.times_opened = 0
+        self.rejected_calls = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from open to half-open once the wait is over."""
+        if (
+            self._state == CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.open_seconds
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._half_open_in_flight = 0
+        return self._state
+
+    def retry_after(self) -> float:
+        """
+        Get the time until the breaker lets calls through again.
+
+        Returns:
+            float: Seconds to wait, 0.0 if calls may be attempted now
+        """
+        if self.state != CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.open_seconds - time.monotonic())
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may proceed, taking a probe slot if half-open.
+
+        Returns:
+            bool: True if the call may proceed
+        """
+        state = self.state
+        if state == CircuitState.CLOSED:
+            return True
+        if (
+            state == CircuitState.HALF_OPEN
+            and self._half_open_in_flight < self.half_open_calls
+        ):
+            self._half_open_in_flight += 1
+            return True
+
+        self.rejected_calls += 1
+        return False
+
+    def release_probe(self) -> None:
+        """Give back a half-open probe slot whose call recorded no outcome."""
+        if self._state == CircuitState.HALF_OPEN and self._half_open_in_flight:
+            self._half_open_in_flight -= 1
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        if self.error_rate_source is None:
+            self._record_outcome(True)
+        if self._state == CircuitState.HALF_OPEN:
+            self._close()
+
+    def record_failure(self) -> None:
+        """Record a failed call."""
+        if self.error_rate_source is None:
+            self._record_outcome(False)
+
+        if self._state == CircuitState.HALF_OPEN:
+            self._open()
+        elif self._state == CircuitState.CLOSED:
+            error_rate, calls = self._error_rate()
+            if calls >= self.minimum_calls and error_rate >= self.failure_threshold:
+                self._open()
+
+    def get_stats(self) -> dict[str, any]:
+        """
+        Get circuit breaker statistics.
+
+        Returns:
+            Dict: State, error rate and counters
+        """
+        error_rate, calls = self._error_rate()
+        return {
+            "state": self.state.value,
+            "error_rate": error_rate,
+            "calls_in_window": calls,
+            "retry_after_seconds": self.retry_after(),
+            "times_opened": self.times_opened,
+            "rejected_calls": self.rejected_calls,
+        }
+
+    def _open(self) -> None:
+        """Open the breaker."""
+        self._state = CircuitState.OPEN
+        self._opened_at = time.monotonic()
+        self.times_opened += 1
+
+    def _close(self) -> None:
+        """Close the breaker and start a fresh error-rate window."""
+        self._state = CircuitState.CLOSED
+        self._closed_since = time.time()
+        self._outcomes.clear()
+
+    def _record_outcome(self, success: bool) -> None:
+        """Add an outcome to the breaker's own window."""
+        now = time.time()
+        self._outcomes.append((now, success))
+        while self._outcomes and self._outcomes[0][0] <= now - self.window_seconds:
+            self._outcomes.popleft()
+
+    def _error_rate(self) -> tuple[float, int]:
+        """Get the error rate and sample count since the breaker closed."""
+        if self.error_rate_source is not None:
+            return self.error_rate_source(self._closed_since)
+
+        start = max(self._closed_since, time.time() - self.window_seconds)
+        outcomes = [
+            success for timestamp, success in self._outcomes if timestamp > start
+        ]
+        if not outcomes:
+            return 0.0, 0
+        return outcomes.count(False) / len(outcomes), len(outcomes)
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+
+    Holds up to ``burst`` tokens and refills at ``rate`` tokens per second.
+    Each admitted call takes one token, so callers may burst briefly but
+    are held to ``rate`` over time.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else rate
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Take tokens if enough are available.
+
+        Args:
+            tokens: Tokens to take
+
+        Returns:
+            bool: True if the tokens were taken
+        """
+        self._refill()
+        if self._tokens < tokens:
+            return False
+        self._tokens -= tokens
+        return True
+
+    def retry_after(self, tokens: float = 1.0) -> float:
+        """
+        Get the time until enough tokens are available.
+
+        Args:
+            tokens: Tokens needed
+
+        Returns:
+            float: Seconds to wait, 0.0 if the tokens are available now
+        """
+        self._refill()
+        if self._tokens >= tokens:
+            return 0.0
+        return (tokens - self._tokens) / self.rate
+
+    def _refill(self) -> None:
+        """Add the tokens earned since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class LatencyWindow:
+    """
+    Rolling window of recent latencies with percentile lookups.
+
+    Keeps the last ``size`` samples; percentiles are computed on demand
+    and cached until the next sample arrives.
+    """
+
+    def __init__(self, size: int = 200):
+        self._samples: deque[float] = deque(maxlen=size)
+        self._sorted: list[float] | None = None
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Add a latency sample."""
+        self._samples.append(seconds)
+        self._sorted = None
+
+    def percentile(self, fraction: float) -> float | None:
+        """
+        Get a latency percentile.
+
+        Args:
+            fraction: Percentile as a fraction, e.g. 0.95
+
+        Returns:
+            float: Latency in seconds, or None without samples
+        """
+        if not self._samples:
+            return None
+        if self._sorted is None:
+            self._sorted = sorted(self._samples)
+        index = min(len(self._sorted) - 1, int(fraction * len(self._sorted)))
+        return self._sorted[index]
@@ -24,6 +24,7 @@ except ImportError:
     SOLANA_AVAILABLE = False
     print("Warning: Solana.py not available, using mock adapter")
 
+from adapters.chain_metrics_cache import ChainMetricsCache
 from core.interfaces import (
     ChainMetrics,
     ChainType,
@@ -90,6 +91,13 @@ class SolanaAdapter(IUniversalChainAdapter):
             "average_tx_fee": 0,
         }
 
+        # Metrics snapshot for verification, at most about a dozen slots old
+        self.metrics_cache = ChainMetricsCache(
+            lambda: self.get_chain_metrics(),
+            max_staleness=5.0,
+            name="solana",
+        )
+
     @property
     def chain_type(self) -> ChainType:
         """Return the blockchain type this adapter handles."""
@@ -142,6 +150,7 @@ class SolanaAdapter(IUniversalChainAdapter):
                     self.logger.warning(f"Failed to initialize keypair: {e}")
 
             self.logger.info("Connected to Solana network")
+            self.metrics_cache.start()
             return True
 
         except Exception as e:
@@ -150,6 +159,8 @@ class SolanaAdapter(IUniversalChainAdapter):
 
     async def disconnect(self) -> None:
         """Disconnect from Solana network."""
+        await self.metrics_cache.stop()
+
         if self.client and hasattr(self.client, "close"):
             try:
                 await self.client.close()
@@ -207,85 +218,123 @@ class SolanaAdapter(IUniversalChainAdapter):
         Returns:
             ChainVerificationResult: Verification result for Solana
         """
+        results = await self.verify_ai_output_batch([(ai_agent_id, verification_data)])
+        return results[0]
+
+    async def verify_ai_output_batch(
+        self, items: list[tuple[str, dict[str, Any]]]
+    ) -> list[ChainVerificationResult]:
+        """
+        Verify several AI outputs in one Solana transaction.
+
+        Chain metrics are read once and a single transaction is simulated
+        for the whole batch; each result reports an equal share of its fee.
+
+        Args:
+            items: (ai_agent_id, verification_data) pairs
+
+        Returns:
+            List[ChainVerificationResult]: Result of each item, in order
+        """
+        if not items:
+            return []
+
         start_time = datetime.utcnow()
 
         try:
-            self._verification_stats["total_verifications"] += 1
+            self._verification_stats["total_verifications"] += len(items)
 
             # For Phase 1, implement basic verification logic
             # In production, this would use Solana programs
 
-            # Create Solana-specific verification hash
-            verification_hash = self._calculate_verification_hash(verification_data)
-            confidence_score = self._calculate_confidence_score(verification_data)
-
-            # Determine verification status based on confidence
-            if confidence_score >= 0.8:
-                status = VerificationStatus.VERIFIED
-            elif confidence_score >= 0.6:
-                status = VerificationStatus.PENDING
-            else:
-                status = VerificationStatus.REJECTED
-
-            # For Phase 1, simulate transaction without actual submission
-            tx_hash = f"solana_tx_{verification_hash[:44]}"  # Solana uses base58
-            slot_number = (await self.get_chain_metrics()).block_height
+            hashes = []
+            verdicts = []
+            for _, verification_data in items:
+                hashes.append(self._calculate_verification_hash(verification_data))
+                confidence_score = self._calculate_confidence_score(verification_data)
+
+                # Determine verification status based on confidence
+                if confidence_score >= 0.8:
+                    status = VerificationStatus.VERIFIED
+                elif confidence_score >= 0.6:
+                    status = VerificationStatus.PENDING
+                else:
+                    status = VerificationStatus.REJECTED
+                verdicts.append((status, confidence_score))
+
+            # A lone output keeps its own hash; a batch commits to all of them
+            batch_hash = (
+                hashes[0]
+                if len(hashes) == 1
+                else self._calculate_verification_hash({"batch": hashes})
+            )
+
+            # For Phase 1, simulate one transaction without actual submission
+            tx_hash = f"solana_tx_{batch_hash[:44]}"  # Solana uses base58
+            slot_number = (await self.metrics_cache.get()).block_height
             tx_fee = 5000  # Typical Solana transaction fee in lamports
 
             execution_time = (datetime.utcnow() - start_time).total_seconds()
 
-            if status == VerificationStatus.VERIFIED:
-                self._verification_stats["successful_verifications"] += 1
-            else:
-                self._verification_stats["failed_verifications"] += 1
+            verified = sum(
+                status == VerificationStatus.VERIFIED for status, _ in verdicts
+            )
+            self._verification_stats["successful_verifications"] += verified
+            self._verification_stats["failed_verifications"] += len(items) - verified
 
             # Update average transaction fee
             total_fee = (
                 self._verification_stats["average_tx_fee"]
-                * (self._verification_stats["total_verifications"] - 1)
+                * (self._verification_stats["total_verifications"] - len(items))
                 + tx_fee
             )
             self._verification_stats["average_tx_fee"] = (
                 total_fee / self._verification_stats["total_verifications"]
             )
 
-            result = ChainVerificationResult(
-                chain_type=self._chain_type,
-                transaction_hash=tx_hash,
-                block_number=slot_number,
-                verification_status=status,
-                confidence_score=confidence_score,
-                gas_used=tx_fee,  # Using lamports as gas equivalent
-                execution_time=execution_time,
-                error_message=None,
-                verified_at=datetime.utcnow(),
-            )
+            results = [
+                ChainVerificationResult(
+                    chain_type=self._chain_type,
+                    transaction_hash=tx_hash,
+                    block_number=slot_number,
+                    verification_status=status,
+                    confidence_score=confidence_score,
+                    gas_used=tx_fee // len(items),  # Using lamports as gas equivalent
+                    execution_time=execution_time,
+                    error_message=None,
+                    verified_at=datetime.utcnow(),
+                )
+                for status, confidence_score in verdicts
+            ]
 
             self.logger.info(
-                f"Solana verification complete: "
-                f"Status={status.value}, Confidence={confidence_score:.3f}, "
+                "Solana verification complete: "
+                f"Outputs={len(items)}, Verified={verified}, "
                 f"Time={execution_time:.3f}s, Fee={tx_fee} lamports"
             )
 
-            return result
+            return results
 
         except Exception as e:
-            self._verification_stats["failed_verifications"] += 1
+            self._verification_stats["failed_verifications"] += len(items)
             execution_time = (datetime.utcnow() - start_time).total_seconds()
 
             self.logger.error(f"Solana verification failed: {e}")
 
-            return ChainVerificationResult(
-                chain_type=self._chain_type,
-                transaction_hash=None,
-                block_number=None,
-                verification_status=VerificationStatus.ERROR,
-                confidence_score=0.0,
-                gas_used=0,
-                execution_time=execution_time,
-                error_message=str(e),
-                verified_at=datetime.utcnow(),
-            )
+            return [
+                ChainVerificationResult(
+                    chain_type=self._chain_type,
+                    transaction_hash=None,
+                    block_number=None,
+                    verification_status=VerificationStatus.ERROR,
+                    confidence_score=0.0,
+                    gas_used=0,
+                    execution_time=execution_time,
+                    error_message=str(e),
+                    verified_at=datetime.utcnow(),
+                )
+                for _ in items
+            ]
 
     async def submit_consensus_vote(
         self, request_id: str, consensus_data: dict[str, Any]
@@ -340,7 +389,7 @@ class SolanaAdapter(IUniversalChainAdapter):
                     "vote": "verified",
                     "confidence": 0.91,
                     "timestamp": datetime.utcnow().isoformat(),
-                    "slot": (await self.get_chain_metrics()).block_height - 50,
+                    "slot": (await self.metrics_cache.get()).block_height - 50,
                     "stake_weight": 2.1,  # Stake-weighted voting
                 }
             ]
@@ -374,6 +423,7 @@ class SolanaAdapter(IUniversalChainAdapter):
             "success_rate": success_rate,
             "average_tx_fee_lamports": self._verification_stats["average_tx_fee"],
             "rpc_url": self.rpc_url,
+            "metrics_cache": self.metrics_cache.get_stats(),
         }
 
     def _calculate_verification_hash(self, verification_data: dict[str, Any]) -> str:
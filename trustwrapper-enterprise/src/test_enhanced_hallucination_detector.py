@@ -0,0 +1,624 @@
+"""
+Enhanced Hallucination Detector Unit Tests
+==========================================
+
+Unit tests for claim-level verification: batched LLM checks, the claim
+verdict cache, single-flight sharing of in-flight checks, how checker
+verdicts become reported issues, and the pooled Wikipedia HTTP client.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from core import enhanced_hallucination_detector
+from core.enhanced_hallucination_detector import (
+    AIVerificationResult,
+    EnhancedHallucinationDetector,
+    WikipediaFactChecker,
+    create_enhanced_detector,
+)
+from core.hallucination_detector import (
+    HallucinationDetectionResult,
+    HallucinationDetector,
+)
+from trustwrapper.result_cache import ResultCache
+
+TEXT = (
+    "Paris is the capital of France. The moon is made of cheese. "
+    "Water boils at 100C."
+)
+
+
+def supported(model: str = "Wikipedia API") -> AIVerificationResult:
+    return AIVerificationResult(
+        is_factual=True,
+        confidence=0.7,
+        explanation="Evidence supports claim",
+        model_used=model,
+    )
+
+
+def no_evidence() -> AIVerificationResult:
+    return AIVerificationResult(
+        is_factual=False,
+        confidence=0.3,
+        explanation="No relevant Wikipedia articles found",
+        model_used="Wikipedia API",
+        evidence_found=False,
+    )
+
+
+def gemini_verdicts(text, claims):
+    """Flag claims mentioning cheese, accept the rest."""
+    return [
+        AIVerificationResult(
+            is_factual="cheese" not in claim,
+            confidence=0.9,
+            explanation="checked",
+            model_used="Gemini Pro",
+        )
+        for claim in claims
+    ]
+
+
+class TestClaimVerification:
+    """Test suite for EnhancedHallucinationDetector claim checks."""
+
+    @pytest.fixture
+    def detector(self):
+        """Create a detector with mocked Wikipedia and Gemini checkers."""
+        detector = EnhancedHallucinationDetector()
+        detector.wikipedia_checker.verify_fact = AsyncMock(
+            side_effect=lambda claim: supported()
+        )
+        detector.gemini_checker = Mock(available=True)
+        detector.gemini_checker.detect_claims = AsyncMock(side_effect=gemini_verdicts)
+        detector.claude_checker = Mock(available=False)
+        return detector
+
+    @pytest.mark.asyncio
+    async def test_llm_checker_gets_claims_in_one_call(self, detector):
+        """Test unseen claims go to an LLM checker in one call with the text."""
+        verdicts, claim_texts = await detector._verify_claims(TEXT)
+
+        detector.gemini_checker.detect_claims.assert_awaited_once_with(
+            TEXT,
+            [
+                "Paris is the capital of France.",
+                "The moon is made of cheese.",
+                "Water boils at 100C.",
+            ],
+        )
+        assert detector.wikipedia_checker.verify_fact.await_count == 3
+        assert len(verdicts) == len(claim_texts) == 6
+
+    @pytest.mark.asyncio
+    async def test_claim_cache_hits_and_misses(self, detector):
+        """Test known claims are served from the cache and only new ones checked."""
+        await detector._verify_claims(TEXT)
+        stats = detector.get_cache_stats()
+        assert stats["claims_checked"] == 6
+        assert stats["claims_from_cache"] == 0
+
+        verdicts, _ = await detector._verify_claims(
+            "Paris is the capital of France. The sky is green."
+        )
+
+        assert len(verdicts) == 4
+        assert detector.gemini_checker.detect_claims.await_count == 2
+        assert detector.gemini_checker.detect_claims.await_args.args[1] == [
+            "The sky is green."
+        ]
+        assert detector.wikipedia_checker.verify_fact.await_count == 4
+        stats = detector.get_cache_stats()
+        assert stats["claims_checked"] == 10
+        assert stats["claims_from_cache"] == 2
+
+    @pytest.mark.asyncio
+    async def test_repeated_claim_checked_once(self, detector):
+        """Test a claim repeated within one text is checked once per checker."""
+        verdicts, _ = await detector._verify_claims(
+            "The moon is made of cheese. the moon is made of cheese!"
+        )
+
+        assert detector.gemini_checker.detect_claims.await_args.args[1] == [
+            "The moon is made of cheese."
+        ]
+        assert detector.wikipedia_checker.verify_fact.await_count == 1
+        assert len(verdicts) == 4
+
+    @pytest.mark.asyncio
+    async def test_error_verdicts_are_not_cached(self, detector):
+        """Test checker errors are retried instead of served from the cache."""
+        detector.gemini_checker.detect_claims = AsyncMock(
+            side_effect=lambda text, claims: [
+                AIVerificationResult(
+                    True, 0.3, "timeout", model_used="Gemini Pro (Error)"
+                )
+                for _ in claims
+            ]
+        )
+
+        await detector._verify_claims(TEXT)
+        await detector._verify_claims(TEXT)
+
+        assert detector.gemini_checker.detect_claims.await_count == 2
+        assert detector.wikipedia_checker.verify_fact.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_detection_with_checker_error_is_not_cached(self, detector):
+        """Test a detection degraded by a checker error is re-run next time."""
+        error = AIVerificationResult(
+            True, 0.3, "timeout", model_used="Gemini Pro (Error)"
+        )
+        detector.gemini_checker.detect_claims = AsyncMock(
+            side_effect=[[error] * 3, [supported("Gemini Pro")] * 3]
+        )
+
+        await detector.detect_hallucinations(TEXT)
+        await detector.detect_hallucinations(TEXT)
+        await detector.detect_hallucinations(TEXT)
+
+        assert detector.gemini_checker.detect_claims.await_count == 2
+        stats = detector.cache.get_stats()
+        assert stats["hits"] == 1
+        assert stats["entries"] == 1
+
+    @pytest.mark.asyncio
+    async def test_short_batch_reports_no_verdicts(self, detector):
+        """Test a batch answer missing claims yields no verdicts from that checker."""
+        detector.gemini_checker.detect_claims = AsyncMock(return_value=[supported()])
+
+        verdicts, _ = await detector._verify_claims(TEXT)
+
+        assert [v.model_used for v in verdicts] == ["Wikipedia API"] * 3
+        assert detector.claim_cache.get_stats()["entries"] == 3
+
+    def test_factory_passes_claim_cache(self):
+        """Test create_enhanced_detector uses the given claim cache."""
+        claim_cache = ResultCache(max_entries=10)
+
+        detector = create_enhanced_detector(claim_cache=claim_cache)
+
+        assert detector.claim_cache is claim_cache
+
+
+class TestIssueReporting:
+    """Test suite for turning checker verdicts into reported issues."""
+
+    @pytest.fixture
+    def detector(self):
+        """Create a detector with live checkers disabled."""
+        detector = EnhancedHallucinationDetector(enable_cache=False)
+        detector.gemini_checker = Mock(available=False)
+        detector.claude_checker = Mock(available=False)
+        return detector
+
+    def test_no_evidence_is_not_an_issue(self, detector):
+        """Test a checker that found no evidence adds no issue or penalty."""
+        pattern_result = HallucinationDetectionResult()
+
+        result = detector._combine_results(
+            pattern_result, [no_evidence(), no_evidence()], TEXT, ["a", "b"]
+        )
+
+        assert len(result.hallucinations) == 0
+        assert result.trust_score == pattern_result.trust_score
+
+    def test_one_issue_per_contradicted_claim(self, detector):
+        """Test each contradicted claim adds one issue naming that claim."""
+        contradicted = AIVerificationResult(
+            is_factual=False,
+            confidence=0.8,
+            explanation="Evidence contradicts claim",
+            model_used="Wikipedia API",
+        )
+
+        result = detector._combine_results(
+            HallucinationDetectionResult(),
+            [no_evidence(), contradicted, supported()],
+            TEXT,
+            ["first", "second", "third"],
+        )
+
+        assert len(result.hallucinations) == 1
+        assert result.hallucinations[0].source_text == "second"
+
+    @pytest.mark.asyncio
+    async def test_detection_issue_count(self, detector):
+        """Test end-to-end issue counts when the index has nothing on the text."""
+        detector.wikipedia_checker.verify_fact = AsyncMock(return_value=no_evidence())
+        detector.gemini_checker = Mock(available=True)
+        detector.gemini_checker.detect_claims = AsyncMock(side_effect=gemini_verdicts)
+
+        with patch.object(
+            HallucinationDetector,
+            "detect_hallucinations",
+            AsyncMock(return_value=HallucinationDetectionResult()),
+        ):
+            result = await detector.detect_hallucinations(TEXT)
+
+        assert len(result.hallucinations) == 1
+        assert result.hallucinations[0].source_text == "The moon is made of cheese."
+
+    @pytest.fixture
+    def pattern_detection(self):
+        """Replace pattern detection with an empty result."""
+        with patch.object(
+            HallucinationDetector,
+            "detect_hallucinations",
+            AsyncMock(return_value=HallucinationDetectionResult()),
+        ):
+            yield
+
+    @pytest.mark.asyncio
+    async def test_inconclusive_evidence_is_not_an_issue(
+        self, detector, pattern_detection
+    ):
+        """Test articles that neither support nor contradict claims add no issues."""
+        detector.wikipedia_checker._get_live_evidence = AsyncMock(
+            return_value=[
+                {
+                    "title": "Python (programming language)",
+                    "extract": "Python is a high-level programming language.",
+                    "url": "https://en.wikipedia.org/wiki/Python",
+                }
+            ]
+        )
+        text = (
+            "Python is a programming language. Python uses indentation. "
+            "Python has a standard library. Python supports classes. "
+            "Python code runs on many platforms."
+        )
+
+        verdict = await detector.wikipedia_checker.verify_fact("Python is popular.")
+        result = await detector.detect_hallucinations(text)
+
+        assert not verdict.evidence_found
+        assert verdict.sources_checked == ["https://en.wikipedia.org/wiki/Python"]
+        assert len(result.hallucinations) == 0
+        assert result.trust_score == HallucinationDetectionResult().trust_score
+
+    @pytest.mark.asyncio
+    async def test_checker_error_is_not_an_issue(self, detector, pattern_detection):
+        """Test claims whose lookup failed add no issues."""
+        detector.wikipedia_checker._get_live_evidence = AsyncMock(
+            side_effect=RuntimeError("connection reset")
+        )
+
+        verdict = await detector.wikipedia_checker.verify_fact("Paris is big.")
+        result = await detector.detect_hallucinations(TEXT)
+
+        assert not verdict.evidence_found
+        assert verdict.model_used == "Wikipedia API (Error)"
+        assert len(result.hallucinations) == 0
+        assert result.trust_score == HallucinationDetectionResult().trust_score
+
+
+class TestSingleFlight:
+    """Test suite for sharing in-flight detections and claim checks."""
+
+    @pytest.fixture
+    def release(self):
+        """Event holding checker calls until the test sets it."""
+        return asyncio.Event()
+
+    @pytest.fixture
+    def detector(self, release):
+        """Create a detector whose checkers wait for the release event."""
+
+        async def verify_fact(claim):
+            await release.wait()
+            return supported()
+
+        async def detect_claims(text, claims):
+            await release.wait()
+            return gemini_verdicts(text, claims)
+
+        detector = EnhancedHallucinationDetector()
+        detector.wikipedia_checker.verify_fact = AsyncMock(side_effect=verify_fact)
+        detector.gemini_checker = Mock(available=True)
+        detector.gemini_checker.detect_claims = AsyncMock(side_effect=detect_claims)
+        detector.claude_checker = Mock(available=False)
+        return detector
+
+    @pytest.fixture(autouse=True)
+    def pattern_detection(self):
+        """Replace pattern detection with an empty result."""
+        with patch.object(
+            HallucinationDetector,
+            "detect_hallucinations",
+            AsyncMock(side_effect=lambda *args: HallucinationDetectionResult()),
+        ) as detect:
+            yield detect
+
+    async def _settle(self):
+        """Let started tasks run until they wait on the checkers."""
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_detections_share_one_run(
+        self, detector, release, pattern_detection
+    ):
+        """Test concurrent calls for the same text run the checkers once."""
+        callers = [
+            asyncio.ensure_future(detector.detect_hallucinations(TEXT))
+            for _ in range(3)
+        ]
+        await self._settle()
+        release.set()
+        results = await asyncio.gather(*callers)
+
+        assert pattern_detection.await_count == 1
+        assert detector.gemini_checker.detect_claims.await_count == 1
+        assert detector.wikipedia_checker.verify_fact.await_count == 3
+        assert detector.coalesced_detections == 2
+        assert {len(result.hallucinations) for result in results} == {1}
+        assert results[0] is not results[1]
+        assert detector._detections_in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_detections_are_keyed_on_context(
+        self, detector, release, pattern_detection
+    ):
+        """Test the same text under different contexts is detected separately."""
+        contexts = [
+            {"args": ("prompt one",), "kwargs": {}},
+            {"kwargs": {}, "args": ("prompt one",)},
+            {"args": ("prompt two",), "kwargs": {}},
+        ]
+        callers = [
+            asyncio.ensure_future(detector.detect_hallucinations(TEXT, context))
+            for context in contexts
+        ]
+        await self._settle()
+        release.set()
+        await asyncio.gather(*callers)
+
+        assert [call.args[1] for call in pattern_detection.await_args_list] == [
+            contexts[0],
+            contexts[2],
+        ]
+        assert detector.coalesced_detections == 1
+
+        await detector.detect_hallucinations(TEXT, contexts[2])
+        await detector.detect_hallucinations(TEXT)
+        assert pattern_detection.await_count == 3
+        assert detector.cache.get_stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_detections_share_claim_checks(self, detector, release):
+        """Test a claim in flight for one text is not checked again for another."""
+        first = asyncio.ensure_future(
+            detector.detect_hallucinations("The moon is made of cheese. Paris is big.")
+        )
+        await self._settle()
+        second = asyncio.ensure_future(
+            detector.detect_hallucinations("The moon is made of cheese. Rome is old.")
+        )
+        await self._settle()
+        release.set()
+        await asyncio.gather(first, second)
+
+        checked = [
+            call.args[1]
+            for call in detector.gemini_checker.detect_claims.await_args_list
+        ]
+        assert checked == [
+            ["The moon is made of cheese.", "Paris is big."],
+            ["Rome is old."],
+        ]
+        assert detector.wikipedia_checker.verify_fact.await_count == 3
+        assert detector.coalesced_claims == 2
+        assert detector._claims_in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_work(
+        self, detector, release
+    ):
+        """Test cancelling one caller leaves the shared detection running."""
+        cancelled = asyncio.ensure_future(detector.detect_hallucinations(TEXT))
+        waiting = asyncio.ensure_future(detector.detect_hallucinations(TEXT))
+        await self._settle()
+
+        cancelled.cancel()
+        await self._settle()
+        release.set()
+        result = await waiting
+
+        assert cancelled.cancelled()
+        assert len(result.hallucinations) == 1
+        assert detector.gemini_checker.detect_claims.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_work_finishes_after_every_caller_is_cancelled(
+        self, detector, release
+    ):
+        """Test shared work completes and is cached with no caller left."""
+        caller = asyncio.ensure_future(detector.detect_hallucinations(TEXT))
+        await self._settle()
+        caller.cancel()
+        await self._settle()
+
+        release.set()
+        while detector._detections_in_flight:
+            await asyncio.sleep(0)
+        result = await detector.detect_hallucinations(TEXT)
+
+        assert len(result.hallucinations) == 1
+        assert detector.gemini_checker.detect_claims.await_count == 1
+        assert detector.get_cache_stats()["response_cache"]["hits"] == 1
+
+
+def extracts_response(params, normalized=None):
+    """Answer an extracts query with one page per requested title."""
+    normalized = normalized or {}
+    titles = params["titles"].split("|")
+    return {
+        "query": {
+            "normalized": [
+                {"from": title, "to": normalized[title]}
+                for title in titles
+                if title in normalized
+            ],
+            "pages": {
+                str(page_id): {
+                    "title": normalized.get(title, title),
+                    "extract": f"About {normalized.get(title, title)}.",
+                }
+                for page_id, title in enumerate(titles)
+            },
+        }
+    }
+
+
+class FakeResponse:
+    """aiohttp response stand-in returning a fixed JSON document."""
+
+    def __init__(self, data):
+        self.status = 200
+        self.data = data
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def json(self, content_type=None):
+        return self.data
+
+
+class FakeSession:
+    """aiohttp session stand-in that records request parameters."""
+
+    def __init__(self, responder):
+        self.responder = responder
+        self.requests = []
+        self.closed = False
+
+    def get(self, url, params=None):
+        self.requests.append(params)
+        return FakeResponse(self.responder(params))
+
+    async def close(self):
+        self.closed = True
+
+
+class TestWikipediaClient:
+    """Test suite for WikipediaFactChecker's pooled HTTP requests."""
+
+    @pytest.fixture
+    def responder(self):
+        """Mutable holder for the function answering each request."""
+        return {"respond": extracts_response}
+
+    @pytest.fixture
+    def sessions(self, responder):
+        """Patch aiohttp with fake sessions; yields every session created."""
+        created = []
+
+        def client_session(**kwargs):
+            session = FakeSession(lambda params: responder["respond"](params))
+            created.append(session)
+            return session
+
+        fake_aiohttp = Mock()
+        fake_aiohttp.ClientSession = Mock(side_effect=client_session)
+        with patch.multiple(
+            enhanced_hallucination_detector,
+            HAS_AIOHTTP=True,
+            aiohttp=fake_aiohttp,
+            create=True,
+        ):
+            yield created
+
+    @pytest.mark.asyncio
+    async def test_normalized_titles_map_back_to_page_keys(self, sessions, responder):
+        """Test pages the API renamed are reported under the requested keys."""
+        responder["respond"] = lambda params: extracts_response(
+            params, normalized={"Eiffel tower": "Eiffel Tower"}
+        )
+        checker = WikipediaFactChecker()
+
+        summaries = await checker._get_page_summaries(["Eiffel_tower", "Paris"])
+
+        assert len(sessions) == 1
+        assert [params["titles"] for params in sessions[0].requests] == [
+            "Eiffel tower|Paris"
+        ]
+        assert summaries["Eiffel_tower"]["extract"] == "About Eiffel Tower."
+        assert summaries["Eiffel_tower"]["content_urls"]["desktop"]["page"] == (
+            "https://en.wikipedia.org/wiki/Eiffel_tower"
+        )
+        assert summaries["Paris"]["extract"] == "About Paris."
+
+    @pytest.mark.asyncio
+    async def test_titles_are_requested_in_batches_of_20(self, sessions):
+        """Test more than 20 titles are split across queries on one session."""
+        checker = WikipediaFactChecker()
+        page_keys = [f"Page_{i}" for i in range(45)]
+
+        summaries = await checker._get_page_summaries(page_keys)
+
+        assert len(sessions) == 1
+        batches = [params["titles"].split("|") for params in sessions[0].requests]
+        assert [len(batch) for batch in batches] == [20, 20, 5]
+        assert [params["exlimit"] for params in sessions[0].requests] == [20, 20, 5]
+        assert sorted(title for batch in batches for title in batch) == sorted(
+            key.replace("_", " ") for key in page_keys
+        )
+        assert set(summaries) == set(page_keys)
+
+    def test_session_recreated_when_event_loop_changes(self, sessions):
+        """Test a new loop gets a new session and the old one is closed."""
+        checker = WikipediaFactChecker()
+        params = {"titles": "Paris"}
+
+        async def fetch_twice():
+            await checker._get_json(checker.API_URL, params)
+            await checker._get_json(checker.API_URL, params)
+
+        asyncio.run(fetch_twice())
+        assert len(sessions) == 1
+        assert len(sessions[0].requests) == 2
+
+        asyncio.run(fetch_twice())
+        assert len(sessions) == 2
+        assert sessions[0].closed
+        assert not sessions[1].closed
+        assert len(sessions[1].requests) == 2
+
+        asyncio.run(checker.close())
+        assert sessions[1].closed
+
+    @pytest.mark.asyncio
+    async def test_requests_fallback_without_aiohttp(self):
+        """Test lookups use a pooled requests session when aiohttp is missing."""
+        fake_requests = Mock()
+        http = fake_requests.Session.return_value
+        http.get.side_effect = lambda url, params, timeout: Mock(
+            status_code=200, json=Mock(return_value=extracts_response(params))
+        )
+        checker = WikipediaFactChecker(max_connections_per_host=4, timeout_seconds=2)
+
+        with patch.multiple(
+            enhanced_hallucination_detector,
+            HAS_AIOHTTP=False,
+            HAS_REQUESTS=True,
+            requests=fake_requests,
+            create=True,
+        ):
+            summaries = await checker._get_page_summaries(["Paris", "Rome"])
+            await checker.close()
+
+        assert set(summaries) == {"Paris", "Rome"}
+        fake_requests.Session.assert_called_once_with()
+        fake_requests.adapters.HTTPAdapter.assert_called_once_with(pool_maxsize=4)
+        http.mount.assert_called_once_with(
+            "https://", fake_requests.adapters.HTTPAdapter.return_value
+        )
+        assert http.get.call_args.kwargs["timeout"] == 2
+        http.close.assert_called_once_with()
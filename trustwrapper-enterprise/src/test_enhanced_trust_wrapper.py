@@ -0,0 +1,300 @@
+"""
+Enhanced TrustWrapper Pipeline Unit Tests
+=========================================
+
+Unit tests for VerificationPipeline: ordering, backpressure between
+stages, per-stage statistics, failures and caller cancellation; and for
+batch_verify: ordering, concurrency limits and model offloading.
+"""
+
+import asyncio
+import threading
+from collections import Counter
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+from core.enhanced_trust_wrapper import EnhancedTrustWrapper
+from core.hallucination_detector import HallucinationDetectionResult
+
+
+class EchoModel:
+    """Async model that answers immediately."""
+
+    async def async_execute(self, query: str) -> str:
+        return f"answer to {query}"
+
+
+async def settle():
+    """Let pipeline workers run until they block."""
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+class TestVerificationPipeline:
+    """Test suite for VerificationPipeline."""
+
+    @pytest.fixture
+    def release(self):
+        """Event holding detection until the test sets it; set by default."""
+        event = asyncio.Event()
+        event.set()
+        return event
+
+    @pytest.fixture
+    def wrapper(self, release):
+        """Create a wrapper with a mocked detector and no ZK proofs."""
+
+        async def detect(text, context=None):
+            await release.wait()
+            if "fail" in text:
+                raise RuntimeError("detector failed")
+            return HallucinationDetectionResult()
+
+        wrapper = EnhancedTrustWrapper(
+            EchoModel(), enable_zk_proofs=False, enable_detection_cache=False
+        )
+        wrapper.hallucination_detector = Mock(available_services=["Wikipedia"])
+        wrapper.hallucination_detector.detect_hallucinations = AsyncMock(
+            side_effect=detect
+        )
+        return wrapper
+
+    @pytest.mark.asyncio
+    async def test_results_and_stage_stats(self, wrapper):
+        """Test every request completes and each stage counts it."""
+        pipeline = wrapper.create_pipeline(queue_size=4)
+
+        results = await asyncio.gather(
+            *(pipeline.verify(f"query {i}") for i in range(10))
+        )
+        await pipeline.stop()
+
+        assert [result.data for result in results] == [
+            f"answer to query {i}" for i in range(10)
+        ]
+        stats = pipeline.get_stats()
+        assert not stats["running"]
+        for stage in pipeline.STAGES:
+            assert stats["stages"][stage]["processed"] == 10
+            assert stats["stages"][stage]["failed"] == 0
+        assert wrapper.execution_count == 10
+
+    @pytest.mark.asyncio
+    async def test_backpressure_blocks_submit(self, wrapper, release):
+        """Test a stalled stage fills the bounded queues and blocks submit."""
+        release.clear()
+        pipeline = wrapper.create_pipeline(queue_size=1)
+
+        submits = [
+            asyncio.ensure_future(pipeline.submit(f"query {i}")) for i in range(6)
+        ]
+        await settle()
+
+        # One job in detection, one queued for it, one in the model worker
+        # waiting to pass its job on, and one queued for the model stage
+        assert sum(submit.done() for submit in submits) == 4
+        stages = pipeline.get_stats()["stages"]
+        assert stages["model"]["queue_depth"] == 1
+        assert stages["detection"]["queue_depth"] == 1
+
+        release.set()
+        futures = await asyncio.gather(*submits)
+        results = await asyncio.gather(*futures)
+        await pipeline.stop()
+
+        assert len(results) == 6
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {"queue_size": 0},
+            {"workers_per_stage": 0},
+            {"workers_per_stage": {"proof": 0}},
+        ],
+    )
+    def test_rejects_empty_queues_and_stages(self, wrapper, options):
+        """Test unbounded queues and stages without workers are refused."""
+        with pytest.raises(ValueError):
+            wrapper.create_pipeline(**options)
+
+    @pytest.mark.asyncio
+    async def test_stage_failure_fails_only_that_request(self, wrapper):
+        """Test a failing stage fails its request and the pipeline continues."""
+        pipeline = wrapper.create_pipeline()
+
+        with pytest.raises(RuntimeError, match="detector failed"):
+            await pipeline.verify("fail")
+        result = await pipeline.verify("query")
+        await pipeline.stop()
+
+        assert result.data == "answer to query"
+        detection = pipeline.get_stats()["stages"]["detection"]
+        assert detection["failed"] == 1
+        assert detection["processed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_finalize_failure_is_reported_to_caller(self, wrapper):
+        """Test an error building the result reaches the caller's future."""
+        pipeline = wrapper.create_pipeline()
+
+        with patch.object(
+            wrapper, "_finalize", Mock(side_effect=ValueError("bad result"))
+        ):
+            with pytest.raises(ValueError, match="bad result"):
+                await asyncio.wait_for(pipeline.verify("query"), timeout=1)
+        result = await asyncio.wait_for(pipeline.verify("query"), timeout=1)
+        await pipeline.stop()
+
+        assert result.data == "answer to query"
+        assert pipeline.get_stats()["stages"]["evidence"]["failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_is_skipped(self, wrapper, release):
+        """Test a cancelled request is dropped and later requests still run."""
+        release.clear()
+        pipeline = wrapper.create_pipeline()
+        first = await pipeline.submit("query 1")
+        second = await pipeline.submit("query 2")
+        await settle()
+
+        second.cancel()
+        release.set()
+        result = await asyncio.wait_for(first, timeout=1)
+        await pipeline.stop()
+
+        assert result.data == "answer to query 1"
+        # The cancelled request never reached detection
+        assert pipeline.get_stats()["stages"]["detection"]["processed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_during_failing_stage_keeps_worker(self, wrapper, release):
+        """Test a stage failing after its caller cancelled leaves the worker alive."""
+        release.clear()
+        pipeline = wrapper.create_pipeline()
+        failing = await pipeline.submit("fail")
+        await settle()
+
+        failing.cancel()
+        release.set()
+        await settle()
+        result = await asyncio.wait_for(pipeline.verify("query"), timeout=1)
+        await pipeline.stop()
+
+        assert result.data == "answer to query"
+        assert pipeline.get_stats()["stages"]["detection"]["failed"] == 1
+
+
+class TestBatchVerify:
+    """Test suite for EnhancedTrustWrapper.batch_verify."""
+
+    @pytest.fixture
+    def make_wrapper(self):
+        """Build a wrapper around a model with a mocked detector."""
+
+        def make(model):
+            wrapper = EnhancedTrustWrapper(
+                model, enable_zk_proofs=False, enable_detection_cache=False
+            )
+            wrapper.hallucination_detector = Mock(available_services=["Wikipedia"])
+            wrapper.hallucination_detector.detect_hallucinations = AsyncMock(
+                return_value=HallucinationDetectionResult()
+            )
+            return wrapper
+
+        return make
+
+    @pytest.mark.asyncio
+    async def test_model_runs_once_per_query_in_input_order(self, make_wrapper):
+        """Test each query runs the model once and results keep input order."""
+        calls = Counter()
+
+        class SlowFirstModel:
+            async def async_execute(self, query):
+                calls[query] += 1
+                # Earlier queries finish last
+                await asyncio.sleep(0.001 * (10 - int(query.split()[1])))
+                return f"answer to {query}"
+
+        wrapper = make_wrapper(SlowFirstModel())
+        queries = [f"query {i}" for i in range(10)]
+
+        results = await wrapper.batch_verify(queries, max_concurrency=10)
+
+        assert [result.data for result in results] == [
+            f"answer to {query}" for query in queries
+        ]
+        assert calls == Counter(queries)
+        detect = wrapper.hallucination_detector.detect_hallucinations
+        assert detect.await_count == len(queries)
+
+    @pytest.mark.asyncio
+    async def test_in_flight_queries_bounded_by_max_concurrency(self, make_wrapper):
+        """Test no more than max_concurrency queries are in progress at once."""
+        running = 0
+        max_running = 0
+
+        class TrackingModel:
+            async def async_execute(self, query):
+                nonlocal running, max_running
+                running += 1
+                max_running = max(max_running, running)
+                await asyncio.sleep(0.001)
+                running -= 1
+                return query
+
+        wrapper = make_wrapper(TrackingModel())
+
+        results = await wrapper.batch_verify(
+            [f"query {i}" for i in range(12)], max_concurrency=3
+        )
+
+        assert len(results) == 12
+        assert max_running == 3
+
+    @pytest.mark.asyncio
+    async def test_sync_model_is_offloaded(self, make_wrapper):
+        """Test a blocking model runs in threads and leaves the loop free."""
+        gate = threading.Event()
+        runs = []
+
+        class BlockingModel:
+            def execute(self, query):
+                # Only the event loop opens the gate, so this deadlocks
+                # until the timeout if the model blocks the loop
+                runs.append((gate.wait(timeout=2), threading.get_ident()))
+                return query
+
+        async def open_gate():
+            await asyncio.sleep(0.01)
+            gate.set()
+
+        wrapper = make_wrapper(BlockingModel())
+
+        results, _ = await asyncio.gather(
+            wrapper.batch_verify(["a", "b", "c"], max_concurrency=3), open_gate()
+        )
+
+        assert [result.data for result in results] == ["a", "b", "c"]
+        assert [released for released, _ in runs] == [True] * 3
+        assert threading.get_ident() not in {thread for _, thread in runs}
+
+    @pytest.mark.asyncio
+    async def test_failing_query_does_not_fail_batch(self, make_wrapper):
+        """Test a model error is reported for its query and the rest complete."""
+
+        class FlakyModel:
+            async def async_execute(self, query):
+                if query == "bad":
+                    raise RuntimeError("model down")
+                return f"answer to {query}"
+
+        wrapper = make_wrapper(FlakyModel())
+
+        results = await wrapper.batch_verify(["first", "bad", "last"])
+
+        assert [result.data for result in results] == [
+            "answer to first",
+            "Model execution error: model down",
+            "answer to last",
+        ]
+        assert wrapper.execution_count == 3
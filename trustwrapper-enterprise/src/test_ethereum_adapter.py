@@ -5,6 +5,9 @@ Ethereum Adapter Unit Tests
 Unit tests for Ethereum blockchain adapter implementation.
 """
 
+import asyncio
+import threading
+import time
 from datetime import datetime
 from unittest.mock import Mock, patch
 
@@ -139,6 +142,44 @@ class TestEthereumAdapter:
         assert metrics.finality_time > 0
         assert isinstance(metrics.last_updated, datetime)
 
+    async def test_get_chain_metrics_runs_rpcs_off_event_loop(self, ethereum_adapter):
+        """Test blocking web3 calls do not stall the event loop."""
+        loop_thread = threading.get_ident()
+        rpc_threads = set()
+
+        def get_block(block_id):
+            rpc_threads.add(threading.get_ident())
+            time.sleep(0.05)  # A slow RPC round trip
+            if block_id == "latest":
+                return {"number": 18500000, "timestamp": 1700000120}
+            return {"number": block_id, "timestamp": 1700000000}
+
+        mock_web3 = Mock()
+        mock_web3.is_connected.return_value = True
+        mock_web3.eth.chain_id = 1
+        mock_web3.eth.gas_price = 20000000000
+        mock_web3.eth.get_block.side_effect = get_block
+        ethereum_adapter.w3 = mock_web3
+
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0.005)
+
+        ticker = asyncio.create_task(tick())
+        try:
+            metrics = await ethereum_adapter.get_chain_metrics()
+        finally:
+            ticker.cancel()
+
+        assert metrics.block_height == 18500000
+        assert metrics.block_time == 12.0
+        assert rpc_threads and loop_thread not in rpc_threads
+        assert ticks > 5  # The loop kept running while the RPCs waited
+
     async def test_get_chain_metrics_not_connected(self, ethereum_adapter):
         """Test get_chain_metrics raises error when not connected."""
         with pytest.raises(ConnectionError, match="Not connected to ethereum"):
@@ -205,6 +246,82 @@ class TestEthereumAdapter:
         assert result.error_message is not None
         assert "Network error" in result.error_message
 
+    @patch("web3.Web3")
+    async def test_verify_ai_output_reuses_metrics_snapshot(
+        self, mock_web3_class, ethereum_adapter
+    ):
+        """Test verification reads chain metrics from the cached snapshot."""
+        # Set up mock connection
+        mock_web3 = Mock()
+        mock_web3.is_connected.return_value = True
+        mock_web3_class.return_value = mock_web3
+        ethereum_adapter.w3 = mock_web3
+
+        verification_data = {"ai_output": "test", "model_id": "predictor_v1"}
+
+        with patch.object(ethereum_adapter, "get_chain_metrics") as mock_metrics:
+            mock_metrics.return_value = Mock(block_height=18500000, block_time=12.0)
+
+            for _ in range(3):
+                result = await ethereum_adapter.verify_ai_output(
+                    ai_agent_id="test_agent", verification_data=verification_data
+                )
+                assert result.block_number == 18500000
+            assert mock_metrics.call_count == 1
+
+            # A snapshot older than the staleness bound is fetched again
+            mock_metrics.return_value = Mock(block_height=18500001, block_time=12.0)
+            with patch(
+                "adapters.chain_metrics_cache.time.monotonic",
+                return_value=time.monotonic() + 60,
+            ):
+                result = await ethereum_adapter.verify_ai_output(
+                    ai_agent_id="test_agent", verification_data=verification_data
+                )
+
+        assert result.block_number == 18500001
+        assert mock_metrics.call_count == 2
+
+        stats = ethereum_adapter.get_verification_stats()["metrics_cache"]
+        assert stats["hits"] == 2
+        assert stats["misses"] == 2
+
+    @patch("web3.Web3")
+    async def test_verify_ai_output_batch(self, mock_web3_class, ethereum_adapter):
+        """Test a batch is verified with one metrics read and one transaction."""
+        # Set up mock connection
+        mock_web3 = Mock()
+        mock_web3.is_connected.return_value = True
+        mock_web3_class.return_value = mock_web3
+        ethereum_adapter.w3 = mock_web3
+
+        items = [
+            ("test_agent", {"ai_output": f"output {i}", "model_id": "predictor_v1"})
+            for i in range(3)
+        ]
+
+        with patch.object(ethereum_adapter, "get_chain_metrics") as mock_metrics:
+            mock_metrics.return_value = Mock(block_height=18500000, block_time=12.0)
+
+            results = await ethereum_adapter.verify_ai_output_batch(items)
+            single = await ethereum_adapter.verify_ai_output(*items[0])
+
+        assert mock_metrics.call_count == 1
+        assert len(results) == 3
+        assert len({result.transaction_hash for result in results}) == 1
+        assert all(result.gas_used == 50000 for result in results)
+        assert all(result.block_number == 18500000 for result in results)
+
+        # A single verification keeps the transaction hash of its own output
+        output_hash = ethereum_adapter._calculate_verification_hash(items[0][1])
+        assert single.transaction_hash == f"0x{output_hash[:64]}"
+        assert single.transaction_hash != results[0].transaction_hash
+        assert single.gas_used == 150000
+
+        stats = ethereum_adapter.get_verification_stats()
+        assert stats["total_verifications"] == 4
+        assert stats["average_gas_used"] == 75000
+
     @patch("web3.Web3")
     async def test_submit_consensus_vote(self, mock_web3_class, ethereum_adapter):
         """Test consensus vote submission."""
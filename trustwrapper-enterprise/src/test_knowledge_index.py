@@ -0,0 +1,159 @@
+"""
+Offline Knowledge Index Tests
+=============================
+
+Round-trip tests for building, searching and closing the memory-mapped
+BM25 index.
+"""
+
+import json
+
+import pytest
+from core.knowledge_index import (
+    INDEX_FORMAT_VERSION,
+    OfflineKnowledgeIndex,
+    build_knowledge_index,
+    iter_jsonl_corpus,
+)
+
+DOCUMENTS = [
+    {
+        "title": "Eiffel Tower",
+        "text": "The Eiffel Tower is a wrought iron lattice tower in Paris.",
+        "url": "https://en.wikipedia.org/wiki/Eiffel_Tower",
+    },
+    {
+        "title": "Paris",
+        "text": "Paris is the capital and largest city of France.",
+        "url": "https://en.wikipedia.org/wiki/Paris",
+    },
+    {
+        "title": "Mount Everest",
+        "text": "Mount Everest is the highest mountain above sea level.",
+        "url": "https://en.wikipedia.org/wiki/Mount_Everest",
+    },
+    {
+        "title": "Zürich",
+        "text": "Zürich is the largest city in Switzerland.",
+        "url": "https://en.wikipedia.org/wiki/Z%C3%BCrich",
+    },
+]
+
+
+class TestOfflineKnowledgeIndex:
+    """Test suite for OfflineKnowledgeIndex and build_knowledge_index."""
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        """Build an index over DOCUMENTS and open it."""
+        build_knowledge_index(DOCUMENTS, str(tmp_path))
+        index = OfflineKnowledgeIndex(str(tmp_path))
+        yield index
+        index.close()
+
+    def test_build_writes_sorted_lexicon(self, tmp_path):
+        """Test the lexicon is written as sorted terms, not a JSON map."""
+        meta = build_knowledge_index(DOCUMENTS, str(tmp_path))
+
+        assert meta["format_version"] == INDEX_FORMAT_VERSION
+        assert meta["document_count"] == len(DOCUMENTS)
+        assert not (tmp_path / "lexicon.json").exists()
+
+        index = OfflineKnowledgeIndex(str(tmp_path))
+        try:
+            offsets = index._term_offsets
+            terms = [
+                bytes(index._terms[offsets[i] : offsets[i + 1]])
+                for i in range(index.term_count)
+            ]
+            assert terms == sorted(terms)
+            assert len(set(terms)) == meta["term_count"]
+        finally:
+            index.close()
+
+    def test_search_ranks_matching_documents(self, index):
+        """Test search returns the best matching documents first."""
+        assert index.search("highest mountain")[0][0] == 2
+        assert index.search("Eiffel tower")[0][0] == 0
+        assert {doc_id for doc_id, _ in index.search("largest city")} == {1, 3}
+        assert index.search("nonexistent") == []
+
+    def test_every_term_is_found(self, index):
+        """Test binary search finds every term, including non-ASCII ones."""
+        assert index.lookup("zürich") is not None
+        assert index.lookup("paris")[1] == 2
+        assert index.lookup("aaa") is None
+        assert index.lookup("zzzzzz") is None
+
+    @pytest.mark.asyncio
+    async def test_get_evidence_round_trip(self, index):
+        """Test evidence dicts come back as they were stored."""
+        evidence = await index.get_evidence("wrought iron lattice", limit=1)
+
+        assert evidence == [
+            {
+                "title": "Eiffel Tower",
+                "extract": DOCUMENTS[0]["text"],
+                "url": DOCUMENTS[0]["url"],
+            }
+        ]
+
+    def test_empty_corpus(self, tmp_path):
+        """Test an index with no documents opens and finds nothing."""
+        build_knowledge_index([], str(tmp_path))
+        index = OfflineKnowledgeIndex(str(tmp_path))
+        try:
+            assert index.term_count == 0
+            assert index.search("anything") == []
+        finally:
+            index.close()
+
+    def test_close_releases_maps(self, tmp_path):
+        """Test close releases every memory map."""
+        build_knowledge_index(DOCUMENTS, str(tmp_path))
+        index = OfflineKnowledgeIndex(str(tmp_path))
+        index.close()
+
+        assert index._files == []
+        with pytest.raises(ValueError):
+            index.search("paris")
+
+    def test_rejects_other_format_version(self, tmp_path):
+        """Test an index written in another format is refused."""
+        build_knowledge_index(DOCUMENTS, str(tmp_path))
+        meta_path = tmp_path / "meta.json"
+        meta = json.loads(meta_path.read_text())
+        meta["format_version"] = INDEX_FORMAT_VERSION - 1
+        meta_path.write_text(json.dumps(meta))
+
+        with pytest.raises(ValueError):
+            OfflineKnowledgeIndex(str(tmp_path))
+
+    def test_jsonl_corpus_round_trip(self, tmp_path):
+        """Test a JSON-lines corpus builds the same index as the documents."""
+        corpus = tmp_path / "corpus.jsonl"
+        corpus.write_text(
+            "\n".join(json.dumps(document) for document in DOCUMENTS) + "\n\n",
+            encoding="utf-8",
+        )
+        build_knowledge_index(iter_jsonl_corpus(str(corpus)), str(tmp_path / "index"))
+
+        index = OfflineKnowledgeIndex(str(tmp_path / "index"))
+        try:
+            assert index.document_count == len(DOCUMENTS)
+            assert index.get_document(3)["title"] == "Zürich"
+        finally:
+            index.close()
+
+    def test_merged_runs_match_single_run_build(self, tmp_path):
+        """Test spilling postings to many runs writes the same index."""
+        single, merged = tmp_path / "single", tmp_path / "merged"
+        build_knowledge_index(DOCUMENTS, str(single))
+        meta = build_knowledge_index(DOCUMENTS, str(merged), postings_per_run=1)
+
+        assert meta == json.loads((single / "meta.json").read_text())
+        assert sorted(p.name for p in merged.iterdir()) == sorted(
+            p.name for p in single.iterdir()
+        )  # The runs are cleaned up
+        for path in single.glob("*.bin"):
+            assert (merged / path.name).read_bytes() == path.read_bytes()
@@ -13,10 +13,14 @@ Target: 1,000 RPS baseline, <100ms latency, 95%+ success rate
 """
 
 import asyncio
+import gc
+import json
 import statistics
 import threading
 import time
+import tracemalloc
 from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
 
 import psutil
@@ -27,8 +31,9 @@ from adapters.solana_adapter import SolanaAdapter
 from bridge.consensus_engine import CrossChainConsensusEngine
 from bridge.cross_chain_bridge import CrossChainBridge
 from bridge.health_monitor import BridgeHealthMonitor
-from bridge.interfaces import BridgeMessageType
+from bridge.interfaces import BridgeMessage, BridgeMessageType, BridgeRoute
 from bridge.message_broker import CrossChainMessageBroker
+from bridge.wire_format import decode_message, encode_message
 
 # Import Phase 1 components for performance testing
 from core.connection_manager import MultiChainConnectionManager
@@ -376,6 +381,127 @@ class TrustWrapperPerformanceTester:
             resource_metrics=resource_metrics,
         )
 
+    async def benchmark_message_memory(
+        self, num_messages: int = 100000
+    ) -> dict[str, float]:
+        """Measure broker memory per queued message, payloads included"""
+        print(f"🧪 Running Message Memory ({num_messages} messages)...")
+
+        message_broker = CrossChainMessageBroker(max_queue_size=num_messages)
+        route = BridgeRoute(
+            source_chain=ChainType.ETHEREUM,
+            target_chain=ChainType.CARDANO,
+            adapter_class="CardanoBridgeAdapter",
+            health_score=1.0,
+            latency_ms=0.0,
+            throughput_msg_per_sec=0.0,
+            reliability_score=1.0,
+        )
+        await message_broker.initialize({}, [route])
+
+        gc.collect()
+        tracemalloc.start()
+        baseline_bytes = tracemalloc.get_traced_memory()[0]
+        start_time = time.time()
+
+        for i in range(num_messages):
+            await message_broker.send_message(
+                message_type=BridgeMessageType.SYNCHRONIZATION,
+                source_chain=ChainType.ETHEREUM,
+                target_chain=ChainType.CARDANO,
+                payload={"sequence": i},
+            )
+
+        duration = time.time() - start_time
+        queued_bytes = tracemalloc.get_traced_memory()[0] - baseline_bytes
+        tracemalloc.stop()
+
+        gc_start = time.perf_counter()
+        gc.collect()
+        gc_pause_ms = (time.perf_counter() - gc_start) * 1000
+
+        result = {
+            "messages": num_messages,
+            "bytes_per_message": queued_bytes / num_messages,
+            "total_mb": queued_bytes / 1024 / 1024,
+            "enqueue_per_second": num_messages / duration,
+            "full_gc_pause_ms": gc_pause_ms,
+        }
+        print(
+            f"   Memory: {result['bytes_per_message']:.0f} bytes/message, "
+            f"{result['total_mb']:.1f}MB total, full GC {gc_pause_ms:.1f}ms"
+        )
+        return result
+
+    def benchmark_wire_format(self, num_messages: int = 10000) -> dict[str, float]:
+        """Compare the binary wire format with JSON message encoding"""
+        print(f"🧪 Running Wire Format ({num_messages} messages)...")
+
+        messages = [
+            BridgeMessage(
+                message_id=f"wire-{i:08d}",
+                message_type=BridgeMessageType.VERIFICATION_REQUEST,
+                source_chain=ChainType.ETHEREUM,
+                target_chain=ChainType.CARDANO,
+                payload={
+                    "verification_data": {"agent_id": f"agent-{i % 100}", "score": 0.9},
+                    "required_confidence": 0.8,
+                },
+                timestamp=datetime.utcnow(),
+                timeout_seconds=30,
+                priority=1,
+            )
+            for i in range(num_messages)
+        ]
+
+        def encode_json(message: BridgeMessage) -> bytes:
+            fields = {
+                "message_id": message.message_id,
+                "message_type": message.message_type.value,
+                "source_chain": message.source_chain.value,
+                "target_chain": message.target_chain.value,
+                "payload": message.payload,
+                "timestamp": message.timestamp.isoformat(),
+                "timeout_seconds": message.timeout_seconds,
+                "priority": message.priority,
+            }
+            return json.dumps(fields, sort_keys=True).encode("utf-8")
+
+        start = time.perf_counter()
+        json_frames = [encode_json(message) for message in messages]
+        json_encode = time.perf_counter() - start
+        start = time.perf_counter()
+        for frame in json_frames:
+            json.loads(frame)
+        json_decode = time.perf_counter() - start
+
+        start = time.perf_counter()
+        wire_frames = [encode_message(message) for message in messages]
+        wire_encode = time.perf_counter() - start
+        start = time.perf_counter()
+        for frame in wire_frames:
+            decode_message(frame)
+        wire_decode = time.perf_counter() - start
+
+        result = {
+            "messages": num_messages,
+            "json_bytes_per_message": sum(map(len, json_frames)) / num_messages,
+            "wire_bytes_per_message": sum(map(len, wire_frames)) / num_messages,
+            "json_encode_us": json_encode / num_messages * 1e6,
+            "wire_encode_us": wire_encode / num_messages * 1e6,
+            "json_decode_us": json_decode / num_messages * 1e6,
+            "wire_decode_us": wire_decode / num_messages * 1e6,
+        }
+        print(
+            f"   Size: {result['wire_bytes_per_message']:.0f}B vs "
+            f"{result['json_bytes_per_message']:.0f}B JSON; "
+            f"encode {result['wire_encode_us']:.1f}us vs "
+            f"{result['json_encode_us']:.1f}us; "
+            f"decode {result['wire_decode_us']:.1f}us vs "
+            f"{result['json_decode_us']:.1f}us"
+        )
+        return result
+
     async def benchmark_sustained_load(
         self, env: dict[str, Any], target_rps: int = 1000, duration_seconds: int = 60
     ) -> PerformanceMetrics:
@@ -558,8 +684,17 @@ class TrustWrapperPerformanceTester:
         sustained_result = await self.benchmark_sustained_load(env, 100, 30)
         test_results.append(sustained_result)
 
+        # Test 5: Broker memory per queued message
+        memory_result = await self.benchmark_message_memory()
+
+        # Test 6: Binary wire format against JSON encoding
+        wire_result = self.benchmark_wire_format()
+
         # Generate comprehensive report
-        return self.generate_performance_report(test_results)
+        report = self.generate_performance_report(test_results)
+        report["message_memory"] = memory_result
+        report["wire_format"] = wire_result
+        return report
 
     def generate_performance_report(
         self, results: list[PerformanceMetrics]
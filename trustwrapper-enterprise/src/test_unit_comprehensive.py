@@ -12,7 +12,11 @@ Complete unit test coverage for all Phase 1 components:
 Target: >90% code coverage, comprehensive validation
 """
 
+import asyncio
+import os
+import threading
 import time
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -21,21 +25,47 @@ from adapters.bitcoin_adapter import BitcoinAdapter
 from adapters.cardano_adapter import CardanoAdapter
 from adapters.ethereum_adapter import EthereumAdapter
 from adapters.solana_adapter import SolanaAdapter
+from bridge.admission import AdmissionController, AdmissionRejected
 from bridge.consensus_engine import ConsensusProtocol, CrossChainConsensusEngine
 from bridge.cross_chain_bridge import CrossChainBridge
-from bridge.health_monitor import BridgeHealthMonitor
+from bridge.health_monitor import BridgeHealthMonitor, RouteHealthTracker
 from bridge.interfaces import (
+    BridgeMessage,
+    BridgeMessageStatus,
     BridgeMessageType,
+    BridgeRoute,
+    ConsensusVote,
+)
+from bridge.message_broker import CrossChainMessageBroker, MessageQueue, RouteShard
+from bridge.message_wal import MessageWAL
+from bridge.timer_wheel import TimerWheel
+from bridge.wire_format import (
+    WireFormatError,
+    decode_message,
+    decode_message_batch,
+    decode_vote,
+    encode_message,
+    encode_message_batch,
+    encode_vote,
 )
-from bridge.message_broker import CrossChainMessageBroker
 from core.connection_manager import MultiChainConnectionManager
 from core.consensus_engine import (
+    ConsensusPhase,
     ConsensusResult,
+    ConsensusState,
     MultiChainConsensusEngine,
 )
 
 # Import all components for unit testing
-from core.interfaces import ChainType, ChainVerificationResult, IUniversalChainAdapter
+from core.interfaces import (
+    ChainType,
+    ChainVerificationResult,
+    ConsensusConfig,
+    IUniversalChainAdapter,
+    VerificationRequest,
+    VerificationStatus,
+)
+from core.resilience import CircuitState, DecorrelatedJitterBackoff, RetryBudget
 
 
 class TestCoreInterfaces:
@@ -265,6 +295,434 @@ class TestMultiChainConsensusEngine:
         assert result.success is False
         assert "timeout" in result.error_details.lower()
 
+    @pytest.mark.asyncio
+    async def test_early_termination_quorum(self):
+        """Test that consensus does not wait for chains that cannot change it"""
+        engine = MultiChainConsensusEngine(
+            ConsensusConfig(
+                min_participating_chains=2,
+                consensus_threshold=0.67,
+                timeout_seconds=30,
+                chain_weights={
+                    ChainType.ETHEREUM: 2.0,
+                    ChainType.CARDANO: 1.5,
+                    ChainType.BITCOIN: 1.0,
+                },
+            )
+        )
+
+        async def slow_verification(**kwargs):
+            await asyncio.sleep(10)
+
+        for chain in [ChainType.ETHEREUM, ChainType.CARDANO, ChainType.BITCOIN]:
+            adapter = Mock()
+            adapter.chain_type = chain
+            adapter.is_connected = True
+            adapter.verify_ai_output = AsyncMock(
+                return_value=ChainVerificationResult(
+                    chain_type=chain,
+                    verification_status=VerificationStatus.VERIFIED,
+                    confidence_score=0.9,
+                    gas_used=1000,
+                    transaction_hash=f"0x{chain.value}",
+                    details={},
+                )
+            )
+            adapter.submit_consensus_vote = AsyncMock(return_value="0xvote")
+            if chain == ChainType.BITCOIN:
+                adapter.verify_ai_output.side_effect = slow_verification
+            await engine.add_chain_adapter(adapter)
+
+        request = VerificationRequest(
+            request_id="quorum-1",
+            ai_agent_id="test_agent",
+            verification_data={"output": "verified"},
+            target_chains=[ChainType.ETHEREUM, ChainType.CARDANO, ChainType.BITCOIN],
+            consensus_threshold=0.67,
+            timeout_seconds=10,
+        )
+
+        started = time.monotonic()
+        result = await engine.verify_cross_chain(request)
+
+        # 3.5 of 4.5 weight verified clears 0.67 whatever Bitcoin says
+        assert time.monotonic() - started < 1.0
+        assert result.overall_status == VerificationStatus.VERIFIED
+        assert len(result.chain_results) == 2
+        assert engine.stats["early_terminations"] == 1
+        assert engine.stats["stragglers_cancelled"] == 1
+
+    @pytest.mark.asyncio
+    async def test_verification_tasks_cancelled_on_exit(self):
+        """Test that chain verifications do not outlive the verification phase"""
+        engine = MultiChainConsensusEngine(
+            ConsensusConfig(min_participating_chains=1, consensus_threshold=0.67)
+        )
+        chains = [ChainType.ETHEREUM, ChainType.SOLANA, ChainType.CARDANO]
+        started = set()
+        cancelled = set()
+        answer_first = False
+
+        for chain in chains:
+
+            async def verify(chain=chain, **kwargs):
+                started.add(chain)
+                if chain == ChainType.ETHEREUM and answer_first:
+                    return ChainVerificationResult(
+                        chain_type=chain,
+                        verification_status=VerificationStatus.VERIFIED,
+                        confidence_score=0.9,
+                    )
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.add(chain)
+                    raise
+
+            adapter = Mock()
+            adapter.chain_type = chain
+            adapter.is_connected = True
+            adapter.verify_ai_output = AsyncMock(side_effect=verify)
+            await engine.add_chain_adapter(adapter)
+
+        def make_state(request_id):
+            request = VerificationRequest(
+                request_id=request_id,
+                ai_agent_id="test_agent",
+                verification_data={"output": "verified"},
+                target_chains=chains,
+                consensus_threshold=0.67,
+                timeout_seconds=10,
+            )
+            return ConsensusState(
+                request_id=request_id,
+                request=request,
+                phase=ConsensusPhase.INITIALIZATION,
+                participating_chains=set(chains),
+                timeout_time=datetime.utcnow() + timedelta(seconds=10),
+            )
+
+        async def settle():
+            for _ in range(5):
+                await asyncio.sleep(0)
+
+        # The caller is cancelled while every chain is still verifying
+        phase = asyncio.create_task(
+            engine._execute_parallel_verification(make_state("cancel-1"))
+        )
+        await settle()
+        assert started == set(chains)
+        phase.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await phase
+        await settle()
+        assert cancelled == set(chains)
+
+        # An error after the first answer stops the chains still verifying
+        started.clear()
+        cancelled.clear()
+        answer_first = True
+        state = make_state("error-1")
+        with patch.object(
+            engine, "_decided_status", side_effect=RuntimeError("status failed")
+        ):
+            assert await engine._execute_parallel_verification(state) is False
+        await settle()
+        assert state.errors == ["Verification phase error: status failed"]
+        assert cancelled == {ChainType.SOLANA, ChainType.CARDANO}
+
+    @pytest.mark.asyncio
+    async def test_hedged_chain_verification(self):
+        """Test that a verification slower than the chain's p95 is hedged"""
+        engine = MultiChainConsensusEngine(
+            ConsensusConfig(min_participating_chains=2, consensus_threshold=0.67)
+        )
+
+        def make_adapter(chain, delay):
+            async def verify(**kwargs):
+                await asyncio.sleep(delay)
+                return ChainVerificationResult(
+                    chain_type=chain,
+                    verification_status=VerificationStatus.VERIFIED,
+                    confidence_score=0.9,
+                )
+
+            adapter = Mock()
+            adapter.chain_type = chain
+            adapter.is_connected = True
+            adapter.verify_ai_output = AsyncMock(side_effect=verify)
+            adapter.submit_consensus_vote = AsyncMock(return_value="0xvote")
+            return adapter
+
+        await engine.add_chain_adapter(make_adapter(ChainType.ETHEREUM, 10))
+        await engine.add_chain_adapter(make_adapter(ChainType.SOLANA, 0))
+        hedge = make_adapter(ChainType.ETHEREUM, 0)
+        await engine.add_hedge_adapter(hedge)
+        for _ in range(engine.hedge_min_samples):
+            engine._chain_latency[ChainType.ETHEREUM].record(0.01)
+
+        request = VerificationRequest(
+            request_id="hedge-1",
+            ai_agent_id="test_agent",
+            verification_data={"output": "verified"},
+            target_chains=[ChainType.ETHEREUM, ChainType.SOLANA],
+            consensus_threshold=0.67,
+            timeout_seconds=5,
+        )
+
+        started = time.monotonic()
+        result = await engine.verify_cross_chain(request)
+
+        assert time.monotonic() - started < 1.0
+        assert result.overall_status == VerificationStatus.VERIFIED
+        hedge.verify_ai_output.assert_awaited_once()
+        assert engine.stats["hedged_verifications"] == 1
+        assert engine.stats["hedge_wins"] == 1
+
+    @pytest.mark.asyncio
+    async def test_duplicate_requests_share_round(self):
+        """Test that identical requests share one verification round"""
+        engine = MultiChainConsensusEngine(
+            ConsensusConfig(min_participating_chains=2, consensus_threshold=0.67)
+        )
+
+        adapters = []
+        for chain in [ChainType.ETHEREUM, ChainType.SOLANA]:
+
+            async def verify(chain=chain, **kwargs):
+                await asyncio.sleep(0.05)
+                return ChainVerificationResult(
+                    chain_type=chain,
+                    verification_status=VerificationStatus.VERIFIED,
+                    confidence_score=0.9,
+                )
+
+            adapter = Mock()
+            adapter.chain_type = chain
+            adapter.is_connected = True
+            adapter.verify_ai_output = AsyncMock(side_effect=verify)
+            adapter.submit_consensus_vote = AsyncMock(return_value="0xvote")
+            await engine.add_chain_adapter(adapter)
+            adapters.append(adapter)
+
+        def make_request(request_id, data):
+            return VerificationRequest(
+                request_id=request_id,
+                ai_agent_id="test_agent",
+                verification_data=data,
+                target_chains=[ChainType.ETHEREUM, ChainType.SOLANA],
+                consensus_threshold=0.67,
+                timeout_seconds=5,
+            )
+
+        # Concurrent duplicates join one round; key order does not matter
+        first, second = await asyncio.gather(
+            engine.verify_cross_chain(make_request("req-1", {"a": 1, "b": 2})),
+            engine.verify_cross_chain(make_request("req-2", {"b": 2, "a": 1})),
+        )
+        assert first.request_id == "req-1"
+        assert second.request_id == "req-2"
+        assert second.consensus_score == first.consensus_score
+
+        # A recent duplicate reuses the result; different data does not
+        await engine.verify_cross_chain(make_request("req-3", {"a": 1, "b": 2}))
+        assert all(a.verify_ai_output.await_count == 1 for a in adapters)
+        await engine.verify_cross_chain(make_request("req-4", {"a": 2}))
+        assert all(a.verify_ai_output.await_count == 2 for a in adapters)
+
+        assert engine.stats["deduplicated_requests"] == 2
+        assert engine.stats["total_requests"] == 2
+
+    @pytest.mark.asyncio
+    async def test_batched_verification_rounds(self):
+        """Test that requests within the batch window share one round"""
+        engine = MultiChainConsensusEngine(
+            ConsensusConfig(min_participating_chains=2, consensus_threshold=0.67)
+        )
+        engine.batch_window_seconds = 0.05
+        engine.max_batch_size = 3
+
+        adapters = []
+        for chain in [ChainType.ETHEREUM, ChainType.SOLANA]:
+
+            async def verify(chain=chain, ai_agent_id=None, verification_data=None):
+                confident = verification_data["score"] >= 0.8
+                return ChainVerificationResult(
+                    chain_type=chain,
+                    verification_status=(
+                        VerificationStatus.VERIFIED
+                        if confident
+                        else VerificationStatus.REJECTED
+                    ),
+                    confidence_score=verification_data["score"],
+                )
+
+            adapter = Mock()
+            adapter.chain_type = chain
+            adapter.is_connected = True
+            adapter.verify_ai_output = AsyncMock(side_effect=verify)
+            adapter.submit_consensus_vote = AsyncMock(return_value="0xvote")
+            await engine.add_chain_adapter(adapter)
+            adapters.append(adapter)
+
+        def make_request(request_id, score):
+            return VerificationRequest(
+                request_id=request_id,
+                ai_agent_id="test_agent",
+                verification_data={"score": score},
+                target_chains=[ChainType.ETHEREUM, ChainType.SOLANA],
+                consensus_threshold=0.67,
+                timeout_seconds=5,
+            )
+
+        # A full batch closes at once; the remainder closes with the window
+        results = await asyncio.gather(
+            *(
+                engine.verify_cross_chain(make_request(f"req-{i}", score))
+                for i, score in enumerate([0.9, 0.5, 0.95, 0.85])
+            )
+        )
+        assert [r.request_id for r in results] == [f"req-{i}" for i in range(4)]
+        assert [r.overall_status for r in results] == [
+            VerificationStatus.VERIFIED,
+            VerificationStatus.REJECTED,
+            VerificationStatus.VERIFIED,
+            VerificationStatus.VERIFIED,
+        ]
+
+        # One vote per chain per batch, over the Merkle root of its verdicts
+        for adapter in adapters:
+            assert adapter.verify_ai_output.await_count == 4
+            assert adapter.submit_consensus_vote.await_count == 2
+            batch_sizes = sorted(
+                call.args[1]["batch_size"]
+                for call in adapter.submit_consensus_vote.await_args_list
+            )
+            assert batch_sizes == [1, 3]
+            assert all(
+                len(call.args[1]["merkle_root"]) == 64
+                for call in adapter.submit_consensus_vote.await_args_list
+            )
+
+        assert engine.stats["batches_verified"] == 2
+        assert engine.stats["batched_requests"] == 4
+        assert engine.stats["total_requests"] == 4
+
+    @pytest.mark.asyncio
+    async def test_batch_verification_fails_missing_results(self):
+        """Test that requests a batch call returns no result for fail explicitly"""
+        engine = MultiChainConsensusEngine(
+            ConsensusConfig(min_participating_chains=1, consensus_threshold=0.67)
+        )
+
+        class BatchAdapter:
+            chain_type = ChainType.ETHEREUM
+            is_connected = True
+            drop = 1
+
+            async def verify_ai_output_batch(self, items):
+                return [
+                    ChainVerificationResult(
+                        chain_type=ChainType.ETHEREUM,
+                        verification_status=VerificationStatus.VERIFIED,
+                        confidence_score=0.9,
+                    )
+                    for _ in range(len(items) - self.drop)
+                ]
+
+        adapter = BatchAdapter()
+        await engine.add_chain_adapter(adapter)
+
+        def make_states():
+            states = []
+            for i in range(3):
+                request = VerificationRequest(
+                    request_id=f"batch-{i}",
+                    ai_agent_id="test_agent",
+                    verification_data={"index": i},
+                    target_chains=[ChainType.ETHEREUM],
+                    consensus_threshold=0.67,
+                    timeout_seconds=5,
+                )
+                states.append(
+                    ConsensusState(
+                        request_id=request.request_id,
+                        request=request,
+                        phase=ConsensusPhase.INITIALIZATION,
+                        participating_chains={ChainType.ETHEREUM},
+                        timeout_time=datetime.utcnow() + timedelta(seconds=5),
+                    )
+                )
+            return states
+
+        # One result short: only the last request fails
+        states = make_states()
+        await engine._execute_batch_verification(states)
+        assert [ChainType.ETHEREUM in s.chain_results for s in states] == [
+            True,
+            True,
+            False,
+        ]
+        assert states[2].errors == [
+            "ethereum: No result returned for request in batch"
+        ]
+
+        # More results than requests: none can be matched to a request
+        adapter.drop = -1
+        states = make_states()
+        await engine._execute_batch_verification(states)
+        assert all(not s.chain_results and len(s.errors) == 1 for s in states)
+
+    @pytest.mark.asyncio
+    async def test_batch_verification_through_chain_adapter(self):
+        """Test that a chain adapter verifies a whole batch in one call"""
+        engine = MultiChainConsensusEngine(
+            ConsensusConfig(min_participating_chains=1, consensus_threshold=0.67)
+        )
+        adapter = EthereumAdapter(chain_type=ChainType.ETHEREUM, rpc_url="http://x")
+        adapter.w3 = Mock()
+        adapter.w3.is_connected.return_value = True
+        await engine.add_chain_adapter(adapter)
+
+        states = []
+        for i in range(3):
+            request = VerificationRequest(
+                request_id=f"batch-{i}",
+                ai_agent_id="test_agent",
+                verification_data={"ai_output": f"output {i}"},
+                target_chains=[ChainType.ETHEREUM],
+                consensus_threshold=0.67,
+                timeout_seconds=5,
+            )
+            states.append(
+                ConsensusState(
+                    request_id=request.request_id,
+                    request=request,
+                    phase=ConsensusPhase.INITIALIZATION,
+                    participating_chains={ChainType.ETHEREUM},
+                    timeout_time=datetime.utcnow() + timedelta(seconds=5),
+                )
+            )
+
+        with (
+            patch.object(
+                adapter,
+                "get_chain_metrics",
+                AsyncMock(return_value=Mock(block_height=100, block_time=12.0)),
+            ) as get_metrics,
+            patch.object(
+                adapter, "verify_ai_output", wraps=adapter.verify_ai_output
+            ) as verify_one,
+        ):
+            await engine._execute_batch_verification(states)
+
+        results = [state.chain_results[ChainType.ETHEREUM] for state in states]
+        assert verify_one.call_count == 0
+        assert get_metrics.await_count == 1
+        assert len({result.transaction_hash for result in results}) == 1
+        assert all(result.block_number == 100 for result in results)
+        assert adapter.get_verification_stats()["total_verifications"] == 3
+
     def test_consensus_result_creation(self):
         """Test ConsensusResult dataclass creation"""
         result = ConsensusResult(
@@ -331,6 +789,763 @@ class TestBridgeComponents:
         assert len(message_ids) == 5
         assert all(isinstance(mid, str) for mid in message_ids)
 
+    @pytest.mark.asyncio
+    async def test_message_queue_priority_scheduling(self):
+        """Test weighted fair dequeue and deadline promotion"""
+
+        def make_message(message_id, priority, timeout_seconds=300, age_seconds=0):
+            return BridgeMessage(
+                message_id=message_id,
+                message_type=BridgeMessageType.SYNCHRONIZATION,
+                source_chain=ChainType.ETHEREUM,
+                target_chain=ChainType.SOLANA,
+                payload={},
+                timestamp=datetime.utcnow() - timedelta(seconds=age_seconds),
+                timeout_seconds=timeout_seconds,
+                priority=priority,
+            )
+
+        queue = MessageQueue(max_size=100, deadline_margin=10.0)
+        for i in range(20):
+            await queue.enqueue(make_message(f"low-{i}", 0))
+        for i in range(20):
+            await queue.enqueue(make_message(f"high-{i}", 2))
+        await queue.enqueue(
+            make_message("expiring", 0, timeout_seconds=20, age_seconds=15)
+        )
+
+        served = [(await queue.dequeue(timeout=0.1)).message_id for _ in range(11)]
+
+        # Near-expiry message first, then roughly 4:1 high to low
+        assert served[0] == "expiring"
+        assert sum(mid.startswith("high") for mid in served[1:]) == 8
+        assert sum(mid.startswith("low") for mid in served[1:]) == 2
+        assert queue.get_deadline_promotions() == 1
+        assert queue.get_depth_by_priority() == {2: 12, 0: 18}
+
+    @pytest.mark.asyncio
+    async def test_message_queue_levels_bounded_under_deadline_traffic(self):
+        """Test that records served by deadline or removed leave the level FIFO"""
+
+        def make_message(message_id, timeout_seconds):
+            return BridgeMessage(
+                message_id=message_id,
+                message_type=BridgeMessageType.HEALTH_CHECK,
+                source_chain=ChainType.ETHEREUM,
+                target_chain=ChainType.SOLANA,
+                payload={"data": "x" * 100},
+                timestamp=datetime.utcnow(),
+                timeout_seconds=timeout_seconds,
+                priority=1,
+            )
+
+        queue = MessageQueue(deadline_margin=10.0)
+        # One message outside the margin keeps the level non-empty throughout
+        await queue.enqueue(make_message("steady", 300))
+        for i in range(5000):
+            await queue.enqueue(make_message(f"urgent-{i}", 5))
+            message = await queue.dequeue(timeout=0.1)
+            assert message.message_id == f"urgent-{i}"
+            await queue.mark_completed(message.message_id, True)
+
+            await queue.enqueue(make_message(f"removed-{i}", 300))
+            assert queue.remove(f"removed-{i}")
+            await queue.mark_completed(f"removed-{i}", False)
+
+        assert queue.get_deadline_promotions() == 5000
+        assert queue.get_depth_by_priority() == {1: 1}
+        assert len(queue.table) == 1
+        assert len(queue._levels[1]) <= 2
+
+        # A removed message queued again is served once, at its new position
+        await queue.enqueue(make_message("requeued", 300))
+        queue.remove("requeued")
+        await queue.enqueue(make_message("requeued", 300))
+        served = [m.message_id for m in await queue.dequeue_many(10, max_wait=0)]
+        assert served == ["steady", "requeued"]
+        assert len(queue._levels[1]) == 0
+
+    @pytest.mark.asyncio
+    async def test_message_broker_route_shards(self):
+        """Test per-route queues and concurrency limits"""
+        broker = CrossChainMessageBroker(route_concurrency=2, shared_workers=3)
+        routes = [
+            BridgeRoute(
+                ChainType.ETHEREUM, target, "MockAdapter", 1.0, 100.0, 100.0, 0.95
+            )
+            for target in (ChainType.BITCOIN, ChainType.SOLANA)
+        ]
+        await broker.initialize({}, routes)
+
+        for i in range(3):
+            await broker.send_message(
+                message_type=BridgeMessageType.SYNCHRONIZATION,
+                source_chain=ChainType.ETHEREUM,
+                target_chain=ChainType.BITCOIN,
+                payload={"sequence": i},
+            )
+
+        stats = await broker.get_broker_stats()
+        assert stats["queue_size"] == 3
+        assert stats["shards"]["ethereum_bitcoin"]["queue_size"] == 3
+        assert stats["shards"]["ethereum_solana"]["queue_size"] == 0
+
+        # Shared workers go to the backlogged route, up to its limit
+        bitcoin = broker.shards["ethereum_bitcoin"]
+        assert broker._select_backlogged_shard() is bitcoin
+        bitcoin.shared_in_flight = 2
+        assert broker._select_backlogged_shard() is None
+
+    @pytest.mark.asyncio
+    async def test_message_broker_batch_transmission(self):
+        """Test coalescing queued messages into one adapter transmission"""
+        adapter = Mock()
+        adapter.max_batch_size = 10
+        adapter.transmit_batch = AsyncMock(return_value=[True, True, False])
+        adapter.confirm_batch = AsyncMock(return_value=[True, False])
+
+        broker = CrossChainMessageBroker()
+        route = BridgeRoute(
+            ChainType.SOLANA, ChainType.ETHEREUM, "MockAdapter", 1.0, 100.0, 100.0, 0.95
+        )
+        await broker.initialize({ChainType.ETHEREUM: adapter}, [route])
+        for i in range(3):
+            await broker.send_message(
+                message_type=BridgeMessageType.SYNCHRONIZATION,
+                source_chain=ChainType.SOLANA,
+                target_chain=ChainType.ETHEREUM,
+                payload={"sequence": i},
+            )
+
+        shard = broker.shards["solana_ethereum"]
+        first = await shard.queue.dequeue_many(1, max_wait=0.1)
+        batch = await broker._collect_batch(shard, first, limit=10)
+        assert len(batch) == 3
+        assert broker._transmission_size(shard) == 10
+
+        with patch.object(broker, "_retry_message", AsyncMock(return_value=False)):
+            results = await broker._process_batch(batch)
+
+        assert results == [True, False, False]
+        adapter.transmit_batch.assert_awaited_once_with(batch)
+        adapter.confirm_batch.assert_awaited_once_with(
+            [batch[0].message_id, batch[1].message_id], ChainType.ETHEREUM
+        )
+
+    @pytest.mark.asyncio
+    async def test_route_worker_waits_out_open_breaker(self):
+        """Test an open breaker leaves messages queued, then lets one probe out"""
+        adapter = Mock()
+        adapter.max_batch_size = 10
+        adapter.transmit_message = AsyncMock(return_value=True)
+        adapter.confirm_message_delivery = AsyncMock(return_value=True)
+        adapter.transmit_batch = AsyncMock(side_effect=lambda batch: [True] * len(batch))
+        adapter.confirm_batch = AsyncMock(side_effect=lambda ids, chain: [True] * len(ids))
+
+        broker = CrossChainMessageBroker(shared_workers=0)
+        route = BridgeRoute(
+            ChainType.SOLANA, ChainType.ETHEREUM, "MockAdapter", 1.0, 100.0, 100.0, 0.95
+        )
+        await broker.initialize({ChainType.ETHEREUM: adapter}, [route])
+        shard = broker.shards["solana_ethereum"]
+        shard.breaker.open_seconds = 1.3
+        shard.breaker._open()
+
+        message_ids = [
+            await broker.send_message(
+                message_type=BridgeMessageType.SYNCHRONIZATION,
+                source_chain=ChainType.SOLANA,
+                target_chain=ChainType.ETHEREUM,
+                payload={"sequence": i},
+                timeout_seconds=1 if i == 0 else 60,
+            )
+            for i in range(4)
+        ]
+
+        await broker.start()
+        try:
+            # Still queued while open, so the short deadline expires on time
+            await asyncio.sleep(1.2)
+            assert broker._stats["timeouts"] == 1
+            assert shard.queue.get_queue_size() == 3
+            adapter.transmit_message.assert_not_awaited()
+
+            await asyncio.sleep(0.4)
+        finally:
+            await broker.stop()
+
+        # One message probes the half-open route, the rest follow as a batch
+        adapter.transmit_message.assert_awaited_once()
+        assert adapter.transmit_message.await_args.args[0].message_id == message_ids[1]
+        adapter.transmit_batch.assert_awaited_once()
+        assert len(adapter.transmit_batch.await_args.args[0]) == 2
+        assert shard.breaker.state == CircuitState.CLOSED
+        assert shard.queue.get_queue_size() == 0
+
+    @pytest.mark.asyncio
+    async def test_message_queue_wal_recovery(self, tmp_path):
+        """Test that unfinished messages survive a restart through the WAL"""
+        queue = MessageQueue(wal=MessageWAL(str(tmp_path), segment_max_bytes=512))
+        messages = [
+            BridgeMessage(
+                message_id=f"msg-{i}",
+                message_type=BridgeMessageType.SYNCHRONIZATION,
+                source_chain=ChainType.ETHEREUM,
+                target_chain=ChainType.SOLANA,
+                payload={"sequence": i},
+                timestamp=datetime.utcnow(),
+                timeout_seconds=300,
+            )
+            for i in range(10)
+        ]
+        for message in messages:
+            await queue.enqueue(message)
+
+        for _ in range(5):
+            message = await queue.dequeue(timeout=0.1)
+            if message.message_id == "msg-0":
+                message.retry_count = 1
+                await queue.mark_retrying(message)
+            else:
+                await queue.mark_completed(message.message_id, True)
+        await queue.wal.close()
+
+        recovered = MessageWAL(str(tmp_path)).replay()
+
+        # Rescheduled messages come back after those still waiting
+        assert [m.message_id for m in recovered] == [
+            "msg-5",
+            "msg-6",
+            "msg-7",
+            "msg-8",
+            "msg-9",
+            "msg-0",
+        ]
+        assert recovered[0].payload == {"sequence": 5}
+        assert recovered[-1].retry_count == 1
+
+    @pytest.mark.asyncio
+    async def test_wal_keeps_segment_until_superseding_record_is_flushed(
+        self, tmp_path
+    ):
+        """Test that a segment outlives records superseding it until they are durable"""
+        # One record per segment
+        wal = MessageWAL(str(tmp_path), segment_max_bytes=1, fsync=False)
+        first, second = [
+            BridgeMessage(
+                message_id=f"msg-{i}",
+                message_type=BridgeMessageType.SYNCHRONIZATION,
+                source_chain=ChainType.ETHEREUM,
+                target_chain=ChainType.SOLANA,
+                payload={"sequence": i},
+                timestamp=datetime.utcnow(),
+                timeout_seconds=300,
+            )
+            for i in range(2)
+        ]
+        wal.append_enqueue(first)
+        await wal.commit()
+
+        # Hold the next group commit in its writer thread
+        write = wal._write
+        writing = threading.Event()
+        release = threading.Event()
+
+        def held_write(buffer):
+            writing.set()
+            release.wait()
+            write(buffer)
+
+        wal._write = held_write
+        wal.append_enqueue(second)
+        commit = asyncio.create_task(wal.commit())
+        await asyncio.to_thread(writing.wait)
+
+        # Supersede the first segment's only record while the write is running
+        first.retry_count = 1
+        wal.append_enqueue(first)
+        release.set()
+        await commit
+
+        # The superseding record is still buffered, so a crash now must
+        # find the original record on disk
+        assert os.path.exists(wal._segment_path(0))
+        recovered = MessageWAL(str(tmp_path)).replay()
+        assert [(m.message_id, m.retry_count) for m in recovered] == [
+            ("msg-0", 0),
+            ("msg-1", 0),
+        ]
+
+        # Once the new record is flushed the first segment goes
+        await wal.commit()
+        assert not os.path.exists(wal._segment_path(0))
+        await wal.close()
+
+        recovered = MessageWAL(str(tmp_path)).replay()
+        assert [(m.message_id, m.retry_count) for m in recovered] == [
+            ("msg-1", 0),
+            ("msg-0", 1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_wal_write_failure_keeps_later_records(self, tmp_path):
+        """Test that records after a failed, torn write still replay"""
+        wal = MessageWAL(str(tmp_path), fsync=False)
+        messages = [
+            BridgeMessage(
+                message_id=f"msg-{i}",
+                message_type=BridgeMessageType.SYNCHRONIZATION,
+                source_chain=ChainType.ETHEREUM,
+                target_chain=ChainType.SOLANA,
+                payload={"sequence": i},
+                timestamp=datetime.utcnow(),
+                timeout_seconds=300,
+            )
+            for i in range(3)
+        ]
+        wal.append_enqueue(messages[0])
+        await wal.commit()
+
+        # Leave half a record behind, then fail
+        write = wal._write
+
+        def torn_write(buffer):
+            segment_no, data = buffer[0]
+            with open(wal._segment_path(segment_no), "ab") as f:
+                f.write(data[: len(data) // 2])
+            raise OSError("No space left on device")
+
+        wal._write = torn_write
+        wal.append_enqueue(messages[1])
+        wal.append_complete("msg-0")
+        with pytest.raises(OSError):
+            await wal.commit()
+
+        wal._write = write
+        wal.append_enqueue(messages[2])
+        await wal.commit()
+        await wal.close()
+
+        # The failed records are written again, after the torn tail
+        recovered = MessageWAL(str(tmp_path)).replay()
+        assert [m.message_id for m in recovered] == ["msg-1", "msg-2"]
+
+    @pytest.mark.asyncio
+    async def test_message_queue_enqueue_fails_when_wal_commit_fails(self, tmp_path):
+        """Test that a message whose WAL commit fails is neither queued nor restored"""
+        queue = MessageQueue(wal=MessageWAL(str(tmp_path), fsync=False))
+        refused, accepted = [
+            BridgeMessage(
+                message_id=f"msg-{i}",
+                message_type=BridgeMessageType.SYNCHRONIZATION,
+                source_chain=ChainType.ETHEREUM,
+                target_chain=ChainType.SOLANA,
+                payload={"sequence": i},
+                timestamp=datetime.utcnow(),
+                timeout_seconds=300,
+            )
+            for i in range(2)
+        ]
+
+        queue.wal._write = Mock(side_effect=OSError("No space left on device"))
+        assert not await queue.enqueue(refused)
+        assert queue.get_queue_size() == 0
+        assert queue.get_pending_count() == 0
+        assert await queue.dequeue(timeout=0.01) is None
+
+        del queue.wal._write
+        assert await queue.enqueue(accepted)
+        assert (await queue.dequeue(timeout=0.1)).message_id == "msg-1"
+        await queue.wal.close()
+
+        recovered = MessageWAL(str(tmp_path)).replay()
+        assert [m.message_id for m in recovered] == ["msg-1"]
+
+    @pytest.mark.asyncio
+    async def test_message_queue_record_lifecycle(self):
+        """Test that finished messages leave the table but keep their status"""
+        queue = MessageQueue()
+        message = BridgeMessage(
+            message_id="msg-1",
+            message_type=BridgeMessageType.CONSENSUS_VOTE,
+            source_chain=ChainType.ETHEREUM,
+            target_chain=ChainType.SOLANA,
+            payload={},
+            timestamp=datetime.utcnow() - timedelta(seconds=60),
+            timeout_seconds=300,
+        )
+        await queue.enqueue(message)
+        record = queue.table.get("msg-1")
+        assert 239 < record.deadline - time.monotonic() <= 240
+
+        assert await queue.dequeue(timeout=0.1) is message
+        await queue.mark_retrying(message)
+        assert queue.get_waiting_count() == 1
+
+        # A retried message reuses its record and deadline
+        await queue.enqueue(message)
+        assert queue.table.get("msg-1") is record
+        assert await queue.dequeue(timeout=0.1) is message
+        assert queue.get_pending_count() == 1
+        assert queue.get_processing_count() == 1
+
+        await queue.mark_completed("msg-1", True)
+        assert "msg-1" not in queue.table
+        assert queue.table.get_status("msg-1") == BridgeMessageStatus.CONFIRMED
+        assert queue.get_pending_count() == 0
+        assert queue.get_processing_count() == 0
+
+    @pytest.mark.asyncio
+    async def test_message_queue_dequeue_many(self):
+        """Test bulk dequeue and event-driven waiting"""
+        queue = MessageQueue()
+
+        def make_message(i):
+            return BridgeMessage(
+                message_id=f"msg-{i}",
+                message_type=BridgeMessageType.SYNCHRONIZATION,
+                source_chain=ChainType.ETHEREUM,
+                target_chain=ChainType.SOLANA,
+                payload={},
+                timestamp=datetime.utcnow(),
+                timeout_seconds=300,
+            )
+
+        for i in range(5):
+            await queue.enqueue(make_message(i))
+
+        first = await queue.dequeue_many(3)
+        assert [m.message_id for m in first] == ["msg-0", "msg-1", "msg-2"]
+        assert queue.get_processing_count() == 3
+        assert len(await queue.dequeue_many(10, max_wait=0)) == 2
+        assert await queue.dequeue_many(10, max_wait=0) == []
+
+        # An idle consumer sleeps until a message arrives
+        waiter = asyncio.create_task(queue.dequeue_many(10))
+        await asyncio.sleep(0.01)
+        assert not waiter.done()
+        await queue.enqueue(make_message(5))
+        assert [m.message_id for m in await waiter] == ["msg-5"]
+
+    @pytest.mark.asyncio
+    async def test_timer_wheel_scheduling(self):
+        """Test timer wheel firing order and cancellation"""
+        wheel = TimerWheel(tick_seconds=0.01, slots=8)
+        fired = []
+
+        async def record_async(label):
+            fired.append(label)
+
+        wheel.schedule(0.15, fired.append, "late")  # Wraps around the wheel
+        wheel.schedule(0.02, record_async, "early")
+        cancelled = wheel.schedule(0.05, fired.append, "cancelled")
+        cancelled.cancel()
+        assert wheel.scheduled_count == 2
+
+        await wheel.start()
+        await asyncio.sleep(0.25)
+        await wheel.stop()
+
+        assert fired == ["early", "late"]
+        stats = wheel.get_stats()
+        assert stats["timers_fired"] == 2
+        assert stats["timers_cancelled"] == 1
+        assert stats["scheduled_timers"] == 0
+
+    def test_route_circuit_breaker(self):
+        """Test route breaker opening on tracked errors and probing when half-open"""
+        route = BridgeRoute(
+            source_chain=ChainType.ETHEREUM,
+            target_chain=ChainType.SOLANA,
+            adapter_class="SolanaBridgeAdapter",
+            health_score=1.0,
+            latency_ms=100.0,
+            throughput_msg_per_sec=50.0,
+            reliability_score=0.95,
+        )
+        tracker = RouteHealthTracker(route)
+        shard = RouteShard("ethereum_solana", 100, 4, tracker=tracker)
+        breaker = shard.breaker
+        breaker.open_seconds = 0.05
+
+        for delivered in (True, True, False, False, False, False, False, True):
+            shard.record(0.01, delivered)
+        assert breaker.state == CircuitState.CLOSED  # Fewer than minimum_calls
+        shard.record(0.01, False)
+        shard.record(0.01, False)
+        assert breaker.state == CircuitState.OPEN
+        assert tracker.get_error_rate()[1] == 10
+        assert 0 < breaker.retry_after() <= 0.05
+        assert not breaker.allow_request()
+
+        time.sleep(0.06)
+        assert breaker.allow_request()  # Single half-open probe
+        assert not breaker.allow_request()
+        breaker.release_probe()  # The probe recorded no outcome
+        assert breaker.allow_request()
+        shard.record(0.01, True)
+        assert breaker.state == CircuitState.CLOSED
+        assert breaker.get_stats()["calls_in_window"] == 0  # Fresh window
+
+    def test_retry_backoff_and_budget(self):
+        """Test jittered backoff bounds and retry budget limits"""
+        backoff = DecorrelatedJitterBackoff(base=1, cap=10)
+        delay = None
+        for _ in range(50):
+            next_delay = backoff.next_delay(delay)
+            assert 1 <= next_delay <= min(10, max(1, (delay or 1) * 3))
+            delay = next_delay
+
+        budget = RetryBudget(ratio=0.5, min_retries_per_second=0.1, window_seconds=10)
+        for _ in range(10):
+            budget.record_attempt()
+        granted = sum(budget.try_acquire() for _ in range(20))
+        assert granted == 6  # 10 * 0.5 plus a floor of 0.1 * 10
+        assert budget.get_stats()["rejected"] == 14
+
+    @pytest.mark.asyncio
+    async def test_admission_control(self):
+        """Test priority shedding and per-agent rate limits with retry hints"""
+        shard = RouteShard("ethereum_solana", max_queue_size=10, max_concurrency=2)
+        for i in range(6):
+            await shard.queue.enqueue(
+                BridgeMessage(
+                    message_id=f"queued-{i}",
+                    message_type=BridgeMessageType.SYNCHRONIZATION,
+                    source_chain=ChainType.ETHEREUM,
+                    target_chain=ChainType.SOLANA,
+                    payload={},
+                    timestamp=datetime.utcnow(),
+                    timeout_seconds=300,
+                )
+            )
+        shard.record(0.5, True)  # Drains 4 messages per second
+
+        def make_message(message_type, agent_id="agent-1"):
+            return BridgeMessage(
+                message_id="new",
+                message_type=message_type,
+                source_chain=ChainType.ETHEREUM,
+                target_chain=ChainType.SOLANA,
+                payload={"ai_agent_id": agent_id},
+                timestamp=datetime.utcnow(),
+                timeout_seconds=300,
+            )
+
+        admission = AdmissionController(agent_rate=1.0, agent_burst=2.0)
+
+        # Synchronization is shed at half full; consensus votes still pass
+        with pytest.raises(AdmissionRejected) as rejected:
+            admission.admit(make_message(BridgeMessageType.SYNCHRONIZATION), 0, shard)
+        assert rejected.value.reason == "overloaded"
+        assert rejected.value.retry_after_seconds == pytest.approx(0.5)
+        admission.admit(make_message(BridgeMessageType.CONSENSUS_VOTE), 3, shard)
+
+        # The agent's burst is used up; another agent is unaffected
+        admission.admit(make_message(BridgeMessageType.CONSENSUS_VOTE), 3, shard)
+        with pytest.raises(AdmissionRejected) as rejected:
+            admission.admit(make_message(BridgeMessageType.CONSENSUS_VOTE), 3, shard)
+        assert rejected.value.reason == "rate_limited"
+        assert 0 < rejected.value.retry_after_seconds <= 1.0
+        admission.admit(
+            make_message(BridgeMessageType.CONSENSUS_VOTE, "agent-2"), 3, shard
+        )
+
+        stats = admission.get_stats()
+        assert stats["admitted"] == 3
+        assert stats["shed_by_priority"] == {0: 1}
+        assert stats["rate_limited"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bridge_send_queues_by_message_type_priority(self):
+        """Test that the bridge queues consensus votes at their type's level"""
+        adapters = {
+            chain: Mock(is_operational=True)
+            for chain in (ChainType.ETHEREUM, ChainType.SOLANA)
+        }
+        bridge = CrossChainBridge()
+        assert await bridge.initialize(adapters)
+        bridge._running = True  # Queue without starting the workers
+
+        for message_type in (
+            BridgeMessageType.CONSENSUS_VOTE,
+            BridgeMessageType.SYNCHRONIZATION,
+        ):
+            await bridge.send_message(
+                BridgeMessage(
+                    message_id="new",
+                    message_type=message_type,
+                    source_chain=ChainType.ETHEREUM,
+                    target_chain=ChainType.SOLANA,
+                    payload={"ai_agent_id": "agent-1"},
+                    timestamp=datetime.utcnow(),
+                    timeout_seconds=300,
+                )
+            )
+
+        shard = bridge.message_broker.get_route_shard(
+            ChainType.ETHEREUM, ChainType.SOLANA
+        )
+        assert shard.queue.get_depth_by_priority() == {3: 1, 0: 1}
+
+    @pytest.mark.asyncio
+    async def test_bridge_send_admission(self):
+        """Test shedding and rate limits on the bridge send path"""
+        adapters = {
+            chain: Mock(is_operational=True)
+            for chain in (ChainType.ETHEREUM, ChainType.SOLANA)
+        }
+        bridge = CrossChainBridge()
+        assert await bridge.initialize(adapters)
+        bridge._running = True  # Queue without starting the workers
+        bridge.admission = AdmissionController(agent_rate=0.01, agent_burst=1.0)
+
+        shard = bridge.message_broker.get_route_shard(
+            ChainType.ETHEREUM, ChainType.SOLANA
+        )
+        shard.queue.max_size = 10
+        for i in range(6):
+            await shard.queue.enqueue(
+                BridgeMessage(
+                    message_id=f"queued-{i}",
+                    message_type=BridgeMessageType.SYNCHRONIZATION,
+                    source_chain=ChainType.ETHEREUM,
+                    target_chain=ChainType.SOLANA,
+                    payload={},
+                    timestamp=datetime.utcnow(),
+                    timeout_seconds=300,
+                )
+            )
+
+        def make_message(message_type, agent_id):
+            return BridgeMessage(
+                message_id="new",
+                message_type=message_type,
+                source_chain=ChainType.ETHEREUM,
+                target_chain=ChainType.SOLANA,
+                payload={"ai_agent_id": agent_id},
+                timestamp=datetime.utcnow(),
+                timeout_seconds=300,
+            )
+
+        # Shed by type priority: synchronization is dropped, votes pass
+        with pytest.raises(AdmissionRejected) as rejected:
+            await bridge.send_message(
+                make_message(BridgeMessageType.SYNCHRONIZATION, "agent-1")
+            )
+        assert rejected.value.reason == "overloaded"
+        await bridge.send_message(
+            make_message(BridgeMessageType.CONSENSUS_VOTE, "agent-1")
+        )
+        with pytest.raises(AdmissionRejected) as rejected:
+            await bridge.send_message(
+                make_message(BridgeMessageType.CONSENSUS_VOTE, "agent-1")
+            )
+        assert rejected.value.reason == "rate_limited"
+
+        # A send to an inactive route fails without using the sender's quota
+        route = bridge.message_broker.routes["ethereum_solana"]
+        route.is_active = False
+        with pytest.raises(ValueError):
+            await bridge.send_message(
+                make_message(BridgeMessageType.CONSENSUS_VOTE, "agent-2")
+            )
+        route.is_active = True
+        await bridge.send_message(
+            make_message(BridgeMessageType.CONSENSUS_VOTE, "agent-2")
+        )
+
+        status = await bridge.get_bridge_status()
+        assert status["bridge"]["rejected_messages"] == 2
+        assert status["bridge"]["total_messages"] == 2
+        assert status["admission"]["shed_by_priority"] == {0: 1}
+
+    def test_wire_format_round_trip(self):
+        """Test binary wire encoding is canonical and decodes without copying"""
+        message = BridgeMessage(
+            message_id="wire-1",
+            message_type=BridgeMessageType.VERIFICATION_REQUEST,
+            source_chain=ChainType.ETHEREUM,
+            target_chain=ChainType.CARDANO,
+            payload={"b": 2, "a": [1, "x"]},
+            timestamp=datetime(2026, 1, 2, 3, 4, 5, 678901),
+            timeout_seconds=45,
+            priority=3,
+        )
+        frame = encode_message(message)
+
+        view = decode_message(frame)
+        assert view.payload.obj is frame  # Payload is a view, not a copy
+        assert bytes(view.payload) == b'{"a":[1,"x"],"b":2}'
+        assert view.to_message() == message
+
+        # Key order and delivery state do not change the encoding
+        message.payload = {"a": [1, "x"], "b": 2}
+        message.retry_count = 2
+        message.status = BridgeMessageStatus.FAILED
+        assert encode_message(message) == frame
+
+        batch = decode_message_batch(encode_message_batch([message, message]))
+        assert [v.message_id for v in batch] == ["wire-1", "wire-1"]
+
+        vote = ConsensusVote(
+            vote_id="vote-1",
+            message_id="wire-1",
+            voter_chain=ChainType.SOLANA,
+            vote_value={"valid": True},
+            confidence_score=0.9,
+            weight=1.5,
+            timestamp=datetime(2026, 1, 2),
+            signature="sig",
+        )
+        assert decode_vote(encode_vote(vote)).to_vote() == vote
+
+        with pytest.raises(WireFormatError):
+            decode_vote(frame)
+        with pytest.raises(WireFormatError):
+            decode_message(frame[:-1])
+
+    def test_wire_format_rejects_malformed_frames(self):
+        """Test truncated bodies and invalid UTF-8 raise WireFormatError"""
+        message = BridgeMessage(
+            message_id="wire-1",
+            message_type=BridgeMessageType.VERIFICATION_REQUEST,
+            source_chain=ChainType.ETHEREUM,
+            target_chain=ChainType.CARDANO,
+            payload={"a": 1},
+            timestamp=datetime(2026, 1, 2),
+            timeout_seconds=45,
+        )
+        vote = ConsensusVote(
+            vote_id="vote-1",
+            message_id="wire-1",
+            voter_chain=ChainType.SOLANA,
+            vote_value=True,
+            confidence_score=0.9,
+            weight=1.0,
+            timestamp=datetime(2026, 1, 2),
+            signature="sig",
+        )
+        frames = [
+            (decode_message, encode_message(message)),
+            (decode_vote, encode_vote(vote)),
+            (decode_message_batch, encode_message_batch([message])),
+        ]
+
+        # Every shorter body, with a length prefix that matches it
+        for decode, frame in frames:
+            body = frame[4:]
+            for length in range(len(body)):
+                with pytest.raises(WireFormatError):
+                    decode(length.to_bytes(4, "little") + body[:length])
+
+        message_frame = encode_message(message)
+        with pytest.raises(WireFormatError):
+            decode_message(message_frame.replace(b"wire-1", b"wire-\xff"))
+        vote_frame = encode_vote(vote)
+        with pytest.raises(WireFormatError):
+            decode_vote(vote_frame.replace(b"sig", b"\xc3\x28g"))
+
     @pytest.mark.asyncio
     async def test_bridge_consensus_simple_majority(self, bridge_consensus):
         """Test bridge consensus simple majority"""
@@ -0,0 +1,201 @@
+"""
+Timer Wheel
+===========
+
+Hashed timing wheel for TrustWrapper v3.0 bridge components. Schedules
+large numbers of timers (message retries, expiry deadlines) on a single
+driver task instead of one sleeping task per timer.
+"""
+
+import asyncio
+import inspect
+import logging
+import math
+import time
+from collections.abc import Callable
+
+
+class TimerHandle:
+    """A scheduled timer; call ``cancel()`` to stop it from firing."""
+
+    __slots__ = ("wheel", "target_tick", "callback", "args", "active")
+
+    def __init__(self, wheel: "TimerWheel", target_tick: int, callback, args):
+        self.wheel = wheel
+        self.target_tick = target_tick
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+    def cancel(self) -> None:
+        """Cancel the timer if it has not fired yet."""
+        if self.active:
+            self.wheel._remove(self)
+
+
+class TimerWheel:
+    """
+    Hashed timing wheel driven by one task.
+
+    Time is divided into ticks of ``tick_seconds``; a timer lives in the slot
+    ``target_tick % slots``. Scheduling and cancelling are O(1), and each
+    tick only looks at one slot, so the cost per timer is O(1) amortised
+    (plus one visit per wheel revolution for delays longer than
+    ``tick_seconds * slots``). Timers fire up to one tick late, never early.
+
+    Callbacks may be plain functions or coroutine functions; coroutines
+    due on the same tick run concurrently.
+    """
+
+    def __init__(self, tick_seconds: float = 0.1, slots: int = 512):
+        self.tick_seconds = tick_seconds
+        self.slots = slots
+
+        self._wheel: list[set[TimerHandle]] = [set() for _ in range(slots)]
+        self._origin = time.monotonic()
+        self._current_tick = 0
+        self._scheduled = 0
+        self._timer_added: asyncio.Event | None = None
+        self._driver_task: asyncio.Task | None = None
+
+        self.logger = logging.getLogger(f"{__name__}.wheel")
+
+        # Statistics
+        self._stats = {
+            "timers_fired": 0,
+            "timers_cancelled": 0,
+            "callback_errors": 0,
+        }
+
+    @property
+    def scheduled_count(self) -> int:
+        """Number of timers waiting to fire."""
+        return self._scheduled
+
+    def schedule(self, delay: float, callback: Callable, *args) -> TimerHandle:
+        """
+        Schedule a callback to run after a delay.
+
+        Args:
+            delay: Delay in seconds
+            callback: Function or coroutine function to call
+            *args: Arguments for the callback
+
+        Returns:
+            TimerHandle: Handle for cancelling the timer
+        """
+        elapsed_ticks = (time.monotonic() - self._origin) / self.tick_seconds
+        if not self._scheduled:
+            # Empty wheel: skip the idle ticks instead of replaying them
+            self._current_tick = max(self._current_tick, int(elapsed_ticks))
+        target_tick = max(
+            self._current_tick + 1,
+            math.ceil(elapsed_ticks + max(delay, 0.0) / self.tick_seconds),
+        )
+        timer = TimerHandle(self, target_tick, callback, args)
+        self._wheel[target_tick % self.slots].add(timer)
+        self._scheduled += 1
+
+        if self._timer_added is not None:
+            self._timer_added.set()
+        return timer
+
+    async def start(self) -> None:
+        """Start the driver task."""
+        if self._driver_task is not None:
+            return
+        self._timer_added = asyncio.Event()
+        self._driver_task = asyncio.create_task(self._drive())
+
+    async def stop(self) -> None:
+        """Stop the driver task; scheduled timers are kept."""
+        if self._driver_task is None:
+            return
+        self._driver_task.cancel()
+        await asyncio.gather(self._driver_task, return_exceptions=True)
+        self._driver_task = None
+        self._timer_added = None
+
+    def clear(self) -> None:
+        """Cancel every scheduled timer."""
+        for slot in self._wheel:
+            for timer in slot:
+                timer.active = False
+            self._stats["timers_cancelled"] += len(slot)
+            slot.clear()
+        self._scheduled = 0
+
+    def get_stats(self) -> dict[str, any]:
+        """
+        Get timer wheel statistics.
+
+        Returns:
+            Dict: Timer counts and configuration
+        """
+        return {
+            **self._stats,
+            "scheduled_timers": self._scheduled,
+            "tick_seconds": self.tick_seconds,
+            "slots": self.slots,
+            "running": self._driver_task is not None,
+        }
+
+    def _remove(self, timer: TimerHandle) -> None:
+        """Take a cancelled timer out of its slot."""
+        timer.active = False
+        self._wheel[timer.target_tick % self.slots].discard(timer)
+        self._scheduled -= 1
+        self._stats["timers_cancelled"] += 1
+
+    async def _drive(self) -> None:
+        """Advance the wheel one tick at a time and fire due timers."""
+        while True:
+            try:
+                if not self._scheduled:
+                    # Nothing to do until a timer is added
+                    self._timer_added.clear()
+                    await self._timer_added.wait()
+
+                now_tick = int((time.monotonic() - self._origin) / self.tick_seconds)
+                while self._current_tick < now_tick:
+                    self._current_tick += 1
+                    await self._fire(self._current_tick)
+
+                next_tick = self._origin + (self._current_tick + 1) * self.tick_seconds
+                await asyncio.sleep(max(0.0, next_tick - time.monotonic()))
+
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.logger.error(f"Error in timer wheel driver: {e}")
+                await asyncio.sleep(self.tick_seconds)
+
+    async def _fire(self, tick: int) -> None:
+        """Run the callbacks of timers due on a tick."""
+        slot = self._wheel[tick % self.slots]
+        if not slot:
+            return
+
+        due = [timer for timer in slot if timer.target_tick <= tick]
+        if not due:
+            return
+
+        pending = []
+        for timer in due:
+            slot.discard(timer)
+            timer.active = False
+            self._scheduled -= 1
+            self._stats["timers_fired"] += 1
+            try:
+                result = timer.callback(*timer.args)
+                if inspect.isawaitable(result):
+                    pending.append(result)
+            except Exception as e:
+                self._stats["callback_errors"] += 1
+                self.logger.error(f"Timer callback failed: {e}")
+
+        if pending:
+            for result in await asyncio.gather(*pending, return_exceptions=True):
+                if isinstance(result, Exception):
+                    self._stats["callback_errors"] += 1
+                    self.logger.error(f"Timer callback failed: {result}")
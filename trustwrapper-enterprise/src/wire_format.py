@@ -0,0 +1,491 @@
+"""
+Bridge Wire Format
+==================
+
+Versioned, length-prefixed binary encoding of bridge messages and
+consensus votes for TrustWrapper v3.0. Encodings are canonical, so the
+encoded bytes can be hashed or signed directly, and decoding returns
+views into the received buffer instead of copying payload bytes.
+
+Every frame is a little-endian ``uint32`` body length followed by the
+body. A body starts with the format version and a record kind:
+
+- Message: type code, priority, timeout, timestamp (microseconds since
+  the Unix epoch), then the message ID, source chain, target chain and
+  payload, each prefixed with its length.
+- Vote: confidence, weight, timestamp and a signature flag, then the
+  vote ID, message ID, voter chain, vote value and optional signature.
+- Batch: a count followed by that many message frames.
+
+Payloads and vote values are canonical JSON (sorted keys, no
+whitespace). Delivery state such as status and retry count is not part
+of the encoding.
+"""
+
+import json
+import struct
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from bridge.interfaces import BridgeMessage, BridgeMessageType, ConsensusVote
+from core.interfaces import ChainType
+
+WIRE_FORMAT_VERSION = 1
+
+KIND_MESSAGE = 1
+KIND_VOTE = 2
+KIND_BATCH = 3
+
+# Stable codes; never renumber, only append
+MESSAGE_TYPE_CODES = {
+    BridgeMessageType.VERIFICATION_REQUEST: 1,
+    BridgeMessageType.VERIFICATION_RESPONSE: 2,
+    BridgeMessageType.CONSENSUS_VOTE: 3,
+    BridgeMessageType.CONSENSUS_RESULT: 4,
+    BridgeMessageType.HEALTH_CHECK: 5,
+    BridgeMessageType.SYNCHRONIZATION: 6,
+}
+MESSAGE_TYPES_BY_CODE = {code: kind for kind, code in MESSAGE_TYPE_CODES.items()}
+
+FRAME_LENGTH = struct.Struct("<I")
+BODY_HEADER = struct.Struct("<BB")  # version, kind
+MESSAGE_FIXED = struct.Struct("<BBBhIq")  # + type, priority, timeout, timestamp
+VOTE_FIXED = struct.Struct("<BBddqB")  # + confidence, weight, timestamp, flags
+BATCH_FIXED = struct.Struct("<BBI")  # + message count
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+
+# Fixed-size start of each kind of body
+_FIXED_BY_KIND = {
+    KIND_MESSAGE: MESSAGE_FIXED,
+    KIND_VOTE: VOTE_FIXED,
+    KIND_BATCH: BATCH_FIXED,
+}
+
+VOTE_HAS_SIGNATURE = 0x01
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Chain names are encoded by value; both directions are cached
+_CHAIN_NAMES: dict[ChainType, bytes] = {}
+_CHAINS_BY_NAME: dict[bytes, ChainType] = {}
+
+
+class WireFormatError(ValueError):
+    """Raised when a buffer is not a valid frame of the expected kind."""
+
+
+def canonical_json(value: Any) -> bytes:
+    """
+    Encode a value as canonical JSON.
+
+    Args:
+        value: JSON-compatible value
+
+    Returns:
+        bytes: UTF-8 JSON with sorted keys and no whitespace
+    """
+    return json.dumps(
+        value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    ).encode("utf-8")
+
+
+def encode_message(message: BridgeMessage) -> bytes:
+    """
+    Encode a bridge message as one frame.
+
+    Args:
+        message: Message to encode
+
+    Returns:
+        bytes: Canonical frame
+    """
+    message_id = message.message_id.encode("utf-8")
+    source = _chain_name(message.source_chain)
+    target = _chain_name(message.target_chain)
+    payload = canonical_json(message.payload)
+
+    body_length = (
+        MESSAGE_FIXED.size
+        + 2
+        + len(message_id)
+        + 1
+        + len(source)
+        + 1
+        + len(target)
+        + 4
+        + len(payload)
+    )
+    return b"".join(
+        (
+            FRAME_LENGTH.pack(body_length),
+            MESSAGE_FIXED.pack(
+                WIRE_FORMAT_VERSION,
+                KIND_MESSAGE,
+                MESSAGE_TYPE_CODES[message.message_type],
+                message.priority,
+                message.timeout_seconds,
+                _timestamp_micros(message.timestamp),
+            ),
+            _U16.pack(len(message_id)),
+            message_id,
+            _U8.pack(len(source)),
+            source,
+            _U8.pack(len(target)),
+            target,
+            _U32.pack(len(payload)),
+            payload,
+        )
+    )
+
+
+def encode_vote(vote: ConsensusVote) -> bytes:
+    """
+    Encode a consensus vote as one frame.
+
+    Args:
+        vote: Vote to encode
+
+    Returns:
+        bytes: Canonical frame
+    """
+    vote_id = vote.vote_id.encode("utf-8")
+    message_id = vote.message_id.encode("utf-8")
+    voter = _chain_name(vote.voter_chain)
+    value = canonical_json(vote.vote_value)
+    signature = vote.signature.encode("utf-8") if vote.signature is not None else b""
+    flags = VOTE_HAS_SIGNATURE if vote.signature is not None else 0
+
+    body_length = (
+        VOTE_FIXED.size
+        + 2
+        + len(vote_id)
+        + 2
+        + len(message_id)
+        + 1
+        + len(voter)
+        + 4
+        + len(value)
+        + 2
+        + len(signature)
+    )
+    return b"".join(
+        (
+            FRAME_LENGTH.pack(body_length),
+            VOTE_FIXED.pack(
+                WIRE_FORMAT_VERSION,
+                KIND_VOTE,
+                vote.confidence_score,
+                vote.weight,
+                _timestamp_micros(vote.timestamp),
+                flags,
+            ),
+            _U16.pack(len(vote_id)),
+            vote_id,
+            _U16.pack(len(message_id)),
+            message_id,
+            _U8.pack(len(voter)),
+            voter,
+            _U32.pack(len(value)),
+            value,
+            _U16.pack(len(signature)),
+            signature,
+        )
+    )
+
+
+def encode_message_batch(messages: list[BridgeMessage]) -> bytes:
+    """
+    Encode several bridge messages as one batch frame.
+
+    Args:
+        messages: Messages to encode
+
+    Returns:
+        bytes: Batch frame holding one message frame per message
+    """
+    frames = [encode_message(message) for message in messages]
+    body_length = BATCH_FIXED.size + sum(len(frame) for frame in frames)
+    header = FRAME_LENGTH.pack(body_length) + BATCH_FIXED.pack(
+        WIRE_FORMAT_VERSION, KIND_BATCH, len(frames)
+    )
+    return b"".join([header, *frames])
+
+
+class MessageView:
+    """
+    Decoded bridge message backed by the received buffer.
+
+    Scalar fields are decoded eagerly; ``payload`` is a memoryview into
+    the buffer, parsed only when ``payload_value()`` is called.
+    """
+
+    __slots__ = (
+        "message_id",
+        "message_type",
+        "source_chain",
+        "target_chain",
+        "priority",
+        "timeout_seconds",
+        "timestamp_micros",
+        "payload",
+    )
+
+    def __init__(self, frame: memoryview):
+        body = _frame_body(frame, KIND_MESSAGE)
+        (
+            _,
+            _,
+            type_code,
+            self.priority,
+            self.timeout_seconds,
+            self.timestamp_micros,
+        ) = MESSAGE_FIXED.unpack_from(body)
+        try:
+            self.message_type = MESSAGE_TYPES_BY_CODE[type_code]
+        except KeyError:
+            raise WireFormatError(f"Unknown message type code {type_code}") from None
+
+        reader = _Reader(body, MESSAGE_FIXED.size)
+        self.message_id = reader.text(_U16)
+        self.source_chain = _chain_from_name(reader.field(_U8))
+        self.target_chain = _chain_from_name(reader.field(_U8))
+        self.payload = reader.field(_U32)
+        reader.finish()
+
+    @property
+    def timestamp(self) -> datetime:
+        """Message timestamp as a naive UTC datetime."""
+        return _EPOCH + timedelta(microseconds=self.timestamp_micros)
+
+    def payload_value(self) -> dict[str, Any]:
+        """Parse the payload JSON."""
+        return json.loads(self.payload.tobytes())
+
+    def to_message(self) -> BridgeMessage:
+        """Build a ``BridgeMessage``, parsing the payload."""
+        return BridgeMessage(
+            message_id=self.message_id,
+            message_type=self.message_type,
+            source_chain=self.source_chain,
+            target_chain=self.target_chain,
+            payload=self.payload_value(),
+            timestamp=self.timestamp,
+            timeout_seconds=self.timeout_seconds,
+            priority=self.priority,
+        )
+
+
+class VoteView:
+    """
+    Decoded consensus vote backed by the received buffer.
+
+    ``vote_value`` is a memoryview of canonical JSON, parsed only when
+    ``vote_value_parsed()`` is called.
+    """
+
+    __slots__ = (
+        "vote_id",
+        "message_id",
+        "voter_chain",
+        "confidence_score",
+        "weight",
+        "timestamp_micros",
+        "vote_value",
+        "signature",
+    )
+
+    def __init__(self, frame: memoryview):
+        body = _frame_body(frame, KIND_VOTE)
+        (
+            _,
+            _,
+            self.confidence_score,
+            self.weight,
+            self.timestamp_micros,
+            flags,
+        ) = VOTE_FIXED.unpack_from(body)
+
+        reader = _Reader(body, VOTE_FIXED.size)
+        self.vote_id = reader.text(_U16)
+        self.message_id = reader.text(_U16)
+        self.voter_chain = _chain_from_name(reader.field(_U8))
+        self.vote_value = reader.field(_U32)
+        signature = reader.text(_U16)
+        self.signature = signature if flags & VOTE_HAS_SIGNATURE else None
+        reader.finish()
+
+    @property
+    def timestamp(self) -> datetime:
+        """Vote timestamp as a naive UTC datetime."""
+        return _EPOCH + timedelta(microseconds=self.timestamp_micros)
+
+    def vote_value_parsed(self) -> Any:
+        """Parse the vote value JSON."""
+        return json.loads(self.vote_value.tobytes())
+
+    def to_vote(self) -> ConsensusVote:
+        """Build a ``ConsensusVote``, parsing the vote value."""
+        return ConsensusVote(
+            vote_id=self.vote_id,
+            message_id=self.message_id,
+            voter_chain=self.voter_chain,
+            vote_value=self.vote_value_parsed(),
+            confidence_score=self.confidence_score,
+            weight=self.weight,
+            timestamp=self.timestamp,
+            signature=self.signature,
+        )
+
+
+def decode_message(buffer: bytes | memoryview) -> MessageView:
+    """
+    Decode one message frame.
+
+    Args:
+        buffer: Frame, including its length prefix
+
+    Returns:
+        MessageView: View of the message
+    """
+    return MessageView(memoryview(buffer))
+
+
+def decode_vote(buffer: bytes | memoryview) -> VoteView:
+    """
+    Decode one vote frame.
+
+    Args:
+        buffer: Frame, including its length prefix
+
+    Returns:
+        VoteView: View of the vote
+    """
+    return VoteView(memoryview(buffer))
+
+
+def decode_message_batch(buffer: bytes | memoryview) -> list[MessageView]:
+    """
+    Decode a batch frame.
+
+    Args:
+        buffer: Batch frame, including its length prefix
+
+    Returns:
+        List[MessageView]: Views of the messages, in order
+    """
+    body = _frame_body(memoryview(buffer), KIND_BATCH)
+    _, _, count = BATCH_FIXED.unpack_from(body)
+    views = [MessageView(frame) for frame in iter_frames(body[BATCH_FIXED.size :])]
+    if len(views) != count:
+        raise WireFormatError(f"Batch declares {count} messages, found {len(views)}")
+    return views
+
+
+def iter_frames(buffer: bytes | memoryview) -> Iterator[memoryview]:
+    """
+    Split a stream of concatenated frames without copying.
+
+    Args:
+        buffer: Concatenated frames
+
+    Yields:
+        memoryview: Each frame, including its length prefix
+    """
+    view = memoryview(buffer)
+    offset = 0
+    while offset < len(view):
+        if offset + FRAME_LENGTH.size > len(view):
+            raise WireFormatError("Truncated frame length")
+        (length,) = FRAME_LENGTH.unpack_from(view, offset)
+        end = offset + FRAME_LENGTH.size + length
+        if end > len(view):
+            raise WireFormatError("Truncated frame body")
+        yield view[offset:end]
+        offset = end
+
+
+class _Reader:
+    """Reads length-prefixed fields from a frame body."""
+
+    __slots__ = ("body", "offset")
+
+    def __init__(self, body: memoryview, offset: int):
+        self.body = body
+        self.offset = offset
+
+    def field(self, length_format: struct.Struct) -> memoryview:
+        """Read one field whose length is encoded with ``length_format``."""
+        start = self.offset + length_format.size
+        if start > len(self.body):
+            raise WireFormatError("Truncated field length")
+        (length,) = length_format.unpack_from(self.body, self.offset)
+        end = start + length
+        if end > len(self.body):
+            raise WireFormatError("Truncated field")
+        self.offset = end
+        return self.body[start:end]
+
+    def text(self, length_format: struct.Struct) -> str:
+        """Read one length-prefixed UTF-8 field as a string."""
+        field = self.field(length_format)
+        try:
+            return str(field, "utf-8")
+        except UnicodeDecodeError as e:
+            raise WireFormatError(f"Invalid UTF-8 in field: {e.reason}") from None
+
+    def finish(self) -> None:
+        """Check that the whole body was read."""
+        if self.offset != len(self.body):
+            raise WireFormatError(f"{len(self.body) - self.offset} trailing bytes")
+
+
+def _frame_body(frame: memoryview, kind: int) -> memoryview:
+    """Check a frame's length, version and kind; return its body."""
+    if len(frame) < FRAME_LENGTH.size + BODY_HEADER.size:
+        raise WireFormatError("Truncated frame")
+    (length,) = FRAME_LENGTH.unpack_from(frame)
+    if length != len(frame) - FRAME_LENGTH.size:
+        raise WireFormatError(
+            f"Frame length {length} does not match {len(frame) - FRAME_LENGTH.size}"
+        )
+    body = frame[FRAME_LENGTH.size :]
+    version, frame_kind = BODY_HEADER.unpack_from(body)
+    if version != WIRE_FORMAT_VERSION:
+        raise WireFormatError(f"Unsupported wire format version {version}")
+    if frame_kind != kind:
+        raise WireFormatError(f"Expected frame kind {kind}, got {frame_kind}")
+    if len(body) < _FIXED_BY_KIND[kind].size:
+        raise WireFormatError(f"Truncated header for frame kind {kind}")
+    return body
+
+
+def _timestamp_micros(timestamp: datetime) -> int:
+    """Microseconds since the Unix epoch; naive datetimes are taken as UTC."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+def _chain_name(chain: ChainType) -> bytes:
+    """Encoded name of a chain."""
+    name = _CHAIN_NAMES.get(chain)
+    if name is None:
+        name = _CHAIN_NAMES[chain] = chain.value.encode("ascii")
+    return name
+
+
+def _chain_from_name(name: memoryview) -> ChainType:
+    """Chain for an encoded name."""
+    key = name.tobytes()
+    chain = _CHAINS_BY_NAME.get(key)
+    if chain is None:
+        try:
+            chain = ChainType(key.decode("ascii"))
+        except ValueError:
+            raise WireFormatError(f"Unknown chain {key!r}") from None
+        _CHAINS_BY_NAME[key] = chain
+    return chain